@@ -0,0 +1,132 @@
+import time
+import threading
+from collections import OrderedDict
+
+_missing = object()
+
+
+class LRUCache:
+    """A bounded, thread safe, in-memory cache which evicts the least
+    recently used items. Items can have an optional time to live::
+
+        cache = LRUCache(maxsize=128, ttl=300)
+        cache.set('a', 1)
+        cache.set('b', 2, ttl=60)
+        cache.get('a')
+
+    :param maxsize: maximum number of items to keep in the cache
+    :param ttl: default seconds to live of each item, ``None`` means
+        items never expire
+    """
+    def __init__(self, maxsize=128, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return self.get(key, _missing) is not _missing
+
+    def get(self, key, default=None):
+        """Get the cached value of the given key, return ``default`` if
+        the key is missing or expired.
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+
+            value, expires_at = item
+            if expires_at is not None and expires_at <= time.time():
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl=None):
+        """Cache the value of the given key.
+
+        :param key: cache key, it must be hashable
+        :param value: value to be cached
+        :param ttl: seconds to live of this item, defaults to ``self.ttl``
+        """
+        if ttl is None:
+            ttl = self.ttl
+        if ttl is not None:
+            expires_at = time.time() + ttl
+        else:
+            expires_at = None
+
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        """Remove the given key from the cache."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """Remove all items from the cache."""
+        with self._lock:
+            self._data.clear()
+
+
+class SingleFlight:
+    """Collapse concurrent calls of the same key into one call. When a
+    call with the key is in flight, other threads wait for it and share
+    its result (or its error), instead of calling again::
+
+        flight = SingleFlight()
+        rv = flight.do(url, fetch_url, url)
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, func, *args, **kwargs):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                is_leader = True
+            else:
+                is_leader = False
+
+        if not is_leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+
+class _Call:
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
@@ -8,7 +8,7 @@
 import re
 from urllib.parse import quote as _quote
 from urllib.parse import unquote as _unquote
-from urllib.parse import urlencode as _urlencode
+from urllib.parse import quote_plus as _quote_plus
 import urllib.parse as urlparse
 
 from .encoding import to_unicode, to_bytes
@@ -19,14 +19,54 @@ always_safe = (
     '0123456789_.-'
 )
 urlencoded = set(always_safe) | set('=&;:%+~,*@!()/?')
-INVALID_HEX_PATTERN = re.compile(r'%[^0-9A-Fa-f]|%[0-9A-Fa-f][^0-9A-Fa-f]')
+URLENCODED_PATTERN = re.compile(
+    r'[A-Za-z0-9_.\-=&;:+~,*@!()/?]*'
+    r'(?:%[0-9A-Fa-f]{2}[A-Za-z0-9_.\-=&;:+~,*@!()/?]*)*'
+    r'(?:%[0-9A-Fa-f]?)?')
+
+
+def _quote_form_value(x):
+    if not isinstance(x, (str, bytes)):
+        x = to_bytes(x)
+        if x is None:
+            x = 'None'
+    return _quote_plus(x, safe='')
 
 
 def url_encode(params):
-    encoded = []
-    for k, v in params:
-        encoded.append((to_bytes(k), to_bytes(v)))
-    return to_unicode(_urlencode(encoded))
+    return '&'.join([
+        _quote_form_value(k) + '=' + _quote_form_value(v)
+        for k, v in params
+    ])
+
+
+def _iter_decoded(query):
+    # Check if query is correctly encoded in one pass, all encoded values
+    # begin with % followed by two hex characters
+    # correct = %00, %A0, %0A, %FF
+    # invalid = %G0, %5H, %PO
+    if not URLENCODED_PATTERN.fullmatch(query):
+        if not set(query) <= urlencoded:
+            error = ("Error trying to decode a non urlencoded string. "
+                     "Found invalid characters: %s "
+                     "in the string: '%s'. "
+                     "Please ensure the request/response body is "
+                     "x-www-form-urlencoded.")
+            raise ValueError(error % (set(query) - urlencoded, query))
+        raise ValueError('Invalid hex encoding in query string.')
+
+    # The same as urlparse.parse_qsl(query, keep_blank_values=True),
+    # we want to allow queries such as "c2" whereas urlparse.parse_qsl
+    # with the strict_parsing flag will not.
+    for pair in query.split('&'):
+        if not pair:
+            continue
+        k, _, v = pair.partition('=')
+        if '+' in k or '%' in k:
+            k = _unquote(k.replace('+', ' '))
+        if '+' in v or '%' in v:
+            v = _unquote(v.replace('+', ' '))
+        yield k, v
 
 
 def url_decode(query):
@@ -38,46 +78,19 @@ def url_decode(query):
     a ValueError will be raised. urllib.parse_qsl will only raise errors if
     any of name-value pairs omits the equals sign.
     """
-    # Check if query contains invalid characters
-    if query and not set(query) <= urlencoded:
-        error = ("Error trying to decode a non urlencoded string. "
-                 "Found invalid characters: %s "
-                 "in the string: '%s'. "
-                 "Please ensure the request/response body is "
-                 "x-www-form-urlencoded.")
-        raise ValueError(error % (set(query) - urlencoded, query))
-
-    # Check for correctly hex encoded values using a regular expression
-    # All encoded values begin with % followed by two hex characters
-    # correct = %00, %A0, %0A, %FF
-    # invalid = %G0, %5H, %PO
-    if INVALID_HEX_PATTERN.search(query):
-        raise ValueError('Invalid hex encoding in query string.')
+    if not query:
+        return []
+    return list(_iter_decoded(to_unicode(query)))
 
-    # We encode to utf-8 prior to parsing because parse_qsl behaves
-    # differently on unicode input in python 2 and 3.
-    # Python 2.7
-    # >>> urlparse.parse_qsl(u'%E5%95%A6%E5%95%A6')
-    # u'\xe5\x95\xa6\xe5\x95\xa6'
-    # Python 2.7, non unicode input gives the same
-    # >>> urlparse.parse_qsl('%E5%95%A6%E5%95%A6')
-    # '\xe5\x95\xa6\xe5\x95\xa6'
-    # but now we can decode it to unicode
-    # >>> urlparse.parse_qsl('%E5%95%A6%E5%95%A6').decode('utf-8')
-    # u'\u5566\u5566'
-    # Python 3.3 however
-    # >>> urllib.parse.parse_qsl(u'%E5%95%A6%E5%95%A6')
-    # u'\u5566\u5566'
-
-    # We want to allow queries such as "c2" whereas urlparse.parse_qsl
-    # with the strict_parsing flag will not.
-    params = urlparse.parse_qsl(query, keep_blank_values=True)
 
-    # unicode all the things
-    decoded = []
-    for k, v in params:
-        decoded.append((to_unicode(k), to_unicode(v)))
-    return decoded
+def url_decode_dict(query):
+    """Decode a query string in x-www-form-urlencoded format into a dict,
+    the last value wins if a name is repeated. It is the same as
+    ``dict(url_decode(query))``, without the intermediate list.
+    """
+    if not query:
+        return {}
+    return dict(_iter_decoded(to_unicode(query)))
 
 
 def add_params_to_qs(query, params):
@@ -62,6 +62,15 @@ class AsyncOAuth1Mixin(OAuth1Base):
 
 
 class AsyncOAuth2Mixin(OAuth2Base):
+    async def aclose(self):
+        """Close the pooled connections of this app."""
+        with self._pool_lock:
+            pool = self._connection_pool
+            self._connection_pool = None
+            self._pool_created = False
+        if pool is not None:
+            await pool.aclose()
+
     async def _on_update_token(self, token, refresh_token=None, access_token=None):
         if self._update_token:
             await self._update_token(
@@ -72,7 +81,7 @@ class AsyncOAuth2Mixin(OAuth2Base):
 
     async def load_server_metadata(self):
         if self._server_metadata_url and '_loaded_at' not in self.server_metadata:
-            async with self.client_cls(**self.client_kwargs) as client:
+            async with self._create_session(**self.client_kwargs) as client:
                 resp = await client.request('GET', self._server_metadata_url, withhold_token=True)
                 resp.raise_for_status()
                 metadata = resp.json()
@@ -1,4 +1,5 @@
-from authlib.jose import JsonWebToken, JsonWebKey
+from anyio import Event
+from authlib.jose import JsonWebToken
 from authlib.oidc.core import UserInfo, CodeIDToken, ImplicitIDToken
 
 __all__ = ['AsyncOpenIDMixin']
@@ -15,14 +16,46 @@ class AsyncOpenIDMixin:
         if not uri:
             raise RuntimeError('Missing "jwks_uri" in metadata')
 
-        async with self.client_cls(**self.client_kwargs) as client:
+        async with self._create_session(**self.client_kwargs) as client:
             resp = await client.request('GET', uri, withhold_token=True)
             resp.raise_for_status()
             jwk_set = resp.json()
 
         self.server_metadata['jwks'] = jwk_set
+        self.jwks_cache.update(jwk_set, resp.headers)
         return jwk_set
 
+    async def load_key_set(self, force=False):
+        """Load the JWK set of the provider as a ``KeySet``. The imported
+        key set is cached in ``jwks_cache``, concurrent refreshes are
+        collapsed into one request to ``jwks_uri``.
+
+        :param force: refresh the cached key set, it is rate limited
+        :return: KeySet instance
+        """
+        cache = self.jwks_cache
+        if not cache.needs_refresh(force):
+            return cache.key_set
+
+        pending = cache.pending
+        if pending is not None:
+            await pending.wait()
+            if cache.key_set is None:
+                # the pending refresh failed
+                raise RuntimeError('Failed to load JWK set')
+            return cache.key_set
+
+        cache.pending = Event()
+        try:
+            if cache.key_set is None and not force:
+                cache.load(await self.fetch_jwk_set())
+            else:
+                await self.fetch_jwk_set(force=True)
+            return cache.key_set
+        finally:
+            cache.pending.set()
+            cache.pending = None
+
     async def userinfo(self, **kwargs):
         """Fetch user info from ``userinfo_endpoint``."""
         metadata = await self.load_server_metadata()
@@ -53,20 +86,20 @@ class AsyncOpenIDMixin:
 
         jwt = JsonWebToken(alg_values)
 
-        jwk_set = await self.fetch_jwk_set()
+        key_set = await self.load_key_set()
         try:
             claims = jwt.decode(
                 token['id_token'],
-                key=JsonWebKey.import_key_set(jwk_set),
+                key=key_set,
                 claims_cls=claims_cls,
                 claims_options=claims_options,
                 claims_params=claims_params,
             )
         except ValueError:
-            jwk_set = await self.fetch_jwk_set(force=True)
+            key_set = await self.load_key_set(force=True)
             claims = jwt.decode(
                 token['id_token'],
-                key=JsonWebKey.import_key_set(jwk_set),
+                key=key_set,
                 claims_cls=claims_cls,
                 claims_options=claims_options,
                 claims_params=claims_params,
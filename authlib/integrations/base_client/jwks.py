@@ -0,0 +1,94 @@
+import re
+import time
+from authlib.common.cache import SingleFlight
+from authlib.jose import JsonWebKey
+
+_max_age_re = re.compile(r'(?:^|[\s,])max-age\s*=\s*"?(\d+)"?', re.I)
+
+
+class JWKSCache:
+    """Cache of the imported JWK set of a provider. The lifetime of a
+    fetched JWK set is decided by the ``Cache-Control`` header of the
+    ``jwks_uri`` response. A forced refresh, e.g. when a token is signed
+    with an unknown ``kid``, is allowed only once in ``refresh_interval``
+    seconds, so that tokens with bad ``kid`` values will not turn into a
+    flood of requests to ``jwks_uri``.
+
+    :param default_ttl: seconds to live when there is no ``max-age``
+    :param min_ttl: the minimal seconds to live of a fetched JWK set
+    :param max_ttl: the maximal seconds to live of a fetched JWK set
+    :param refresh_interval: minimal seconds between forced refreshes
+    """
+    def __init__(self, default_ttl=3600, min_ttl=60, max_ttl=86400,
+                 refresh_interval=60):
+        self.default_ttl = default_ttl
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+        self.refresh_interval = refresh_interval
+
+        self.jwk_set = None
+        self.key_set = None
+        self.expires_at = None
+        self.fetched_at = None
+
+        # concurrent refreshes are collapsed into one request
+        self.flight = SingleFlight()
+        self.pending = None
+
+    def get_ttl(self, headers):
+        """Get the seconds to live of a JWK set from the response
+        headers of ``jwks_uri``.
+        """
+        value = headers.get('Cache-Control') if headers else None
+        if not isinstance(value, str):
+            return self.default_ttl
+
+        directives = value.lower()
+        if 'no-cache' in directives or 'no-store' in directives:
+            return self.min_ttl
+
+        m = _max_age_re.search(value)
+        if not m:
+            return self.default_ttl
+        return min(max(int(m.group(1)), self.min_ttl), self.max_ttl)
+
+    def needs_refresh(self, force=False):
+        """Check if the cached JWK set should be reloaded. A forced
+        refresh is rate limited by ``refresh_interval``.
+        """
+        if self.key_set is None:
+            return True
+
+        now = time.time()
+        if force:
+            if self.fetched_at is None:
+                return True
+            return now - self.fetched_at >= self.refresh_interval
+        return self.expires_at is not None and self.expires_at <= now
+
+    def load(self, jwk_set):
+        """Cache a JWK set defined in server metadata. It never expires,
+        it is only replaced by a forced refresh from ``jwks_uri``.
+        """
+        if jwk_set is not self.jwk_set:
+            self.key_set = JsonWebKey.import_key_set(jwk_set)
+            self.jwk_set = jwk_set
+            self.expires_at = None
+
+    def update(self, jwk_set, headers=None):
+        """Cache a JWK set fetched from ``jwks_uri``.
+
+        :param jwk_set: JWK set dict in the response
+        :param headers: headers of the response
+        """
+        now = time.time()
+        self.key_set = JsonWebKey.import_key_set(jwk_set)
+        self.jwk_set = jwk_set
+        self.fetched_at = now
+        self.expires_at = now + self.get_ttl(headers)
+
+    def clear(self):
+        self.jwk_set = None
+        self.key_set = None
+        self.expires_at = None
+        self.fetched_at = None
@@ -1,8 +1,10 @@
 import time
 import logging
+import threading
 from authlib.common.urls import urlparse
 from authlib.consts import default_user_agent
 from authlib.common.security import generate_token
+from .jwks import JWKSCache
 from .errors import (
     MismatchingStateError,
     MissingRequestTokenError,
@@ -198,6 +200,11 @@ class OAuth2Base:
 
         self._server_metadata_url = server_metadata_url
         self.server_metadata = kwargs
+        self.jwks_cache = JWKSCache()
+
+        self._connection_pool = None
+        self._pool_created = False
+        self._pool_lock = threading.Lock()
 
     def _on_update_token(self, token, refresh_token=None, access_token=None):
         raise NotImplementedError()
@@ -212,7 +219,7 @@ class OAuth2Base:
         if self.access_token_url:
             client_kwargs['token_endpoint'] = self.access_token_url
 
-        session = self.client_cls(
+        session = self._create_session(
             client_id=self.client_id,
             client_secret=self.client_secret,
             update_token=self._on_update_token,
@@ -228,6 +235,27 @@ class OAuth2Base:
         session.headers['User-Agent'] = self._user_agent
         return session
 
+    def _create_session(self, **kwargs):
+        # sessions are created for each call, they share the pooled
+        # connections of this app
+        pool = self._get_connection_pool()
+        if pool is not None:
+            kwargs = pool.prepare_kwargs(kwargs)
+        session = self.client_cls(**kwargs)
+        if pool is not None:
+            pool.mount(session)
+        return session
+
+    def _get_connection_pool(self):
+        # created once, the sessions of each call share its connections
+        if not self._pool_created:
+            with self._pool_lock:
+                if not self._pool_created:
+                    self._connection_pool = _create_connection_pool(
+                        self.client_cls, self.client_kwargs)
+                    self._pool_created = True
+        return self._connection_pool
+
     @staticmethod
     def _format_state_params(state_data, params):
         if state_data is None:
@@ -275,6 +303,15 @@ class OAuth2Base:
 
 
 class OAuth2Mixin(_RequestMixin, OAuth2Base):
+    def close(self):
+        """Close the pooled connections of this app."""
+        with self._pool_lock:
+            pool = self._connection_pool
+            self._connection_pool = None
+            self._pool_created = False
+        if pool is not None:
+            pool.close()
+
     def _on_update_token(self, token, refresh_token=None, access_token=None):
         if callable(self._update_token):
             self._update_token(
@@ -295,7 +332,7 @@ class OAuth2Mixin(_RequestMixin, OAuth2Base):
 
     def load_server_metadata(self):
         if self._server_metadata_url and '_loaded_at' not in self.server_metadata:
-            with self.client_cls(**self.client_kwargs) as session:
+            with self._create_session(**self.client_kwargs) as session:
                 resp = session.request('GET', self._server_metadata_url, withhold_token=True)
                 resp.raise_for_status()
                 metadata = resp.json()
@@ -346,3 +383,20 @@ class OAuth2Mixin(_RequestMixin, OAuth2Base):
             params.update(kwargs)
             token = client.fetch_token(token_endpoint, **params)
             return token
+
+
+def _create_connection_pool(client_cls, client_kwargs):
+    try:
+        from ..httpx_client.utils import create_connection_pool
+    except ImportError:
+        pass
+    else:
+        pool = create_connection_pool(client_cls, client_kwargs)
+        if pool is not None:
+            return pool
+
+    try:
+        from ..requests_client.utils import create_connection_pool
+    except ImportError:
+        return None
+    return create_connection_pool(client_cls, client_kwargs)
@@ -1,4 +1,4 @@
-from authlib.jose import jwt, JsonWebToken, JsonWebKey
+from authlib.jose import jwt, JsonWebToken
 from authlib.oidc.core import UserInfo, CodeIDToken, ImplicitIDToken
 
 
@@ -13,14 +13,40 @@ class OpenIDMixin:
         if not uri:
             raise RuntimeError('Missing "jwks_uri" in metadata')
 
-        with self.client_cls(**self.client_kwargs) as session:
+        with self._create_session(**self.client_kwargs) as session:
             resp = session.request('GET', uri, withhold_token=True)
             resp.raise_for_status()
             jwk_set = resp.json()
 
         self.server_metadata['jwks'] = jwk_set
+        self.jwks_cache.update(jwk_set, resp.headers)
         return jwk_set
 
+    def load_key_set(self, force=False):
+        """Load the JWK set of the provider as a ``KeySet``. The imported
+        key set is cached in ``jwks_cache``, concurrent refreshes are
+        collapsed into one request to ``jwks_uri``.
+
+        :param force: refresh the cached key set, it is rate limited
+        :return: KeySet instance
+        """
+        cache = self.jwks_cache
+        if not cache.needs_refresh(force):
+            return cache.key_set
+        return cache.flight.do('jwks', self._refresh_key_set, force)
+
+    def _refresh_key_set(self, force):
+        cache = self.jwks_cache
+        # another thread may have refreshed it after the check in
+        # load_key_set and before this flight started
+        if not cache.needs_refresh(force):
+            return cache.key_set
+        if cache.key_set is None and not force:
+            cache.load(self.fetch_jwk_set())
+        else:
+            self.fetch_jwk_set(force=True)
+        return cache.key_set
+
     def userinfo(self, **kwargs):
         """Fetch user info from ``userinfo_endpoint``."""
         metadata = self.load_server_metadata()
@@ -71,12 +97,11 @@ class OpenIDMixin:
 
     def create_load_key(self):
         def load_key(header, _):
-            jwk_set = JsonWebKey.import_key_set(self.fetch_jwk_set())
+            kid = header.get('kid')
             try:
-                return jwk_set.find_by_kid(header.get('kid'))
+                return self.load_key_set().find_by_kid(kid)
             except ValueError:
                 # re-try with new jwk set
-                jwk_set = JsonWebKey.import_key_set(self.fetch_jwk_set(force=True))
-                return jwk_set.find_by_kid(header.get('kid'))
+                return self.load_key_set(force=True).find_by_kid(kid)
 
         return load_key
@@ -1,15 +1,8 @@
 from django.core.cache import cache
+from authlib.oauth1 import CacheNonceStore
 
 
 def exists_nonce_in_cache(nonce, request, timeout):
-    key_prefix = 'nonce:'
-    timestamp = request.timestamp
-    client_id = request.client_id
-    token = request.token
-    key = f'{key_prefix}{nonce}-{timestamp}-{client_id}'
-    if token:
-        key = f'{key}-{token}'
-
-    rv = bool(cache.get(key))
-    cache.set(key, 1, timeout=timeout)
-    return rv
+    store = CacheNonceStore(cache, expires_in=timeout)
+    return store.exists_nonce(
+        nonce, request.timestamp, request.client_id, request.token)
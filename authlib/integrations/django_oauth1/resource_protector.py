@@ -16,7 +16,7 @@ class ResourceProtector(_ResourceProtector):
         if methods and isinstance(methods, (list, tuple)):
             self.SUPPORTED_SIGNATURE_METHODS = methods
 
-        self._nonce_expires_in = config.get('nonce_expires_in', 86400)
+        self._nonce_expires_in = config.get('nonce_expires_in', self.EXPIRY_TIME or 86400)
 
     def get_client_by_id(self, client_id):
         try:
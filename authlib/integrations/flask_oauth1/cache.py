@@ -1,4 +1,4 @@
-from authlib.oauth1 import TemporaryCredential
+from authlib.oauth1 import TemporaryCredential, NonceStore, CacheNonceStore
 
 
 def register_temporary_credential_hooks(
@@ -53,28 +53,29 @@ def create_exists_nonce_func(cache, key_prefix='nonce:', expires=86400):
     """Create an ``exists_nonce`` function that can be used in hooks and
     resource protector.
 
-    :param cache: Cache instance
+    :param cache: Cache instance, or a
+        :class:`~authlib.oauth1.NonceStore` instance
     :param key_prefix: key prefix for temporary credential
     :param expires: Expire time for nonce
     """
-    def exists_nonce(nonce, timestamp, client_id, oauth_token):
-        key = f'{key_prefix}{nonce}-{timestamp}-{client_id}'
-        if oauth_token:
-            key = f'{key}-{oauth_token}'
-        rv = cache.has(key)
-        cache.set(key, 1, timeout=expires)
-        return rv
-    return exists_nonce
+    if isinstance(cache, NonceStore):
+        return cache.exists_nonce
+    store = CacheNonceStore(cache, key_prefix, expires)
+    return store.exists_nonce
 
 
 def register_nonce_hooks(
-        authorization_server, cache, key_prefix='nonce:', expires=86400):
+        authorization_server, cache, key_prefix='nonce:', expires=None):
     """Register nonce related hooks to authorization server.
 
     :param authorization_server: AuthorizationServer instance
-    :param cache: Cache instance
+    :param cache: Cache instance, or a
+        :class:`~authlib.oauth1.NonceStore` instance
     :param key_prefix: key prefix for temporary credential
-    :param expires: Expire time for nonce
+    :param expires: Expire time for nonce, defaults to the ``EXPIRY_TIME``
+        of the authorization server
     """
+    if expires is None:
+        expires = authorization_server.EXPIRY_TIME or 86400
     exists_nonce = create_exists_nonce_func(cache, key_prefix, expires)
     authorization_server.register_hook('exists_nonce', exists_nonce)
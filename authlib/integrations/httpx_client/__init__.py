@@ -12,6 +12,7 @@ from .oauth2_client import (
     AsyncOAuth2Client,
 )
 from .assertion_client import AssertionClient, AsyncAssertionClient
+from .token_validator import AsyncRemoteIntrospectTokenValidator
 from ..base_client import OAuthError
 
 
@@ -22,4 +23,5 @@ __all__ = [
     'SIGNATURE_TYPE_HEADER', 'SIGNATURE_TYPE_QUERY', 'SIGNATURE_TYPE_BODY',
     'OAuth2Auth', 'OAuth2ClientAuth', 'OAuth2Client', 'AsyncOAuth2Client',
     'AssertionClient', 'AsyncAssertionClient',
+    'AsyncRemoteIntrospectTokenValidator',
 ]
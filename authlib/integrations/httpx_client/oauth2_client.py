@@ -3,8 +3,8 @@ from contextlib import asynccontextmanager
 
 import httpx
 from httpx import Auth, Request, Response, USE_CLIENT_DEFAULT
-from anyio import Lock  # Import after httpx so import errors refer to httpx
-from authlib.common.urls import url_decode
+from anyio import Lock, to_thread  # Import after httpx so import errors refer to httpx
+from authlib.common.urls import url_decode_dict
 from authlib.oauth2.client import OAuth2Client as _OAuth2Client
 from authlib.oauth2.auth import ClientAuth, TokenAuth
 from .utils import HTTPX_CLIENT_KWARGS, build_request
@@ -123,7 +123,7 @@ class AsyncOAuth2Client(_OAuth2Client, httpx.AsyncClient):
                            method='POST', **kwargs):
         if method.upper() == 'POST':
             resp = await self.post(
-                url, data=dict(url_decode(body)), headers=headers,
+                url, data=url_decode_dict(body), headers=headers,
                 auth=auth, **kwargs)
         else:
             if '?' in url:
@@ -137,10 +137,35 @@ class AsyncOAuth2Client(_OAuth2Client, httpx.AsyncClient):
 
         return self.parse_response_token(resp)
 
+    async def _fetch_shared_token(self, url, body='', **kwargs):
+        # file and cache IO of the store must not block the event loop
+        store = self.token_store
+        key = self._get_token_store_key(url, body)
+        token = await self._aload_shared_token(key)
+        if token is not None:
+            return token
+
+        lock = await to_thread.run_sync(store.acquire_lock, key)
+        try:
+            token = await self._aload_shared_token(key)
+            if token is not None:
+                return token
+            token = await self._fetch_token(url, body=body, **kwargs)
+            if token.get('expires_at'):
+                await to_thread.run_sync(store.save_token, key, token)
+            return token
+        finally:
+            if lock is not None:
+                await to_thread.run_sync(store.release_lock, lock)
+
+    async def _aload_shared_token(self, key):
+        token = await to_thread.run_sync(self.token_store.get_token, key)
+        return self._use_shared_token(token)
+
     async def _refresh_token(self, url, refresh_token=None, body='',
                              headers=None, auth=USE_CLIENT_DEFAULT, **kwargs):
         resp = await self.post(
-            url, data=dict(url_decode(body)), headers=headers,
+            url, data=url_decode_dict(body), headers=headers,
             auth=auth, **kwargs)
 
         for hook in self.compliance_hook['refresh_token_response']:
@@ -157,7 +182,7 @@ class AsyncOAuth2Client(_OAuth2Client, httpx.AsyncClient):
 
     def _http_post(self, url, body=None, auth=USE_CLIENT_DEFAULT, headers=None, **kwargs):
         return self.post(
-            url, data=dict(url_decode(body)),
+            url, data=url_decode_dict(body),
             headers=headers, auth=auth, **kwargs)
 
 
@@ -0,0 +1,77 @@
+from anyio import Event
+from authlib.oauth2.rfc7662 import RemoteIntrospectTokenValidator
+
+__all__ = ['AsyncRemoteIntrospectTokenValidator']
+
+
+class AsyncRemoteIntrospectTokenValidator(RemoteIntrospectTokenValidator):
+    """The async version of
+    :class:`~authlib.oauth2.rfc7662.RemoteIntrospectTokenValidator`,
+    introspect tokens with an :class:`AsyncOAuth2Client`::
+
+        client = AsyncOAuth2Client(client_id, client_secret)
+        validator = AsyncRemoteIntrospectTokenValidator(
+            client, 'https://example.com/oauth/introspect')
+
+        token = await validator.authenticate_cached_token(token_string)
+        validator.validate_token(token, scopes, request)
+    """
+    def __init__(self, client, introspection_endpoint, realm=None,
+                 cache_size=1024, cache_ttl=300, **extra_attributes):
+        super().__init__(
+            client, introspection_endpoint, realm=realm,
+            cache_size=cache_size, cache_ttl=cache_ttl,
+            **extra_attributes)
+        self._pending_tokens = {}
+
+    async def introspect_token(self, token_string):
+        resp = await self.client.introspect_token(
+            self.introspection_endpoint,
+            token=token_string,
+            token_type_hint='access_token',
+        )
+        resp.raise_for_status()
+        return resp.json()
+
+    async def authenticate_token(self, token_string):
+        return await self.introspect_token(token_string)
+
+    async def authenticate_cached_token(self, token_string):
+        if self.token_cache is None:
+            return await self.authenticate_token(token_string)
+
+        token = self.get_cached_token(token_string)
+        if token is not None:
+            return token
+
+        # concurrent requests of the same token wait for the pending one
+        pending = self._pending_tokens.get(token_string)
+        if pending is not None:
+            await pending.event.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.result
+
+        pending = _PendingToken()
+        self._pending_tokens[token_string] = pending
+        try:
+            token = await self.authenticate_token(token_string)
+            if token:
+                self.cache_token(token_string, token)
+            pending.result = token
+            return token
+        except BaseException as error:
+            pending.error = error
+            raise
+        finally:
+            del self._pending_tokens[token_string]
+            pending.event.set()
+
+
+class _PendingToken:
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = Event()
+        self.result = None
+        self.error = None
@@ -1,4 +1,7 @@
-from httpx import Request
+from httpx import (
+    AsyncBaseTransport, AsyncClient, AsyncHTTPTransport,
+    BaseTransport, Client, HTTPTransport, Request,
+)
 
 HTTPX_CLIENT_KWARGS = [
     'headers', 'cookies', 'verify', 'cert', 'http1', 'http2',
@@ -28,3 +31,66 @@ def build_request(url, headers, body, initial_request: Request) -> Request:
         updated_request.extensions = initial_request.extensions
 
     return updated_request
+
+
+HTTPX_TRANSPORT_KWARGS = ['verify', 'cert', 'http1', 'http2', 'limits', 'trust_env']
+
+
+class _SharedTransport(BaseTransport):
+    # closing a client must not close the shared pool
+    def __init__(self, transport):
+        self.transport = transport
+
+    def handle_request(self, request):
+        return self.transport.handle_request(request)
+
+    def close(self):
+        pass
+
+
+class _AsyncSharedTransport(AsyncBaseTransport):
+    def __init__(self, transport):
+        self.transport = transport
+
+    async def handle_async_request(self, request):
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self):
+        pass
+
+
+class ConnectionPool:
+    """A connection pool shared by many clients. Its transport is passed
+    to each client, closing a client does not close the pool.
+    """
+    def __init__(self, client_kwargs, is_async=False):
+        kwargs = {k: client_kwargs[k] for k in HTTPX_TRANSPORT_KWARGS if k in client_kwargs}
+        if is_async:
+            self.transport = AsyncHTTPTransport(**kwargs)
+            self._shared = _AsyncSharedTransport(self.transport)
+        else:
+            self.transport = HTTPTransport(**kwargs)
+            self._shared = _SharedTransport(self.transport)
+
+    def prepare_kwargs(self, kwargs):
+        kwargs['transport'] = self._shared
+        return kwargs
+
+    def mount(self, client):
+        pass
+
+    def close(self):
+        self.transport.close()
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+def create_connection_pool(client_cls, client_kwargs):
+    # a custom transport or app is managed by the developer
+    if 'transport' in client_kwargs or 'app' in client_kwargs:
+        return None
+    if issubclass(client_cls, AsyncClient):
+        return ConnectionPool(client_kwargs, is_async=True)
+    if issubclass(client_cls, Client):
+        return ConnectionPool(client_kwargs)
@@ -1,3 +1,6 @@
+from requests import Session
+from requests.adapters import BaseAdapter, HTTPAdapter
+
 REQUESTS_SESSION_KWARGS = [
     'proxies', 'hooks', 'stream', 'verify', 'cert',
     'max_redirects', 'trust_env',
@@ -8,3 +11,40 @@ def update_session_configure(session, kwargs):
     for k in REQUESTS_SESSION_KWARGS:
         if k in kwargs:
             setattr(session, k, kwargs.pop(k))
+
+
+class _SharedAdapter(BaseAdapter):
+    # closing a session must not close the shared pool
+    def __init__(self, adapter):
+        super().__init__()
+        self.adapter = adapter
+
+    def send(self, request, **kwargs):
+        return self.adapter.send(request, **kwargs)
+
+    def close(self):
+        pass
+
+
+class ConnectionPool:
+    """A connection pool shared by many sessions. It is mounted into each
+    session, closing a session does not close the pool.
+    """
+    def __init__(self):
+        self.adapter = HTTPAdapter()
+        self._shared = _SharedAdapter(self.adapter)
+
+    def prepare_kwargs(self, kwargs):
+        return kwargs
+
+    def mount(self, session):
+        session.mount('https://', self._shared)
+        session.mount('http://', self._shared)
+
+    def close(self):
+        self.adapter.close()
+
+
+def create_connection_pool(client_cls, client_kwargs):
+    if issubclass(client_cls, Session):
+        return ConnectionPool()
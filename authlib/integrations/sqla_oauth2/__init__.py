@@ -6,12 +6,15 @@ from .functions import (
     create_query_token_func,
     create_revocation_endpoint,
     create_bearer_token_validator,
+    discard_cached_token,
 )
+from .token_writer import TokenBatchWriter
 
 
 __all__ = [
     'OAuth2ClientMixin', 'OAuth2AuthorizationCodeMixin', 'OAuth2TokenMixin',
     'create_query_client_func', 'create_save_token_func',
     'create_query_token_func', 'create_revocation_endpoint',
-    'create_bearer_token_validator',
+    'create_bearer_token_validator', 'discard_cached_token',
+    'TokenBatchWriter',
 ]
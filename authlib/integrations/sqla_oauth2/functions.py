@@ -1,25 +1,42 @@
 import time
+from sqlalchemy import case, inspect, or_
+from sqlalchemy.orm import make_transient_to_detached
 
 
-def create_query_client_func(session, client_model):
+def create_query_client_func(session, client_model, cache=None):
     """Create an ``query_client`` function that can be used in authorization
     server.
 
     :param session: SQLAlchemy session
     :param client_model: Client model class
+    :param cache: an optional :class:`~authlib.common.cache.LRUCache` to
+        cache clients in memory
     """
+    model_cache = _ModelCache(session, client_model, cache)
+
     def query_client(client_id):
+        key = ('client', client_id)
+        client = model_cache.get(key)
+        if client is not None:
+            return client
+
         q = session.query(client_model)
-        return q.filter_by(client_id=client_id).first()
+        client = q.filter_by(client_id=client_id).first()
+        if client is not None:
+            model_cache.set(key, client)
+        return client
     return query_client
 
 
-def create_save_token_func(session, token_model):
+def create_save_token_func(session, token_model, writer=None):
     """Create an ``save_token`` function that can be used in authorization
     server.
 
     :param session: SQLAlchemy session
     :param token_model: Token model class
+    :param writer: an optional
+        :class:`~authlib.integrations.sqla_oauth2.TokenBatchWriter` to write
+        tokens in batches
     """
     def save_token(token, request):
         if request.user:
@@ -27,6 +44,10 @@ def create_save_token_func(session, token_model):
         else:
             user_id = None
         client = request.client
+        if writer is not None and request.grant_type in writer.grant_types:
+            writer.add(dict(client_id=client.client_id, user_id=user_id, **token))
+            return
+
         item = token_model(
             client_id=client.client_id,
             user_id=user_id,
@@ -37,36 +58,59 @@ def create_save_token_func(session, token_model):
     return save_token
 
 
-def create_query_token_func(session, token_model):
+def create_query_token_func(session, token_model, cache=None):
     """Create an ``query_token`` function for revocation, introspection
     token endpoints.
 
     :param session: SQLAlchemy session
     :param token_model: Token model class
+    :param cache: an optional :class:`~authlib.common.cache.LRUCache` to
+        cache tokens in memory, share it with
+        :func:`create_revocation_endpoint` to discard revoked tokens
     """
+    model_cache = _ModelCache(session, token_model, cache)
+
     def query_token(token, token_type_hint):
+        if token_type_hint not in ('access_token', 'refresh_token'):
+            token_type_hint = None
+
+        key = (token_type_hint or 'token', token)
+        item = model_cache.get(key)
+        if item is not None:
+            return item
+
         q = session.query(token_model)
         if token_type_hint == 'access_token':
-            return q.filter_by(access_token=token).first()
+            item = q.filter_by(access_token=token).first()
         elif token_type_hint == 'refresh_token':
-            return q.filter_by(refresh_token=token).first()
-        # without token_type_hint
-        item = q.filter_by(access_token=token).first()
-        if item:
-            return item
-        return q.filter_by(refresh_token=token).first()
+            item = q.filter_by(refresh_token=token).first()
+        else:
+            # without token_type_hint, find it in one query, and prefer
+            # the token whose access_token matches
+            is_access_token = token_model.access_token == token
+            item = q.filter(or_(
+                is_access_token,
+                token_model.refresh_token == token,
+            )).order_by(case((is_access_token, 0), else_=1)).first()
+
+        if item is not None:
+            model_cache.set(key, item)
+        return item
     return query_token
 
 
-def create_revocation_endpoint(session, token_model):
+def create_revocation_endpoint(session, token_model, cache=None):
     """Create a revocation endpoint class with SQLAlchemy session
     and token model.
 
     :param session: SQLAlchemy session
     :param token_model: Token model class
+    :param cache: the token cache shared with :func:`create_query_token_func`
+        and :func:`create_bearer_token_validator`, revoked tokens are
+        removed from it
     """
     from authlib.oauth2.rfc7009 import RevocationEndpoint
-    query_token = create_query_token_func(session, token_model)
+    query_token = create_query_token_func(session, token_model, cache)
 
     class _RevocationEndpoint(RevocationEndpoint):
         def query_token(self, token, token_type_hint):
@@ -80,22 +124,99 @@ def create_revocation_endpoint(session, token_model):
                 token.refresh_token_revoked_at = now
             session.add(token)
             session.commit()
+            if cache is not None:
+                discard_cached_token(cache, token)
 
     return _RevocationEndpoint
 
 
-def create_bearer_token_validator(session, token_model):
+def create_bearer_token_validator(session, token_model, cache=None):
     """Create an bearer token validator class with SQLAlchemy session
     and token model.
 
     :param session: SQLAlchemy session
     :param token_model: Token model class
+    :param cache: an optional :class:`~authlib.common.cache.LRUCache` to
+        cache tokens in memory, share it with
+        :func:`create_revocation_endpoint` to discard revoked tokens
     """
     from authlib.oauth2.rfc6750 import BearerTokenValidator
+    model_cache = _ModelCache(session, token_model, cache)
 
     class _BearerTokenValidator(BearerTokenValidator):
         def authenticate_token(self, token_string):
+            key = ('access_token', token_string)
+            item = model_cache.get(key)
+            if item is not None:
+                return item
+
             q = session.query(token_model)
-            return q.filter_by(access_token=token_string).first()
+            item = q.filter_by(access_token=token_string).first()
+            if item is not None:
+                model_cache.set(key, item)
+            return item
 
     return _BearerTokenValidator
+
+
+def discard_cached_token(cache, token):
+    """Remove a token from the cache shared with
+    :func:`create_query_token_func` and :func:`create_bearer_token_validator`.
+    Call it wherever a token is revoked outside of the revocation endpoint,
+    e.g. in ``RefreshTokenGrant.revoke_old_credential``.
+
+    :param cache: the shared :class:`~authlib.common.cache.LRUCache`
+    :param token: the revoked token model instance
+    """
+    for value in (token.access_token, token.refresh_token):
+        if value:
+            cache.delete(('token', value))
+    if token.access_token:
+        cache.delete(('access_token', token.access_token))
+    if token.refresh_token:
+        cache.delete(('refresh_token', token.refresh_token))
+
+
+class _ModelCache:
+    """Cache column values of model instances. A cached instance is merged
+    into the session without loading it from database, so it can be used
+    like a queried one.
+    """
+    def __init__(self, session, model, cache):
+        self.session = session
+        self.model = model
+        self.cache = cache
+
+    def get(self, key):
+        if self.cache is None:
+            return None
+        data = self.cache.get(key)
+        if data is None:
+            return None
+
+        mapper = inspect(self.model)
+        instance = mapper.class_manager.new_instance()
+        for attr, value in data.items():
+            setattr(instance, attr, value)
+        make_transient_to_detached(instance)
+        return self.session.merge(instance, load=False)
+
+    def set(self, key, instance):
+        if self.cache is None:
+            return
+
+        state = inspect(instance)
+        if state.expired_attributes:
+            return
+
+        data = {attr.key: state.dict[attr.key] for attr in state.mapper.column_attrs
+                if attr.key in state.dict}
+        ttl = None
+        if hasattr(instance, 'get_expires_in') and getattr(instance, 'issued_at', None):
+            # never keep a token after it is expired
+            expires_in = instance.issued_at + instance.get_expires_in() - time.time()
+            if expires_in <= 0:
+                return
+            if self.cache.ttl is None or expires_in < self.cache.ttl:
+                ttl = expires_in
+        self.cache.set(key, data, ttl)
@@ -0,0 +1,209 @@
+import time
+import atexit
+import logging
+import threading
+
+log = logging.getLogger(__name__)
+
+
+class TokenBatchWriter:
+    """Write-behind persistence of issued tokens. Tokens are queued and
+    inserted by a background thread in one transaction, when ``max_size``
+    tokens are queued or ``interval`` seconds passed::
+
+        from sqlalchemy.orm import sessionmaker
+
+        writer = TokenBatchWriter(sessionmaker(engine), Token)
+        save_token = create_save_token_func(db.session, Token, writer)
+
+    A client may use a queued token before it is written, only tokens of
+    ``grant_types`` are written behind, tokens of other grant types are
+    saved before the response. Call :meth:`flush` to write all queued
+    tokens at once, and :meth:`close` on shutdown.
+
+    If a batch fails to be written, its tokens are put back into the
+    queue and retried after ``retry_interval`` seconds. A token which
+    failed ``max_retries`` times is written in a transaction of its own,
+    so that one bad token does not block the others. If it still fails,
+    ``on_error(values, error)`` is called with it, or the error is logged.
+    When ``max_queue_size`` tokens are waiting, a new token is written
+    in the calling thread instead of being queued.
+
+    :param session_factory: a callable which creates a new SQLAlchemy
+        session, e.g. a ``sessionmaker``
+    :param token_model: Token model class
+    :param max_size: flush when this number of tokens are queued
+    :param interval: seconds to wait before flushing queued tokens
+    :param grant_types: grant types whose tokens are written behind
+    :param max_queue_size: maximum number of tokens waiting to be written
+    :param max_retries: times to write a token in a batch before it is
+        written on its own
+    :param retry_interval: seconds to wait before retrying a failed batch
+    :param on_error: a callable to receive the tokens which can not be
+        written
+    """
+    def __init__(self, session_factory, token_model, max_size=100,
+                 interval=0.05, grant_types=('client_credentials',),
+                 max_queue_size=10000, max_retries=3, retry_interval=1,
+                 on_error=None):
+        self.session_factory = session_factory
+        self.token_model = token_model
+        self.max_size = max_size
+        self.interval = interval
+        self.grant_types = grant_types
+        self.max_queue_size = max_queue_size
+        self.max_retries = max_retries
+        self.retry_interval = retry_interval
+        self.on_error = on_error
+
+        #: count of flushes
+        self.flushes = 0
+        #: count of written tokens
+        self.written = 0
+        #: count of tokens which can not be written
+        self.failed = 0
+        #: seconds taken by the last flush
+        self.last_flush_time = None
+        #: total seconds taken by flushes
+        self.total_flush_time = 0.0
+
+        self._has_issued_at = hasattr(token_model, 'issued_at')
+        # items are [values, failed attempts]
+        self._queue = []
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+
+    @property
+    def queue_depth(self):
+        """Number of tokens waiting to be written."""
+        return len(self._queue)
+
+    def add(self, values):
+        """Queue a token to be written. ``issued_at`` is set to the
+        current time if the token model has it, so that the token does
+        not live longer than it was issued for.
+
+        :param values: dict of token model attributes
+        """
+        if self._has_issued_at and 'issued_at' not in values:
+            values = dict(values, issued_at=int(time.time()))
+
+        with self._cond:
+            if self._closed:
+                raise RuntimeError('TokenBatchWriter is closed')
+            full = len(self._queue) >= self.max_queue_size
+            if not full:
+                self._queue.append([values, 0])
+                if self._thread is None:
+                    self._start()
+            if len(self._queue) >= self.max_size:
+                self._cond.notify()
+
+        if full:
+            self._write([values])
+
+    def flush(self):
+        """Write all queued tokens in the current thread."""
+        with self._cond:
+            items = self._queue
+            self._queue = []
+        error = self._process(items)
+        if error is not None:
+            raise error
+
+    def close(self):
+        """Stop the background thread and write the queued tokens."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None:
+            atexit.unregister(self.close)
+            thread.join()
+        self.flush()
+
+    def _start(self):
+        self._thread = threading.Thread(
+            target=self._run, name='authlib-token-writer', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._queue and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                if len(self._queue) < self.max_size:
+                    # give the other tokens of this burst a chance to join
+                    self._cond.wait(self.interval)
+                items = self._queue
+                self._queue = []
+            error = self._process(items)
+            if error is not None:
+                log.error('Failed to write %d tokens: %r', len(items), error)
+                with self._cond:
+                    if not self._closed:
+                        # retry later, not in a busy loop
+                        self._cond.wait(self.retry_interval)
+
+    def _process(self, items):
+        """Write a batch of queued items. Return the error if some items
+        are put back into the queue to be retried.
+        """
+        try:
+            self._write([values for values, _ in items])
+            return None
+        except Exception as error:
+            retry = []
+            exhausted = []
+            for item in items:
+                item[1] += 1
+                if item[1] < self.max_retries:
+                    retry.append(item)
+                else:
+                    exhausted.append(item[0])
+
+            for values in exhausted:
+                try:
+                    self._write([values])
+                except Exception as e:
+                    self._handle_error(values, e)
+
+            if retry:
+                with self._cond:
+                    self._queue[:0] = retry
+                return error
+            return None
+
+    def _handle_error(self, values, error):
+        self.failed += 1
+        if self.on_error is not None:
+            self.on_error(values, error)
+        else:
+            log.error('Failed to write token of client %r: %r',
+                      values.get('client_id'), error)
+    def _write(self, items):
+        if not items:
+            return
+
+        with self._write_lock:
+            start = time.perf_counter()
+            session = self.session_factory()
+            try:
+                session.add_all([self.token_model(**values) for values in items])
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+
+            elapsed = time.perf_counter() - start
+            self.flushes += 1
+            self.written += len(items)
+            self.last_flush_time = elapsed
+            self.total_flush_time += elapsed
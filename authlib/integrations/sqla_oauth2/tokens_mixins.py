@@ -62,9 +62,13 @@ class OAuth2TokenMixin(TokenMixin):
     def is_revoked(self):
         return self.access_token_revoked_at or self.refresh_token_revoked_at
 
-    def is_expired(self):
+    def get_expires_at(self):
         if not self.expires_in:
-            return False
+            return None
+        return self.issued_at + self.expires_in
 
-        expires_at = self.issued_at + self.expires_in
+    def is_expired(self):
+        expires_at = self.get_expires_at()
+        if expires_at is None:
+            return False
         return expires_at < time.time()
@@ -11,7 +11,7 @@ from .rfc7515 import (
 from .rfc7516 import (
     JsonWebEncryption, JWEAlgorithm, JWEEncAlgorithm, JWEZipAlgorithm,
 )
-from .rfc7517 import Key, KeySet, JsonWebKey
+from .rfc7517 import Key, KeySet, JsonWebKey, KeyResolver
 from .rfc7518 import (
     register_jws_rfc7518,
     register_jwe_rfc7518,
@@ -20,7 +20,9 @@ from .rfc7518 import (
     RSAKey,
     ECKey,
 )
-from .rfc7519 import JsonWebToken, BaseClaims, JWTClaims
+from .rfc7519 import (
+    JsonWebToken, JWTDecoder, BaseClaims, JWTClaims, ClaimsOptions,
+)
 from .rfc8037 import OKPKey, register_jws_rfc8037
 
 from .errors import JoseError
@@ -51,10 +53,10 @@ __all__ = [
     'JsonWebSignature', 'JWSAlgorithm', 'JWSHeader', 'JWSObject',
     'JsonWebEncryption', 'JWEAlgorithm', 'JWEEncAlgorithm', 'JWEZipAlgorithm',
 
-    'JsonWebKey', 'Key', 'KeySet',
+    'JsonWebKey', 'Key', 'KeySet', 'KeyResolver',
 
     'OctKey', 'RSAKey', 'ECKey', 'OKPKey',
 
-    'JsonWebToken', 'BaseClaims', 'JWTClaims',
+    'JsonWebToken', 'JWTDecoder', 'BaseClaims', 'JWTClaims', 'ClaimsOptions',
     'jwt',
 ]
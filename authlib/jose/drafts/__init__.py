@@ -1,4 +1,4 @@
-from ._jwe_algorithms import JWE_DRAFT_ALG_ALGORITHMS
+from ._jwe_algorithms import JWE_DRAFT_ALG_ALGORITHMS, ECDH1PUAlgorithm
 from ._jwe_enc_cryptography import C20PEncAlgorithm
 try:
     from ._jwe_enc_cryptodome import XC20PEncAlgorithm
@@ -14,4 +14,4 @@ def register_jwe_draft(cls):
     if XC20PEncAlgorithm is not None:
         cls.register_algorithm(XC20PEncAlgorithm(256))  # XC20P
 
-__all__ = ['register_jwe_draft']
+__all__ = ['register_jwe_draft', 'ECDH1PUAlgorithm']
@@ -3,9 +3,11 @@ from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.concatkdf import ConcatKDFHash
 
+from authlib.common.cache import LRUCache
+
 from authlib.jose.errors import InvalidEncryptionAlgorithmForECDH1PUWithKeyWrappingError
 from authlib.jose.rfc7516 import JWEAlgorithmWithTagAwareKeyAgreement
-from authlib.jose.rfc7518 import AESAlgorithm, CBCHS2EncAlgorithm, ECKey, u32be_len_input
+from authlib.jose.rfc7518 import AESAlgorithm, CBCHS2EncAlgorithm, ECKey, import_epk, u32be_len_input
 from authlib.jose.rfc8037 import OKPKey
 
 
@@ -13,6 +15,10 @@ class ECDH1PUAlgorithm(JWEAlgorithmWithTagAwareKeyAgreement):
     EXTRA_HEADERS = ['epk', 'apu', 'apv', 'skid']
     ALLOWED_KEY_CLS = (ECKey, OKPKey)
 
+    #: Cache of shared keys, it is disabled by default, call
+    #: :meth:`enable_derived_key_cache` to enable it
+    derived_key_cache = None
+
     # https://datatracker.ietf.org/doc/html/draft-madden-jose-ecdh-1pu-04
     def __init__(self, key_size=None):
         if key_size is None:
@@ -26,6 +32,21 @@ class ECDH1PUAlgorithm(JWEAlgorithmWithTagAwareKeyAgreement):
         self.key_size = key_size
         self.aeskw = AESAlgorithm(key_size)
 
+    def enable_derived_key_cache(self, maxsize=128, ttl=None):
+        """Cache the shared keys computed by the recipient, so that a
+        message with the same ``epk`` for the same recipient and sender
+        keys skips both key agreements. The shared key is cached instead of
+        the derived key, since the Concat KDF input contains the
+        authentication tag in the key wrapping mode::
+
+            alg = JsonWebEncryption.ALG_REGISTRY['ECDH-1PU+A128KW']
+            alg.enable_derived_key_cache(maxsize=1024, ttl=3600)
+
+        :param maxsize: maximum number of cached keys
+        :param ttl: seconds to keep a shared key
+        """
+        self.derived_key_cache = LRUCache(maxsize=maxsize, ttl=ttl)
+
     def prepare_key(self, raw_data):
         if isinstance(raw_data, self.ALLOWED_KEY_CLS):
             return raw_data
@@ -85,14 +106,17 @@ class ECDH1PUAlgorithm(JWEAlgorithmWithTagAwareKeyAgreement):
         return self.compute_derived_key(shared_key, fixed_info, bit_size)
 
     def deliver_at_recipient(self, recipient_key, sender_static_pubkey, sender_ephemeral_pubkey, headers, bit_size, tag):
-        shared_key_s = recipient_key.exchange_shared_key(sender_static_pubkey)
-        shared_key_e = recipient_key.exchange_shared_key(sender_ephemeral_pubkey)
-        shared_key = self.compute_shared_key(shared_key_e, shared_key_s)
+        shared_key = self._exchange_at_recipient(recipient_key, sender_static_pubkey, sender_ephemeral_pubkey)
 
         fixed_info = self.compute_fixed_info(headers, bit_size, tag)
 
         return self.compute_derived_key(shared_key, fixed_info, bit_size)
 
+    def _exchange_at_recipient(self, recipient_key, sender_static_pubkey, sender_ephemeral_pubkey):
+        shared_key_s = recipient_key.exchange_shared_key(sender_static_pubkey)
+        shared_key_e = recipient_key.exchange_shared_key(sender_ephemeral_pubkey)
+        return self.compute_shared_key(shared_key_e, shared_key_s)
+
     def _generate_ephemeral_key(self, key):
         return key.generate_key(key['crv'], is_private=True)
 
@@ -164,9 +188,20 @@ class ECDH1PUAlgorithm(JWEAlgorithmWithTagAwareKeyAgreement):
             bit_size = self.key_size
 
         sender_pubkey = sender_key.get_op_key('wrapKey')
-        epk = key.import_key(headers['epk'])
+        epk = import_epk(key, headers['epk'])
         epk_pubkey = epk.get_op_key('wrapKey')
-        dk = self.deliver_at_recipient(key, sender_pubkey, epk_pubkey, headers, bit_size, tag)
+
+        cache = self.derived_key_cache
+        if cache is None:
+            dk = self.deliver_at_recipient(key, sender_pubkey, epk_pubkey, headers, bit_size, tag)
+        else:
+            cache_key = (epk.thumbprint(), key.thumbprint(), sender_key.thumbprint())
+            shared_key = cache.get(cache_key)
+            if shared_key is None:
+                shared_key = self._exchange_at_recipient(key, sender_pubkey, epk_pubkey)
+                cache.set(cache_key, shared_key)
+            fixed_info = self.compute_fixed_info(headers, bit_size, tag)
+            dk = self.compute_derived_key(shared_key, fixed_info, bit_size)
 
         if self.key_size is None:
             return dk
@@ -6,6 +6,7 @@
 
     .. _`Section 4`: https://datatracker.ietf.org/doc/html/draft-amringer-jose-chacha-02#section-4
 """
+from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
 from authlib.jose.rfc7516 import JWEEncAlgorithm
 
@@ -46,5 +47,8 @@ class C20PEncAlgorithm(JWEEncAlgorithm):
         :return: message
         """
         self.check_iv(iv)
+        # the tag must not borrow bytes from the ciphertext
+        if len(tag) != 16:
+            raise InvalidTag()
         chacha = ChaCha20Poly1305(key)
         return chacha.decrypt(iv, ciphertext + tag, aad)
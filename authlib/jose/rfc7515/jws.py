@@ -1,3 +1,6 @@
+import json
+import hashlib
+from authlib.common.cache import LRUCache
 from authlib.common.encoding import (
     to_bytes,
     to_unicode,
@@ -9,12 +12,14 @@ from authlib.jose.util import (
     extract_segment, ensure_dict,
 )
 from authlib.jose.errors import (
+    JoseError,
     DecodeError,
     MissingAlgorithmError,
     UnsupportedAlgorithmError,
     BadSignatureError,
     InvalidHeaderParameterNameError,
 )
+from ..rfc7517 import KeyResolver
 from .models import JWSHeader, JWSObject
 
 
@@ -33,6 +38,25 @@ class JsonWebSignature:
     def __init__(self, algorithms=None, private_headers=None):
         self._private_headers = private_headers
         self._algorithms = algorithms
+        self.prepared_key_cache = None
+
+    def enable_prepared_key_cache(self, maxsize=128, ttl=None):
+        """Cache the keys prepared from raw key material (JWK dict, PEM
+        string or bytes), so that the same key is not parsed again on
+        every call::
+
+            jws = JsonWebSignature()
+            jws.enable_prepared_key_cache(maxsize=64, ttl=3600)
+
+        The cache is kept on this instance only. Its keys are the algorithm
+        name and a SHA-256 digest of the key material, but its values are
+        the prepared key objects, which hold the secrets, so only enable it
+        in processes where keeping these keys in memory is acceptable.
+
+        :param maxsize: maximum number of cached keys
+        :param ttl: seconds to keep a prepared key
+        """
+        self.prepared_key_cache = LRUCache(maxsize=maxsize, ttl=ttl)
 
     @classmethod
     def register_algorithm(cls, algorithm):
@@ -82,27 +106,73 @@ class JsonWebSignature:
 
         .. _`Section 7.1`: https://tools.ietf.org/html/rfc7515#section-7.1
         """
-        try:
-            s = to_bytes(s)
-            signing_input, signature_segment = s.rsplit(b'.', 1)
-            protected_segment, payload_segment = signing_input.split(b'.', 1)
-        except ValueError:
-            raise DecodeError('Not enough segments')
-
-        protected = _extract_header(protected_segment)
-        jws_header = JWSHeader(protected, None)
-
-        payload = _extract_payload(payload_segment)
-        if decode:
-            payload = decode(payload)
-
-        signature = _extract_signature(signature_segment)
-        rv = JWSObject(jws_header, payload, 'compact')
-        algorithm, key = self._prepare_algorithm_key(jws_header, payload, key)
+        signing_input, signature, rv = _extract_compact(s, decode)
+        algorithm, key = self._prepare_algorithm_key(rv.header, rv.payload, key)
         if algorithm.verify(signing_input, signature, key):
             return rv
         raise BadSignatureError(rv)
 
+    def verify_batch(self, tokens, key, decode=None, executor=None):
+        """Exact and validate many JWS Compact Serializations with the
+        given key. Unlike :meth:`deserialize_compact`, it will not raise
+        on the first failure, instead it returns a list of
+        ``(JWSObject, error)`` pairs in the order of ``tokens``, one of
+        them is always ``None``::
+
+            results = jws.verify_batch(tokens, jwks)
+            for obj, error in results:
+                ...
+
+        Tokens are grouped by ``alg`` and ``kid`` in header, so that the
+        key of each group is resolved and prepared only once. A custom
+        key function which is not a :class:`~authlib.jose.KeyResolver`
+        may depend on the payload, it is called for every token.
+
+        Signature checks of ``cryptography`` keys release the GIL, pass a
+        ``concurrent.futures.ThreadPoolExecutor`` as ``executor`` to
+        verify the signatures in parallel.
+
+        :param tokens: a list of JWS Compact Serialization texts
+        :param key: key used to verify the signatures
+        :param decode: a function to decode payload data
+        :param executor: an optional ``concurrent.futures.Executor``
+        :return: list of ``(JWSObject, error)``
+        """
+        if callable(key) and not isinstance(key, KeyResolver):
+            prepared = None
+        else:
+            prepared = {}
+
+        results = []
+        jobs = []
+        for s in tokens:
+            try:
+                signing_input, signature, rv = _extract_compact(s, decode)
+                algorithm, _key = self._prepare_batch_key(rv, key, prepared)
+            except (JoseError, ValueError) as error:
+                results.append((None, error))
+                continue
+            jobs.append((len(results), algorithm, signing_input, signature, _key, rv))
+            results.append(None)
+
+        def _verify(job):
+            algorithm, signing_input, signature, _key, rv = job[1:]
+            try:
+                if algorithm.verify(signing_input, signature, _key):
+                    return rv, None
+                return None, BadSignatureError(rv)
+            except (JoseError, ValueError) as error:
+                return None, error
+
+        if executor is None:
+            outcomes = map(_verify, jobs)
+        else:
+            outcomes = executor.map(_verify, jobs)
+
+        for job, outcome in zip(jobs, outcomes):
+            results[job[0]] = outcome
+        return results
+
     def serialize_json(self, header_obj, payload, key):
         """Generate a JWS JSON Serialization. The JWS JSON Serialization
         represents digitally signed or MACed content as a JSON object,
@@ -254,9 +324,42 @@ class JsonWebSignature:
             key = key(header, payload)
         elif key is None and 'jwk' in header:
             key = header['jwk']
-        key = algorithm.prepare_key(key)
+        key = self._prepare_key(algorithm, key)
         return algorithm, key
 
+    def _prepare_batch_key(self, obj, key, prepared):
+        header = obj.header
+        group = (header.get('alg'), header.get('kid'))
+        try:
+            hash(group)
+        except TypeError:
+            raise DecodeError('Invalid "alg" or "kid" value in header')
+
+        if prepared is None or key is None:
+            return self._prepare_algorithm_key(header, obj.payload, key)
+
+        rv = prepared.get(group)
+        if rv is None:
+            rv = self._prepare_algorithm_key(header, obj.payload, key)
+            prepared[group] = rv
+        return rv
+
+    def _prepare_key(self, algorithm, raw_key):
+        cache = self.prepared_key_cache
+        if cache is None:
+            return algorithm.prepare_key(raw_key)
+
+        digest = _key_digest(raw_key)
+        if digest is None:
+            return algorithm.prepare_key(raw_key)
+
+        cache_key = (algorithm.name, digest)
+        key = cache.get(cache_key)
+        if key is None:
+            key = algorithm.prepare_key(raw_key)
+            cache.set(cache_key, key)
+        return key
+
     def _validate_private_headers(self, header):
         # only validate private headers when developers set
         # private headers explicitly
@@ -292,6 +395,43 @@ class JsonWebSignature:
         return jws_header, False
 
 
+def _extract_compact(s, decode):
+    try:
+        s = to_bytes(s)
+        signing_input, signature_segment = s.rsplit(b'.', 1)
+        protected_segment, payload_segment = signing_input.split(b'.', 1)
+    except ValueError:
+        raise DecodeError('Not enough segments')
+
+    protected = _extract_header(protected_segment)
+    jws_header = JWSHeader(protected, None)
+
+    payload = _extract_payload(payload_segment)
+    if decode:
+        payload = decode(payload)
+
+    signature = _extract_signature(signature_segment)
+    rv = JWSObject(jws_header, payload, 'compact')
+    return signing_input, signature, rv
+
+
+def _key_digest(raw_key):
+    # only raw key data is cached, Key instances are already prepared
+    if isinstance(raw_key, bytes):
+        material = b'b:' + raw_key
+    elif isinstance(raw_key, str):
+        material = b's:' + raw_key.encode('utf-8', 'surrogatepass')
+    elif isinstance(raw_key, dict):
+        try:
+            data = json.dumps(raw_key, sort_keys=True, separators=(',', ':'))
+        except (TypeError, ValueError):
+            return None
+        material = b'd:' + data.encode('utf-8', 'surrogatepass')
+    else:
+        return None
+    return hashlib.sha256(material).digest()
+
+
 def _extract_header(header_segment):
     return extract_header(header_segment, DecodeError)
 
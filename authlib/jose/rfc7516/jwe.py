@@ -1,5 +1,9 @@
+import io
+import base64
+import shutil
+import binascii
+import tempfile
 from collections import OrderedDict
-from copy import deepcopy
 
 from authlib.common.encoding import (
     to_bytes, urlsafe_b64encode, json_b64encode, to_unicode
@@ -19,6 +23,17 @@ from authlib.jose.errors import (
     InvalidHeaderParameterNameError, InvalidAlgorithmForMultipleRecipientsMode, KeyMismatchError,
 )
 
+#: default bytes to read from a file-like object in each step of streaming
+STREAM_CHUNK_SIZE = 64 * 1024
+
+#: maximum bytes of the header, encrypted key, IV and tag segments when
+#: streaming, only the ciphertext segment may be larger
+STREAM_MAX_SEGMENT_SIZE = 64 * 1024
+
+#: bytes of unverified payload kept in memory before spilling to a
+#: temporary file when streaming
+STREAM_SPOOL_SIZE = 1024 * 1024
+
 
 class JsonWebEncryption:
     #: Registered Header Parameter Names defined by Section 4.1
@@ -33,9 +48,10 @@ class JsonWebEncryption:
     ENC_REGISTRY = {}
     ZIP_REGISTRY = {}
 
-    def __init__(self, algorithms=None, private_headers=None):
+    def __init__(self, algorithms=None, private_headers=None, max_decompressed_size=None):
         self._algorithms = algorithms
         self._private_headers = private_headers
+        self._max_decompressed_size = max_decompressed_size
 
     @classmethod
     def register_algorithm(cls, algorithm):
@@ -144,7 +160,75 @@ class JsonWebEncryption:
             urlsafe_b64encode(tag)
         ])
 
-    def serialize_json(self, header_obj, payload, keys, sender_key=None):
+    def serialize_compact_stream(self, protected, payload, key, fp,
+                                 sender_key=None, chunk_size=STREAM_CHUNK_SIZE):
+        """Generate a JWE Compact Serialization of a large payload, and
+        write it into a binary file-like object chunk by chunk::
+
+            with open('report.pdf', 'rb') as src, open('report.jwe', 'wb') as fp:
+                jwe.serialize_compact_stream(protected, src, key, fp)
+
+        The payload is compressed, encrypted and encoded incrementally, so
+        the memory usage does not grow with the size of payload. ECDH-1PU
+        with key wrapping is not supported, since its encrypted key depends
+        on the authentication tag.
+
+        :param protected: A dict of protected header
+        :param payload: Payload as bytes, a file-like object or an iterable
+            of bytes
+        :param key: Public key used to encrypt payload
+        :param fp: A binary file-like object to write into
+        :param sender_key: Sender's private key in case
+            JWEAlgorithmWithTagAwareKeyAgreement is used
+        :param chunk_size: bytes to read from a file-like payload in each step
+        """
+        alg = self.get_header_alg(protected)
+        enc = self.get_header_enc(protected)
+        zip_alg = self.get_header_zip(protected)
+
+        self._validate_sender_key(sender_key, alg)
+        self._validate_private_headers(protected, alg)
+        _check_stream_alg(alg)
+
+        key = prepare_key(alg, protected, key)
+        if sender_key is not None:
+            sender_key = alg.prepare_key(sender_key)
+
+        if isinstance(alg, JWEAlgorithmWithTagAwareKeyAgreement):
+            wrapped = alg.wrap(enc, protected, key, sender_key)
+        else:
+            wrapped = alg.wrap(enc, protected, key)
+        cek = wrapped['cek']
+        if 'header' in wrapped:
+            protected.update(wrapped['header'])
+
+        iv = enc.generate_iv()
+        protected_segment = json_b64encode(protected)
+        aad = to_bytes(protected_segment, 'ascii')
+
+        fp.write(b'.'.join([
+            protected_segment,
+            urlsafe_b64encode(wrapped['ek']),
+            urlsafe_b64encode(iv),
+            b'',
+        ]))
+
+        encryptor = enc.encryptor(aad, iv, cek)
+        compressor = zip_alg.compressobj() if zip_alg else None
+        writer = _B64Writer(fp)
+        for chunk in _iter_chunks(payload, chunk_size):
+            if compressor:
+                chunk = compressor.compress(chunk)
+            writer.write(encryptor.update(chunk))
+        if compressor:
+            writer.write(encryptor.update(compressor.flush()))
+
+        ciphertext, tag = encryptor.finalize()
+        writer.write(ciphertext)
+        writer.flush()
+        fp.write(b'.' + urlsafe_b64encode(tag))
+
+    def serialize_json(self, header_obj, payload, keys, sender_key=None, executor=None):
         """Generate a JWE JSON Serialization (in fully general syntax).
 
         The JWE JSON Serialization represents encrypted content as a JSON
@@ -221,6 +305,8 @@ class JsonWebEncryption:
         :param keys: Public keys (or a single public key) used to encrypt payload
         :param sender_key: Sender's private key in case
             JWEAlgorithmWithTagAwareKeyAgreement is used
+        :param executor: A ``concurrent.futures.Executor`` to wrap CEK for
+            many recipients concurrently
         :return: JWE JSON serialization (in fully general syntax) as dict
 
         Example of `header_obj`::
@@ -256,18 +342,25 @@ class JsonWebEncryption:
         if not keys:
             raise ValueError("No keys have been provided")
 
-        header_obj = deepcopy(header_obj)
-
-        shared_header = JWESharedHeader.from_dict(header_obj)
+        # headers are copied shallowly, since only their top level members
+        # are updated, the given header_obj is never changed
+        if isinstance(header_obj, JWESharedHeader):
+            shared_header = JWESharedHeader(dict(header_obj.protected), dict(header_obj.unprotected))
+            header_obj = {}
+        else:
+            shared_header = JWESharedHeader(
+                dict(header_obj.get('protected') or {}),
+                dict(header_obj.get('unprotected') or {}),
+            )
 
         recipients = header_obj.get('recipients')
         if recipients is None:
-            recipients = [{} for _ in keys]
-        for i in range(len(recipients)):
-            if recipients[i] is None:
-                recipients[i] = {}
-            if 'header' not in recipients[i]:
-                recipients[i]['header'] = {}
+            recipients = [{'header': {}} for _ in keys]
+        else:
+            recipients = [
+                {'header': dict(recipient.get('header') or {}) if recipient else {}}
+                for recipient in recipients
+            ]
 
         jwe_aad = header_obj.get('aad')
 
@@ -285,8 +378,7 @@ class JsonWebEncryption:
         for recipient in recipients:
             self._validate_private_headers(recipient['header'], alg)
 
-        for i in range(len(keys)):
-            keys[i] = prepare_key(alg, recipients[i]['header'], keys[i])
+        keys = [prepare_key(alg, recipients[i]['header'], keys[i]) for i in range(len(keys))]
         if sender_key is not None:
             sender_key = alg.prepare_key(sender_key)
 
@@ -319,16 +411,25 @@ class JsonWebEncryption:
         else:
             # In any other case:
             # Keep the normal steps order defined by RFC 7516
-            for i in range(len(keys)):
-                if isinstance(alg, JWEAlgorithmWithTagAwareKeyAgreement):
-                    wrapped = alg.wrap(enc, shared_header, keys[i], sender_key, preset)
-                else:
-                    wrapped = alg.wrap(enc, shared_header, keys[i], preset)
+            if isinstance(alg, JWEAlgorithmWithTagAwareKeyAgreement):
+                def wrap(k):
+                    return alg.wrap(enc, shared_header, k, sender_key, preset)
+            else:
+                def wrap(k):
+                    return alg.wrap(enc, shared_header, k, preset)
+
+            if executor is not None and len(keys) > 1:
+                # every recipient shares the preset CEK, wrap them concurrently
+                wrapped_list = list(executor.map(wrap, keys))
+            else:
+                wrapped_list = map(wrap, keys)
+
+            for recipient, wrapped in zip(recipients, wrapped_list):
                 if cek is None:
                     cek = wrapped['cek']
-                recipients[i]['encrypted_key'] = wrapped['ek']
+                recipient['encrypted_key'] = wrapped['ek']
                 if 'header' in wrapped:
-                    recipients[i]['header'].update(wrapped['header'])
+                    recipient['header'].update(wrapped['header'])
 
         # step 4: Generate a random JWE Initialization Vector
         iv = enc.generate_iv()
@@ -374,9 +475,6 @@ class JsonWebEncryption:
             if not recipient['header']:
                 del recipient['header']
             recipient['encrypted_key'] = to_unicode(urlsafe_b64encode(recipient['encrypted_key']))
-            for member in set(recipient.keys()):
-                if member not in {'header', 'encrypted_key'}:
-                    del recipient[member]
         obj['recipients'] = recipients
 
         if jwe_aad is not None:
@@ -469,7 +567,7 @@ class JsonWebEncryption:
         msg = enc.decrypt(ciphertext, aad, iv, tag, cek)
 
         if zip_alg:
-            payload = zip_alg.decompress(to_bytes(msg))
+            payload = self._decompress(zip_alg, to_bytes(msg))
         else:
             payload = msg
 
@@ -477,6 +575,102 @@ class JsonWebEncryption:
             payload = decode(payload)
         return {'header': protected, 'payload': payload}
 
+    def deserialize_compact_stream(self, fp, key, sink, sender_key=None,
+                                   chunk_size=STREAM_CHUNK_SIZE,
+                                   write_unverified=False):
+        """Extract a JWE Compact Serialization from a file-like object, and
+        write the payload into a binary file-like object chunk by chunk::
+
+            with open('report.jwe', 'rb') as fp, open('report.pdf', 'wb') as sink:
+                header = jwe.deserialize_compact_stream(fp, key, sink)
+
+        The payload is decrypted into a temporary file, and written into
+        ``sink`` only after the authentication tag at the end of the
+        serialization is verified. With ``write_unverified=True``, the
+        payload is written into ``sink`` while it is decrypted, without
+        the temporary file; if an error is raised then, everything written
+        into ``sink`` MUST be discarded.
+
+        :param fp: A file-like object of JWE Compact Serialization, or
+            the serialization as bytes
+        :param key: Private key used to decrypt payload
+            (optionally can be a tuple of kid and essentially key)
+        :param sink: A binary file-like object to write the payload into
+        :param sender_key: Sender's public key in case
+            JWEAlgorithmWithTagAwareKeyAgreement is used
+        :param chunk_size: bytes to read from ``fp`` in each step
+        :param write_unverified: write the payload into ``sink`` before the
+            authentication tag is verified
+        :return: dict of protected header
+        """
+        if isinstance(fp, (bytes, str)):
+            fp = io.BytesIO(to_bytes(fp))
+        reader = _SegmentReader(fp, chunk_size)
+
+        if write_unverified:
+            return self._deserialize_compact_stream(reader, key, sink, sender_key)
+
+        with tempfile.SpooledTemporaryFile(STREAM_SPOOL_SIZE) as spool:
+            protected = self._deserialize_compact_stream(reader, key, spool, sender_key)
+            spool.seek(0)
+            shutil.copyfileobj(spool, sink, chunk_size)
+        return protected
+
+    def _deserialize_compact_stream(self, reader, key, sink, sender_key):
+        protected_s = reader.read_segment()
+        protected = extract_header(protected_s, DecodeError)
+        ek = extract_segment(reader.read_segment(), DecodeError, 'encryption key')
+        iv = extract_segment(reader.read_segment(), DecodeError, 'initialization vector')
+
+        alg = self.get_header_alg(protected)
+        enc = self.get_header_enc(protected)
+        zip_alg = self.get_header_zip(protected)
+
+        self._validate_sender_key(sender_key, alg)
+        self._validate_private_headers(protected, alg)
+        _check_stream_alg(alg)
+
+        if isinstance(key, tuple) and len(key) == 2:
+            # Ignore separately provided kid, extract essentially key only
+            key = key[1]
+
+        key = prepare_key(alg, protected, key)
+        if sender_key is not None:
+            sender_key = alg.prepare_key(sender_key)
+
+        if isinstance(alg, JWEAlgorithmWithTagAwareKeyAgreement):
+            cek = alg.unwrap(enc, ek, protected, key, sender_key)
+        else:
+            cek = alg.unwrap(enc, ek, protected, key)
+
+        aad = to_bytes(protected_s, 'ascii')
+        decryptor = enc.decryptor(aad, iv, cek)
+        decompressor = self._decompressobj(zip_alg) if zip_alg else None
+
+        def write(msg):
+            if decompressor:
+                msg = decompressor.decompress(msg)
+            if msg:
+                sink.write(msg)
+
+        decoder = _B64Decoder()
+        for chunk in reader.iter_segment():
+            write(decryptor.update(decoder.decode(chunk)))
+        write(decryptor.update(decoder.flush()))
+
+        tag_s = reader.read_rest()
+        if b'.' in tag_s:
+            raise DecodeError('Not enough segments')
+        tag = extract_segment(tag_s, DecodeError, 'authentication tag')
+        write(decryptor.finalize(tag))
+        if decompressor:
+            msg = decompressor.flush()
+            if msg:
+                sink.write(msg)
+            if not decompressor.eof:
+                raise DecodeError('Incomplete compressed data')
+        return protected
+
     def deserialize_json(self, obj, key, decode=None, sender_key=None):
         """Extract JWE JSON Serialization.
 
@@ -491,7 +685,6 @@ class JsonWebEncryption:
             `aad` keys
         """
         obj = ensure_dict(obj, 'JWE')
-        obj = deepcopy(obj)
 
         if 'protected' in obj:
             protected = extract_header(to_bytes(obj['protected']), DecodeError)
@@ -499,13 +692,16 @@ class JsonWebEncryption:
             protected = None
 
         unprotected = obj.get('unprotected')
+        if unprotected:
+            unprotected = dict(unprotected)
 
-        recipients = obj['recipients']
-        for recipient in recipients:
-            if 'header' not in recipient:
-                recipient['header'] = {}
-            recipient['encrypted_key'] = extract_segment(
-                to_bytes(recipient['encrypted_key']), DecodeError, 'encrypted key')
+        # the given obj is never changed, encrypted keys are decoded only
+        # when their recipients are tried
+        recipients = [
+            {'header': dict(recipient.get('header') or {})}
+            for recipient in obj['recipients']
+        ]
+        encrypted_keys = [recipient['encrypted_key'] for recipient in obj['recipients']]
 
         if 'aad' in obj:
             jwe_aad = extract_segment(to_bytes(obj['aad']), DecodeError, 'JWE AAD')
@@ -553,19 +749,22 @@ class JsonWebEncryption:
         def _unwrap_without_sender_key_and_tag(ek, header):
             return alg.unwrap(enc, ek, header, key)
 
+        def _unwrap_recipient(unwrap_func, i):
+            header = JWEHeader(protected, unprotected, recipients[i]['header'])
+            ek = extract_segment(to_bytes(encrypted_keys[i]), DecodeError, 'encrypted key')
+            return unwrap_func(ek, header)
+
         def _unwrap_for_matching_recipient(unwrap_func):
             if kid is not None:
-                for recipient in recipients:
+                for i, recipient in enumerate(recipients):
                     if recipient['header'].get('kid') == kid:
-                        header = JWEHeader(protected, unprotected, recipient['header'])
-                        return unwrap_func(recipient['encrypted_key'], header)
+                        return _unwrap_recipient(unwrap_func, i)
 
             # Since no explicit match has been found, iterate over all the recipients
             error = None
-            for recipient in recipients:
-                header = JWEHeader(protected, unprotected, recipient['header'])
+            for i in range(len(recipients)):
                 try:
-                    return unwrap_func(recipient['encrypted_key'], header)
+                    return _unwrap_recipient(unwrap_func, i)
                 except Exception as e:
                     error = e
             else:
@@ -596,7 +795,7 @@ class JsonWebEncryption:
         msg = enc.decrypt(ciphertext, aad, iv, tag, cek)
 
         if zip_alg:
-            payload = zip_alg.decompress(to_bytes(msg))
+            payload = self._decompress(zip_alg, to_bytes(msg))
         else:
             payload = msg
 
@@ -606,9 +805,6 @@ class JsonWebEncryption:
         for recipient in recipients:
             if not recipient['header']:
                 del recipient['header']
-            for member in set(recipient.keys()):
-                if member != 'header':
-                    del recipient[member]
 
         header = {}
         if protected:
@@ -687,6 +883,16 @@ class JsonWebEncryption:
                 raise UnsupportedCompressionAlgorithmError()
             return self.ZIP_REGISTRY[z]
 
+    def _decompress(self, zip_alg, msg):
+        if self._max_decompressed_size is None:
+            return zip_alg.decompress(msg)
+        return zip_alg.decompress(msg, self._max_decompressed_size)
+
+    def _decompressobj(self, zip_alg):
+        if self._max_decompressed_size is None:
+            return zip_alg.decompressobj()
+        return zip_alg.decompressobj(self._max_decompressed_size)
+
     def _validate_sender_key(self, sender_key, alg):
         if isinstance(alg, JWEAlgorithmWithTagAwareKeyAgreement):
             if sender_key is None:
@@ -720,3 +926,129 @@ def prepare_key(alg, header, key):
     elif key is None and 'jwk' in header:
         key = header['jwk']
     return alg.prepare_key(key)
+
+
+def _check_stream_alg(alg):
+    if isinstance(alg, JWEAlgorithmWithTagAwareKeyAgreement) and alg.key_size is not None:
+        raise UnsupportedAlgorithmError(
+            description=f'{alg.name} algorithm can not be used in streaming mode')
+
+
+def _iter_chunks(payload, chunk_size):
+    if isinstance(payload, (bytes, str)):
+        data = memoryview(to_bytes(payload))
+        for i in range(0, len(data), chunk_size):
+            yield data[i:i + chunk_size]
+    elif hasattr(payload, 'read'):
+        while True:
+            chunk = payload.read(chunk_size)
+            if not chunk:
+                break
+            yield to_bytes(chunk)
+    else:
+        for chunk in payload:
+            yield to_bytes(chunk)
+
+
+class _B64Writer:
+    """Write base64url encoded data incrementally, 3 bytes are encoded
+    into 4 characters, the rest bytes are kept for the next write.
+    """
+    def __init__(self, fp):
+        self.fp = fp
+        self.rest = b''
+
+    def write(self, data):
+        if not data:
+            return
+        if self.rest:
+            data = self.rest + data
+        n = len(data) - len(data) % 3
+        self.rest = bytes(data[n:])
+        if n:
+            self.fp.write(urlsafe_b64encode(memoryview(data)[:n]))
+
+    def flush(self):
+        if self.rest:
+            self.fp.write(urlsafe_b64encode(self.rest))
+            self.rest = b''
+
+
+class _B64Decoder:
+    """Decode base64url encoded data incrementally, 4 characters are
+    decoded into 3 bytes, the rest characters are kept for the next call.
+    """
+    def __init__(self):
+        self.rest = b''
+
+    def decode(self, data):
+        if self.rest:
+            data = self.rest + data
+        n = len(data) - len(data) % 4
+        self.rest = data[n:]
+        return self._decode(data[:n])
+
+    def flush(self):
+        data = self.rest
+        self.rest = b''
+        return self._decode(data + b'=' * (-len(data) % 4))
+
+    @staticmethod
+    def _decode(data):
+        try:
+            return base64.b64decode(data, altchars=b'-_', validate=True)
+        except binascii.Error:
+            raise DecodeError('Invalid ciphertext padding')
+
+
+class _SegmentReader:
+    """Read segments separated by ``.`` from a file-like object."""
+    def __init__(self, fp, chunk_size):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = b''
+
+    def _fill(self):
+        data = self.fp.read(self.chunk_size)
+        if not data:
+            return False
+        self.buf += to_bytes(data)
+        return True
+
+    def iter_segment(self):
+        """Yield chunks of the current segment until the next ``.``."""
+        while True:
+            i = self.buf.find(b'.')
+            if i >= 0:
+                data = self.buf[:i]
+                self.buf = self.buf[i + 1:]
+                if data:
+                    yield data
+                return
+            if self.buf:
+                data = self.buf
+                self.buf = b''
+                yield data
+            if not self._fill():
+                raise DecodeError('Not enough segments')
+
+    def read_segment(self, max_size=STREAM_MAX_SEGMENT_SIZE):
+        """Read the current segment, which is at most ``max_size`` bytes."""
+        chunks = []
+        size = 0
+        for data in self.iter_segment():
+            size += len(data)
+            if size > max_size:
+                raise DecodeError('Segment is too large')
+            chunks.append(data)
+        return b''.join(chunks)
+
+    def read_rest(self, max_size=STREAM_MAX_SEGMENT_SIZE):
+        """Read the last segment, which is at most ``max_size`` bytes."""
+        while len(self.buf) <= max_size and self._fill():
+            pass
+        if len(self.buf) > max_size:
+            raise DecodeError('Segment is too large')
+        data = self.buf
+        self.buf = b''
+        return data
@@ -89,6 +89,55 @@ class JWEEncAlgorithm:
         """
         raise NotImplementedError
 
+    def encryptor(self, aad, iv, key):
+        """Create an incremental encryptor for streaming. It has an
+        ``update(data)`` method which returns ciphertext, and a
+        ``finalize()`` method which returns ``(ciphertext, tag)``.
+
+        This default encryptor buffers the whole message, and encrypts
+        it in ``finalize()``.
+        """
+        return _BufferedEncryptor(self, aad, iv, key)
+
+    def decryptor(self, aad, iv, key):
+        """Create an incremental decryptor for streaming. It has an
+        ``update(ciphertext)`` method which returns message, and a
+        ``finalize(tag)`` method which returns the rest of message, or
+        raises an error if the tag is invalid.
+
+        This default decryptor buffers the whole ciphertext, and decrypts
+        it in ``finalize(tag)``.
+        """
+        return _BufferedDecryptor(self, aad, iv, key)
+
+
+class _BufferedEncryptor:
+    def __init__(self, enc_alg, aad, iv, key):
+        self._args = (enc_alg, aad, iv, key)
+        self._chunks = []
+
+    def update(self, data):
+        self._chunks.append(bytes(data))
+        return b''
+
+    def finalize(self):
+        enc_alg, aad, iv, key = self._args
+        return enc_alg.encrypt(b''.join(self._chunks), aad, iv, key)
+
+
+class _BufferedDecryptor:
+    def __init__(self, enc_alg, aad, iv, key):
+        self._args = (enc_alg, aad, iv, key)
+        self._chunks = []
+
+    def update(self, data):
+        self._chunks.append(bytes(data))
+        return b''
+
+    def finalize(self, tag):
+        enc_alg, aad, iv, key = self._args
+        return enc_alg.decrypt(b''.join(self._chunks), aad, iv, tag, key)
+
 
 class JWEZipAlgorithm:
     name = None
@@ -99,7 +148,25 @@ class JWEZipAlgorithm:
     def compress(self, s):
         raise NotImplementedError
 
-    def decompress(self, s):
+    def decompress(self, s, max_size=None):
+        """Decompress bytes data. ``max_size`` overrides the maximum bytes
+        of decompressed data of this algorithm.
+        """
+        raise NotImplementedError
+
+    def compressobj(self):
+        """Create an incremental compressor for streaming, which has
+        ``compress(data)`` and ``flush()`` methods like
+        ``zlib.compressobj``.
+        """
+        raise NotImplementedError
+
+    def decompressobj(self, max_size=None):
+        """Create an incremental decompressor for streaming, which has
+        ``decompress(data)`` and ``flush()`` methods and ``eof`` attribute
+        like ``zlib.decompressobj``. ``max_size`` overrides the maximum bytes
+        of decompressed data of this algorithm.
+        """
         raise NotImplementedError
 
 
@@ -12,6 +12,10 @@ from .base_key import Key
 from .asymmetric_key import AsymmetricKey
 from .key_set import KeySet
 from .jwk import JsonWebKey
+from .key_resolver import KeyResolver
 
 
-__all__ = ['Key', 'AsymmetricKey', 'KeySet', 'JsonWebKey', 'load_pem_key']
+__all__ = [
+    'Key', 'AsymmetricKey', 'KeySet', 'JsonWebKey', 'KeyResolver',
+    'load_pem_key',
+]
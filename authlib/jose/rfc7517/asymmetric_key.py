@@ -66,9 +66,10 @@ class AsymmetricKey(Key):
 
     def load_dict_key(self):
         if self.private_key:
-            self._dict_data.update(self.dumps_private_key())
+            data = self.dumps_private_key()
         else:
-            self._dict_data.update(self.dumps_public_key())
+            data = self.dumps_public_key()
+        self._dict_data = {**self._dict_data, **data}
 
     def dumps_private_key(self):
         raise NotImplementedError()
@@ -84,7 +85,7 @@ class AsymmetricKey(Key):
 
     def as_dict(self, is_private=False, **params):
         """Represent this key as a dict of the JSON Web Key."""
-        tokens = self.tokens
+        tokens = self.tokens.copy()
         if is_private and 'd' not in tokens:
             raise ValueError('This is a public key')
 
@@ -1,5 +1,6 @@
 import hashlib
 from collections import OrderedDict
+from collections.abc import Mapping
 from authlib.common.encoding import (
     json_dumps,
     to_bytes,
@@ -9,6 +10,98 @@ from authlib.common.encoding import (
 from ..errors import InvalidUseError
 
 
+class KeyOptions(dict):
+    """A dict of key options which records every mutation, so that
+    :class:`Key` can tell when its cached tokens become stale.
+    """
+    __slots__ = ('version',)
+
+    #: incremented when the options or data of any existing key change,
+    #: so that a :class:`KeySet` can tell when its index becomes stale
+    generation = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def _changed(self):
+        self.version += 1
+        KeyOptions.generation += 1
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def setdefault(self, key, default=None):
+        rv = super().setdefault(key, default)
+        self._changed()
+        return rv
+
+    def pop(self, *args):
+        rv = super().pop(*args)
+        self._changed()
+        return rv
+
+    def popitem(self):
+        rv = super().popitem()
+        self._changed()
+        return rv
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+
+class KeyTokens(Mapping):
+    """A frozen, read-only view of the JSON Web Key parameters. It is
+    computed once by :attr:`Key.tokens` and shared until the key
+    options or key data change.
+    """
+    __slots__ = ('_data',)
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, item):
+        return self._data[item]
+
+    def __contains__(self, item):
+        return item in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._data!r})'
+
+    def get(self, item, default=None):
+        return self._data.get(item, default)
+
+    def keys(self):
+        return self._data.keys()
+
+    def items(self):
+        return self._data.items()
+
+    def values(self):
+        return self._data.values()
+
+    def copy(self):
+        """Return a mutable ``dict`` copy of the tokens."""
+        return dict(self._data)
+
+
 class Key:
     """This is the base class for a JSON Web Key."""
     kty = '_'
@@ -28,20 +121,55 @@ class Key:
     REQUIRED_JSON_FIELDS = []
 
     def __init__(self, options=None):
-        self.options = options or {}
+        self.options = options
         self._dict_data = {}
 
+    @property
+    def options(self):
+        return self._options
+
+    @options.setter
+    def options(self, options):
+        if getattr(self, '_options', None) is not None:
+            KeyOptions.generation += 1
+        self._options = KeyOptions(options or {})
+        self._tokens = None
+
+    @property
+    def _dict_data(self):
+        return self.__dict_data
+
+    @_dict_data.setter
+    def _dict_data(self, data):
+        old = getattr(self, '_Key__dict_data', None)
+        if old is not None and old.get('kid') != data.get('kid'):
+            KeyOptions.generation += 1
+        self.__dict_data = data
+        self._tokens = None
+
     @property
     def tokens(self):
+        """The parameters of this key as a read-only :class:`KeyTokens`
+        mapping. It is cached on the key, and recomputed only when
+        ``options`` or the key data change.
+        """
+        tokens = self._tokens
+        if tokens is not None and self._tokens_version == self._options.version:
+            return tokens
+
         if not self._dict_data:
             self.load_dict_key()
 
         rv = dict(self._dict_data)
         rv['kty'] = self.kty
         for k in self.ALLOWED_PARAMS:
-            if k not in rv and k in self.options:
-                rv[k] = self.options[k]
-        return rv
+            if k not in rv and k in self._options:
+                rv[k] = self._options[k]
+
+        tokens = KeyTokens(rv)
+        self._tokens = tokens
+        self._tokens_version = self._options.version
+        return tokens
 
     @property
     def kid(self):
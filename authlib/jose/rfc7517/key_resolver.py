@@ -0,0 +1,42 @@
+from .key_set import KeySet
+from .jwk import JsonWebKey, _transform_raw_key
+
+
+class KeyResolver:
+    """A reusable key loader for ``JsonWebToken.decode``,
+    ``JsonWebSignature`` and ``JsonWebEncryption``. The given JWK set is
+    imported only once, and keys are resolved by the ``kid`` in header::
+
+        resolver = KeyResolver(jwks)
+
+        # create once, then reuse it for every token
+        claims = jwt.decode(token, resolver)
+
+    :param raw: a JWK set as dict, string, list of keys or
+        :class:`KeySet`, or any other key accepted by ``decode``
+    """
+    def __init__(self, raw):
+        raw = _transform_raw_key(raw)
+        if isinstance(raw, dict) and 'keys' in raw:
+            raw = JsonWebKey.import_key_set(raw)
+
+        if isinstance(raw, KeySet):
+            self.key_set = raw
+            self.key = None
+        else:
+            self.key_set = None
+            self.key = raw
+
+    def __call__(self, header, payload):
+        return self.resolve(header)
+
+    def resolve(self, header):
+        """Find the key for the given JWS/JWE header.
+
+        :param header: a dict of header
+        :return: Key instance or raw key
+        :raise: ValueError
+        """
+        if self.key_set is None:
+            return self.key
+        return self.key_set.find_by_kid(header.get('kid'))
@@ -1,12 +1,58 @@
 from authlib.common.encoding import json_dumps
+from .base_key import KeyOptions
 
 
 class KeySet:
-    """This class represents a JSON Web Key Set."""
+    """This class represents a JSON Web Key Set. Keys are indexed by
+    ``kid`` when the key set is created, so that looking up a key does
+    not need to scan the whole set. The index is rebuilt when ``keys``
+    is modified, or when the ``kid`` of a key changes.
+    """
 
     def __init__(self, keys):
         self.keys = keys
 
+    @property
+    def keys(self):
+        return self._keys
+
+    @keys.setter
+    def keys(self, keys):
+        self._keys = _KeyList(keys)
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        index = {}
+        for k in self._keys:
+            index.setdefault(k.kid, []).append(k)
+        self._kid_index = index
+        self._thumbprint_index = None
+        self._resolved = {}
+        self._indexed_version = (self._keys.version, KeyOptions.generation)
+
+    def _get_index(self):
+        if self._indexed_version != (self._keys.version, KeyOptions.generation):
+            self._rebuild_index()
+        return self._kid_index
+
+    def add_key(self, key):
+        """Add a key into this key set, and update the index."""
+        index = self._get_index()
+        self._keys.append(key)
+        index.setdefault(key.kid, []).append(key)
+        self._thumbprint_index = None
+        self._resolved = {}
+        self._indexed_version = (self._keys.version, KeyOptions.generation)
+
+    def remove_key(self, key):
+        """Remove a key from this key set, and update the index.
+
+        :param key: Key instance
+        :raise: ValueError
+        """
+        self._keys.remove(key)
+        self._rebuild_index()
+
     def as_dict(self, is_private=False, **params):
         """Represent this key as a dict of the JSON Web Key Set."""
         return {'keys': [k.as_dict(is_private, **params) for k in self.keys]}
@@ -23,10 +69,142 @@ class KeySet:
         :return: Key instance
         :raise: ValueError
         """
+        index = self._get_index()
         # Proposed fix, feel free to do something else but the idea is that we take the only key of the set if no kid is specified
         if kid is None and len(self.keys) == 1:
             return self.keys[0]
-        for k in self.keys:
-            if k.kid == kid:
+        try:
+            return index[kid][0]
+        except (KeyError, TypeError):
+            raise ValueError('Invalid JSON Web Key Set')
+
+    def find(self, kid=None, alg=None, use=None, key_ops=None):
+        """Find the key matches the given parameters. Parameters which
+        are not defined on a key are not used to filter it out. Results
+        are cached per parameters until the key set changes.
+
+        :param kid: A string of kid
+        :param alg: A string of algorithm name, e.g. "RS256"
+        :param use: "sig" or "enc"
+        :param key_ops: A key operation value, e.g. "verify"
+        :return: Key instance
+        :raise: ValueError
+        """
+        index = self._get_index()
+        cache_key = (kid, alg, use, key_ops)
+        try:
+            key = self._resolved.get(cache_key)
+        except TypeError:
+            cache_key = key = None
+        if key is not None:
+            return key
+
+        if kid is None:
+            candidates = self.keys
+        else:
+            try:
+                candidates = index.get(kid, [])
+            except TypeError:
+                raise ValueError('Invalid JSON Web Key Set')
+
+        for k in candidates:
+            if _match_key(k, alg, use, key_ops):
+                if cache_key is not None:
+                    self._resolved[cache_key] = k
                 return k
         raise ValueError('Invalid JSON Web Key Set')
+
+    def find_by_thumbprint(self, thumbprint):
+        """Find the key matches the given RFC7638 thumbprint value.
+
+        :param thumbprint: A string of JWK thumbprint
+        :return: Key instance
+        :raise: ValueError
+        """
+        self._get_index()
+        if self._thumbprint_index is None:
+            self._thumbprint_index = {k.thumbprint(): k for k in self.keys}
+        key = self._thumbprint_index.get(thumbprint)
+        if key is None:
+            raise ValueError('Invalid JSON Web Key Set')
+        return key
+
+
+def _match_key(key, alg, use, key_ops):
+    tokens = key.tokens
+    if alg is not None:
+        value = tokens.get('alg')
+        if value is not None and value != alg:
+            return False
+    if use is not None:
+        value = tokens.get('use')
+        if value is not None and value != use:
+            return False
+    if key_ops is not None:
+        value = tokens.get('key_ops')
+        if value is not None and key_ops not in value:
+            return False
+    return True
+
+
+class _KeyList(list):
+    """A list of keys which records every mutation, so that
+    :class:`KeySet` can tell when its index becomes stale.
+    """
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.version = 0
+
+    def _changed(self):
+        self.version += 1
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._changed()
+
+    def __iadd__(self, other):
+        rv = super().__iadd__(other)
+        self._changed()
+        return rv
+
+    def __imul__(self, n):
+        rv = super().__imul__(n)
+        self._changed()
+        return rv
+
+    def append(self, value):
+        super().append(value)
+        self._changed()
+
+    def extend(self, values):
+        super().extend(values)
+        self._changed()
+
+    def insert(self, index, value):
+        super().insert(index, value)
+        self._changed()
+
+    def remove(self, value):
+        super().remove(value)
+        self._changed()
+
+    def pop(self, *args):
+        rv = super().pop(*args)
+        self._changed()
+        return rv
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self):
+        super().reverse()
+        self._changed()
@@ -2,7 +2,7 @@ from .oct_key import OctKey
 from .rsa_key import RSAKey
 from .ec_key import ECKey
 from .jws_algs import JWS_ALGORITHMS
-from .jwe_algs import JWE_ALG_ALGORITHMS, AESAlgorithm, ECDHESAlgorithm, u32be_len_input
+from .jwe_algs import JWE_ALG_ALGORITHMS, AESAlgorithm, ECDHESAlgorithm, import_epk, u32be_len_input
 from .jwe_encs import JWE_ENC_ALGORITHMS, CBCHS2EncAlgorithm
 from .jwe_zips import DeflateZipAlgorithm
 
@@ -29,7 +29,9 @@ __all__ = [
     'RSAKey',
     'ECKey',
     'u32be_len_input',
+    'import_epk',
     'AESAlgorithm',
     'ECDHESAlgorithm',
     'CBCHS2EncAlgorithm',
+    'DeflateZipAlgorithm',
 ]
@@ -11,6 +11,7 @@ from cryptography.hazmat.primitives.ciphers import Cipher
 from cryptography.hazmat.primitives.ciphers.algorithms import AES
 from cryptography.hazmat.primitives.ciphers.modes import GCM
 from cryptography.hazmat.primitives.kdf.concatkdf import ConcatKDFHash
+from authlib.common.cache import LRUCache
 from authlib.common.encoding import (
     to_bytes, to_native,
     urlsafe_b64decode,
@@ -195,6 +196,10 @@ class ECDHESAlgorithm(JWEAlgorithm):
     EXTRA_HEADERS = ['epk', 'apu', 'apv']
     ALLOWED_KEY_CLS = ECKey
 
+    #: Cache of derived keys, it is disabled by default, call
+    #: :meth:`enable_derived_key_cache` to enable it
+    derived_key_cache = None
+
     # https://tools.ietf.org/html/rfc7518#section-4.6
     def __init__(self, key_size=None):
         if key_size is None:
@@ -208,6 +213,23 @@ class ECDHESAlgorithm(JWEAlgorithm):
         self.key_size = key_size
         self.aeskw = AESAlgorithm(key_size)
 
+    def enable_derived_key_cache(self, maxsize=128, ttl=None):
+        """Cache the keys derived by the recipient, so that a message with
+        the same ``epk``, ``enc``, ``apu`` and ``apv`` headers for the same
+        recipient key skips the key agreement and Concat KDF. It only helps
+        when senders reuse their ephemeral keys::
+
+            alg = JsonWebEncryption.ALG_REGISTRY['ECDH-ES+A128KW']
+            alg.enable_derived_key_cache(maxsize=1024, ttl=3600)
+
+        The cache hit and miss counters are available via
+        ``alg.derived_key_cache.hits`` and ``alg.derived_key_cache.misses``.
+
+        :param maxsize: maximum number of cached keys
+        :param ttl: seconds to keep a derived key
+        """
+        self.derived_key_cache = LRUCache(maxsize=maxsize, ttl=ttl)
+
     def prepare_key(self, raw_data):
         if isinstance(raw_data, self.ALLOWED_KEY_CLS):
             return raw_data
@@ -301,9 +323,19 @@ class ECDHESAlgorithm(JWEAlgorithm):
         else:
             bit_size = self.key_size
 
-        epk = key.import_key(headers['epk'])
-        public_key = epk.get_op_key('wrapKey')
-        dk = self.deliver(key, public_key, headers, bit_size)
+        epk = import_epk(key, headers['epk'])
+        cache = self.derived_key_cache
+        if cache is None:
+            dk = self.deliver(key, epk.get_op_key('wrapKey'), headers, bit_size)
+        else:
+            cache_key = (
+                epk.thumbprint(), key.thumbprint(), headers.get('enc'),
+                headers.get('apu'), headers.get('apv'), bit_size,
+            )
+            dk = cache.get(cache_key)
+            if dk is None:
+                dk = self.deliver(key, epk.get_op_key('wrapKey'), headers, bit_size)
+                cache.set(cache_key, dk)
 
         if self.key_size is None:
             return dk
@@ -312,6 +344,28 @@ class ECDHESAlgorithm(JWEAlgorithm):
         return self.aeskw.unwrap(enc_alg, ek, headers, kek)
 
 
+_epk_cache = LRUCache(maxsize=128)
+
+
+def import_epk(key, epk):
+    """Import the ``epk`` header value with the class of the recipient
+    key. Imported keys are cached, a reused ephemeral key is only parsed
+    once.
+    """
+    try:
+        cache_key = (key.__class__, tuple(sorted(epk.items())))
+        epk_key = _epk_cache.get(cache_key)
+    except (AttributeError, TypeError):
+        return key.import_key(epk)
+
+    if epk_key is None:
+        epk_key = key.import_key(epk)
+        # load the public key before it is shared
+        epk_key.get_op_key('wrapKey')
+        _epk_cache.set(cache_key, epk_key)
+    return epk_key
+
+
 def u32be_len_input(s, base64=False):
     if not s:
         return b'\x00\x00\x00\x00'
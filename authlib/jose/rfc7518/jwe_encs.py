@@ -9,8 +9,8 @@
 """
 import hmac
 import hashlib
-from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.ciphers import Cipher
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.ciphers.algorithms import AES
 from cryptography.hazmat.primitives.ciphers.modes import GCM, CBC
 from cryptography.hazmat.primitives.padding import PKCS7
@@ -36,12 +36,16 @@ class CBCHS2EncAlgorithm(JWEEncAlgorithm):
 
         self.CEK_SIZE = key_size * 2
         self.hash_alg = getattr(hashlib, f'sha{hash_type}')
+        # a digest name takes the fast path of OpenSSL HMAC
+        self.hash_name = f'sha{hash_type}'
 
     def _hmac(self, ciphertext, aad, iv, key):
-        al = encode_int(len(aad) * 8, 64)
-        msg = aad + iv + ciphertext + al
-        d = hmac.new(key, msg, self.hash_alg).digest()
-        return d[:self.key_len]
+        # feed HMAC part by part, instead of concatenating a new buffer
+        mac = hmac.new(key, aad, self.hash_name)
+        mac.update(iv)
+        mac.update(ciphertext)
+        mac.update(encode_int(len(aad) * 8, 64))
+        return mac.digest()[:self.key_len]
 
     def encrypt(self, msg, aad, iv, key):
         """Key Encryption with AES_CBC_HMAC_SHA2.
@@ -53,16 +57,13 @@ class CBCHS2EncAlgorithm(JWEEncAlgorithm):
         :return: (ciphertext, iv, tag)
         """
         self.check_iv(iv)
-        hkey = key[:self.key_len]
-        ekey = key[self.key_len:]
+        # PKCS#7 padding of a full message
+        n = 16 - len(msg) % 16
+        padded_data = msg + bytes((n,)) * n
 
-        pad = PKCS7(AES.block_size).padder()
-        padded_data = pad.update(msg) + pad.finalize()
-
-        cipher = Cipher(AES(ekey), CBC(iv), backend=default_backend())
-        enc = cipher.encryptor()
+        enc = Cipher(AES(key[self.key_len:]), CBC(iv)).encryptor()
         ciphertext = enc.update(padded_data) + enc.finalize()
-        tag = self._hmac(ciphertext, aad, iv, hkey)
+        tag = self._hmac(ciphertext, aad, iv, key[:self.key_len])
         return ciphertext, tag
 
     def decrypt(self, ciphertext, aad, iv, tag, key):
@@ -76,24 +77,79 @@ class CBCHS2EncAlgorithm(JWEEncAlgorithm):
         :return: message
         """
         self.check_iv(iv)
-        hkey = key[:self.key_len]
-        dkey = key[self.key_len:]
-
-        _tag = self._hmac(ciphertext, aad, iv, hkey)
+        _tag = self._hmac(ciphertext, aad, iv, key[:self.key_len])
         if not hmac.compare_digest(_tag, tag):
             raise InvalidTag()
 
-        cipher = Cipher(AES(dkey), CBC(iv), backend=default_backend())
-        d = cipher.decryptor()
+        d = Cipher(AES(key[self.key_len:]), CBC(iv)).decryptor()
         data = d.update(ciphertext) + d.finalize()
-        unpad = PKCS7(AES.block_size).unpadder()
-        return unpad.update(data) + unpad.finalize()
+
+        # the data is authenticated, no padding oracle here
+        n = data[-1] if data else 0
+        if not 0 < n <= 16 or data[-n:] != bytes((n,)) * n:
+            raise ValueError('Invalid padding bytes.')
+        return data[:-n]
+
+    def encryptor(self, aad, iv, key):
+        self.check_iv(iv)
+        return _CBCHS2Encryptor(self, aad, iv, key)
+
+    def decryptor(self, aad, iv, key):
+        self.check_iv(iv)
+        return _CBCHS2Decryptor(self, aad, iv, key)
+
+
+class _CBCHS2Cipher:
+    def __init__(self, enc_alg, aad, iv, key):
+        self.key_len = enc_alg.key_len
+        self.al = encode_int(len(aad) * 8, 64)
+        self.mac = hmac.new(key[:self.key_len], aad + iv, enc_alg.hash_name)
+        self.cipher = Cipher(AES(key[self.key_len:]), CBC(iv))
+
+    def get_tag(self):
+        self.mac.update(self.al)
+        return self.mac.digest()[:self.key_len]
+
+
+class _CBCHS2Encryptor(_CBCHS2Cipher):
+    def __init__(self, enc_alg, aad, iv, key):
+        super().__init__(enc_alg, aad, iv, key)
+        self.pad = PKCS7(AES.block_size).padder()
+        self.enc = self.cipher.encryptor()
+
+    def update(self, data):
+        ciphertext = self.enc.update(self.pad.update(data))
+        self.mac.update(ciphertext)
+        return ciphertext
+
+    def finalize(self):
+        ciphertext = self.enc.update(self.pad.finalize()) + self.enc.finalize()
+        self.mac.update(ciphertext)
+        return ciphertext, self.get_tag()
+
+
+class _CBCHS2Decryptor(_CBCHS2Cipher):
+    def __init__(self, enc_alg, aad, iv, key):
+        super().__init__(enc_alg, aad, iv, key)
+        self.unpad = PKCS7(AES.block_size).unpadder()
+        self.dec = self.cipher.decryptor()
+
+    def update(self, data):
+        self.mac.update(data)
+        return self.unpad.update(self.dec.update(data))
+
+    def finalize(self, tag):
+        if not hmac.compare_digest(self.get_tag(), tag):
+            raise InvalidTag()
+        return self.unpad.update(self.dec.finalize()) + self.unpad.finalize()
 
 
 class GCMEncAlgorithm(JWEEncAlgorithm):
     # Use of an IV of size 96 bits is REQUIRED with this algorithm.
     # https://tools.ietf.org/html/rfc7518#section-5.3
     IV_SIZE = 96
+    # byte length of the 128-bit authentication tag
+    TAG_SIZE = 16
 
     def __init__(self, key_size):
         self.name = f'A{key_size}GCM'
@@ -111,11 +167,8 @@ class GCMEncAlgorithm(JWEEncAlgorithm):
         :return: (ciphertext, iv, tag)
         """
         self.check_iv(iv)
-        cipher = Cipher(AES(key), GCM(iv), backend=default_backend())
-        enc = cipher.encryptor()
-        enc.authenticate_additional_data(aad)
-        ciphertext = enc.update(msg) + enc.finalize()
-        return ciphertext, enc.tag
+        data = AESGCM(key).encrypt(iv, msg, aad)
+        return data[:-self.TAG_SIZE], data[-self.TAG_SIZE:]
 
     def decrypt(self, ciphertext, aad, iv, tag, key):
         """Key Decryption with AES GCM
@@ -128,10 +181,45 @@ class GCMEncAlgorithm(JWEEncAlgorithm):
         :return: message
         """
         self.check_iv(iv)
-        cipher = Cipher(AES(key), GCM(iv, tag), backend=default_backend())
-        d = cipher.decryptor()
-        d.authenticate_additional_data(aad)
-        return d.update(ciphertext) + d.finalize()
+        # the tag must not borrow bytes from the ciphertext
+        if len(tag) != self.TAG_SIZE:
+            raise InvalidTag()
+        return AESGCM(key).decrypt(iv, ciphertext + tag, aad)
+
+    def encryptor(self, aad, iv, key):
+        self.check_iv(iv)
+        cipher = Cipher(AES(key), GCM(iv))
+        return _GCMEncryptor(cipher.encryptor(), aad)
+
+    def decryptor(self, aad, iv, key):
+        self.check_iv(iv)
+        cipher = Cipher(AES(key), GCM(iv))
+        return _GCMDecryptor(cipher.decryptor(), aad)
+
+
+class _GCMEncryptor:
+    def __init__(self, enc, aad):
+        enc.authenticate_additional_data(aad)
+        self.enc = enc
+
+    def update(self, data):
+        return self.enc.update(data)
+
+    def finalize(self):
+        ciphertext = self.enc.finalize()
+        return ciphertext, self.enc.tag
+
+
+class _GCMDecryptor:
+    def __init__(self, dec, aad):
+        dec.authenticate_additional_data(aad)
+        self.dec = dec
+
+    def update(self, data):
+        return self.dec.update(data)
+
+    def finalize(self, tag):
+        return self.dec.finalize_with_tag(tag)
 
 
 JWE_ENC_ALGORITHMS = [
@@ -1,20 +1,88 @@
 import zlib
+from ..errors import DecodeError
 from ..rfc7516 import JWEZipAlgorithm, JsonWebEncryption
 
 
 class DeflateZipAlgorithm(JWEZipAlgorithm):
+    """DEFLATE compression of JWE payload. Decompressed payload is limited
+    to ``max_size`` bytes, inflation stops as soon as the limit is exceeded.
+    Register another instance to change the options::
+
+        JsonWebEncryption.register_algorithm(
+            DeflateZipAlgorithm(level=9, max_size=50 * 1024 * 1024))
+
+    The limit can also be changed for one ``JsonWebEncryption`` instance
+    with its ``max_decompressed_size`` parameter.
+
+    :param level: compression level from 0 to 9, -1 means the default level
+    :param max_size: maximum bytes of decompressed payload, ``None`` means
+        no limit
+    """
     name = 'DEF'
     description = 'DEFLATE'
 
+    #: default maximum bytes of decompressed payload
+    DEFAULT_MAX_SIZE = 10 * 1024 * 1024
+
+    def __init__(self, level=zlib.Z_DEFAULT_COMPRESSION, max_size=DEFAULT_MAX_SIZE):
+        self.level = level
+        self.max_size = max_size
+
     def compress(self, s):
         """Compress bytes data with DEFLATE algorithm."""
-        data = zlib.compress(s)
-        # drop gzip headers and tail
-        return data[2:-4]
+        c = self.compressobj()
+        return c.compress(s) + c.flush()
+
+    def decompress(self, s, max_size=None):
+        """Decompress DEFLATE bytes data, ``max_size`` overrides the maximum
+        bytes of decompressed data of this instance.
+        """
+        d = self.decompressobj(max_size)
+        data = d.decompress(s) + d.flush()
+        if not d.eof:
+            raise DecodeError('Incomplete compressed data')
+        return data
+
+    def compressobj(self):
+        """Create a raw DEFLATE compressor for streaming."""
+        return zlib.compressobj(self.level, zlib.DEFLATED, -zlib.MAX_WBITS)
+
+    def decompressobj(self, max_size=None):
+        """Create a raw DEFLATE decompressor for streaming, which raises
+        :class:`~authlib.jose.errors.DecodeError` when the decompressed
+        data exceeds ``max_size``.
+        """
+        if max_size is None:
+            max_size = self.max_size
+        return _LimitedDecompressor(max_size)
+
+
+class _LimitedDecompressor:
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.size = 0
+        self._d = zlib.decompressobj(-zlib.MAX_WBITS)
+
+    @property
+    def eof(self):
+        return self._d.eof
+
+    def _check(self, data):
+        self.size += len(data)
+        if self.size > self.max_size or self._d.unconsumed_tail:
+            raise DecodeError('Decompressed data exceeds the maximum size')
+        return data
+
+    def decompress(self, data):
+        if self.max_size is None:
+            return self._d.decompress(data)
+        # inflate at most one byte more than the remaining size
+        return self._check(self._d.decompress(data, self.max_size - self.size + 1))
 
-    def decompress(self, s):
-        """Decompress DEFLATE bytes data."""
-        return zlib.decompress(s, -zlib.MAX_WBITS)
+    def flush(self):
+        if self.max_size is None:
+            return self._d.flush()
+        return self._check(self._d.flush())
 
 
 def register_jwe_rfc7518():
@@ -50,7 +50,7 @@ class OctKey(Key):
         self._dict_data = {'kty': self.kty, 'k': k}
 
     def as_dict(self, is_private=False, **params):
-        tokens = self.tokens
+        tokens = self.tokens.copy()
         if 'kid' not in tokens:
             tokens['kid'] = self.thumbprint()
 
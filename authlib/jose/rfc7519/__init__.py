@@ -8,8 +8,11 @@
     https://tools.ietf.org/html/rfc7519
 """
 
-from .jwt import JsonWebToken
-from .claims import BaseClaims, JWTClaims
+from .jwt import JsonWebToken, JWTDecoder
+from .claims import BaseClaims, JWTClaims, ClaimsOptions
 
 
-__all__ = ['JsonWebToken', 'BaseClaims', 'JWTClaims']
+__all__ = [
+    'JsonWebToken', 'JWTDecoder',
+    'BaseClaims', 'JWTClaims', 'ClaimsOptions',
+]
@@ -7,6 +7,73 @@ from authlib.jose.errors import (
 )
 
 
+class ClaimRule:
+    """The compiled validation rule of a single claim option."""
+    __slots__ = ('value', 'values', 'value_set', 'validate')
+
+    def __init__(self, option):
+        self.value = option.get('value')
+        self.values = option.get('values')
+        self.validate = option.get('validate')
+
+        value_set = None
+        # a str of values is matched by substring, like a plain option
+        if self.values and not isinstance(self.values, (str, bytes)):
+            try:
+                value_set = frozenset(self.values)
+            except TypeError:
+                pass
+        self.value_set = value_set
+
+    def contains(self, value):
+        if self.value_set is not None:
+            try:
+                return value in self.value_set
+            except TypeError:
+                pass
+        return value in self.values
+
+    def check(self, claims, value):
+        if self.value and value != self.value:
+            return False
+        if self.values and not self.contains(value):
+            return False
+        if self.validate and not self.validate(claims, value):
+            return False
+        return True
+
+
+class ClaimsOptions(dict):
+    """Claims options compiled into a validation plan. Compile the
+    options once and reuse them for every token, instead of passing a
+    plain dict to each ``decode`` call::
+
+        options = ClaimsOptions({
+            "iss": {"essential": True, "values": ["https://example.com"]},
+        })
+        claims = jwt.decode(s, key, claims_options=options)
+
+    The compiled options are read-only.
+    """
+    def __init__(self, options=None):
+        super().__init__(options or {})
+        self.essential_claims = tuple(
+            k for k, option in self.items() if option.get('essential'))
+        self.rules = {k: ClaimRule(option) for k, option in self.items() if option}
+
+    @classmethod
+    def create(cls, options):
+        if isinstance(options, cls):
+            return options
+        return cls(options)
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError('ClaimsOptions is read-only')
+
+    __setitem__ = __delitem__ = _readonly
+    update = setdefault = pop = popitem = clear = _readonly
+
+
 class BaseClaims(dict):
     """Payload claims for JWT, which contains a validate interface.
 
@@ -52,15 +119,28 @@ class BaseClaims(dict):
             raise error
 
     def _validate_essential_claims(self):
-        for k in self.options:
-            if self.options[k].get('essential'):
-                if k not in self:
-                    raise MissingClaimError(k)
-                elif not self.get(k):
-                    raise InvalidClaimError(k)
+        options = self.options
+        if isinstance(options, ClaimsOptions):
+            essential_claims = options.essential_claims
+        else:
+            essential_claims = [k for k in options if options[k].get('essential')]
+
+        for k in essential_claims:
+            if k not in self:
+                raise MissingClaimError(k)
+            elif not self.get(k):
+                raise InvalidClaimError(k)
 
     def _validate_claim_value(self, claim_name):
-        option = self.options.get(claim_name)
+        options = self.options
+        if isinstance(options, ClaimsOptions):
+            rule = options.rules.get(claim_name)
+            if rule is not None and not rule.check(self, self.get(claim_name)):
+                raise InvalidClaimError(claim_name)
+            return
+
+        # plain dict options are used once, there is nothing to compile
+        option = options.get(claim_name)
         if not option:
             return
 
@@ -140,14 +220,23 @@ class JWTClaims(BaseClaims):
         interpretation of audience values is generally application specific.
         Use of this claim is OPTIONAL.
         """
-        aud_option = self.options.get('aud')
         aud = self.get('aud')
-        if not aud_option or not aud:
+        if not aud:
             return
 
-        aud_values = aud_option.get('values')
+        options = self.options
+        if isinstance(options, ClaimsOptions):
+            rule = options.rules.get('aud')
+            if rule is None:
+                return
+            aud_value, aud_values = rule.value, rule.values
+        else:
+            option = options.get('aud')
+            if not option:
+                return
+            aud_value, aud_values = option.get('value'), option.get('values')
+
         if not aud_values:
-            aud_value = aud_option.get('value')
             if aud_value:
                 aud_values = [aud_value]
 
@@ -6,11 +6,11 @@ from authlib.common.encoding import (
     to_bytes, to_unicode,
     json_loads, json_dumps,
 )
-from .claims import JWTClaims
-from ..errors import DecodeError, InsecureClaimError
+from .claims import JWTClaims, ClaimsOptions
+from ..errors import JoseError, DecodeError, InsecureClaimError
 from ..rfc7515 import JsonWebSignature
 from ..rfc7516 import JsonWebEncryption
-from ..rfc7517 import KeySet, Key
+from ..rfc7517 import KeySet, Key, KeyResolver
 
 
 class JsonWebToken:
@@ -29,6 +29,12 @@ class JsonWebToken:
         self._jws = JsonWebSignature(algorithms, private_headers=private_headers)
         self._jwe = JsonWebEncryption(algorithms, private_headers=private_headers)
 
+    def enable_prepared_key_cache(self, maxsize=128, ttl=None):
+        """Cache the keys prepared for signing and verifying JWS tokens,
+        see :meth:`JsonWebSignature.enable_prepared_key_cache`.
+        """
+        self._jws.enable_prepared_key_cache(maxsize=maxsize, ttl=ttl)
+
     def check_sensitive_data(self, payload):
         """Check if payload contains sensitive information."""
         for k in payload:
@@ -104,6 +110,127 @@ class JsonWebToken:
             params=claims_params,
         )
 
+    def decode_many(self, tokens, key, claims_cls=None, claims_options=None,
+                    claims_params=None, executor=None):
+        """Decode many JWTs with the given key. Unlike :meth:`decode`, it
+        will not raise on the first failure, instead it returns a list of
+        ``(claims, error)`` pairs in the order of ``tokens``, one of them
+        is always ``None``. Signed tokens are verified with
+        :meth:`JsonWebSignature.verify_batch`, keys are resolved only once
+        per ``alg`` and ``kid``.
+
+        :param tokens: a list of JWT texts
+        :param key: key used to verify the signature
+        :param claims_cls: class to be used for JWT claims
+        :param claims_options: `options` parameters for claims_cls
+        :param claims_params: `params` parameters for claims_cls
+        :param executor: an optional ``concurrent.futures.Executor`` to
+            verify signatures in parallel
+        :return: list of ``(claims_cls instance, error)``
+        """
+        if claims_cls is None:
+            claims_cls = JWTClaims
+        if not callable(key):
+            key = KeyResolver(prepare_raw_key(key))
+        claims_options = ClaimsOptions.create(claims_options)
+
+        results = []
+        jws_tokens = []
+        jws_positions = []
+        for s in tokens:
+            s = to_bytes(s)
+            dot_count = s.count(b'.')
+            if dot_count == 2:
+                jws_positions.append(len(results))
+                jws_tokens.append(s)
+                results.append(None)
+            elif dot_count == 4:
+                try:
+                    claims = self.decode(
+                        s, key, claims_cls, claims_options, claims_params)
+                    results.append((claims, None))
+                except (JoseError, ValueError) as error:
+                    results.append((None, error))
+            else:
+                results.append((None, DecodeError('Invalid input segments length')))
+
+        outcomes = self._jws.verify_batch(
+            jws_tokens, key, decode_payload, executor=executor)
+        for i, (data, error) in zip(jws_positions, outcomes):
+            if error is not None:
+                results[i] = (None, error)
+            else:
+                claims = claims_cls(
+                    data['payload'], data['header'],
+                    options=claims_options,
+                    params=claims_params,
+                )
+                results[i] = (claims, None)
+        return results
+
+    def create_decoder(self, key, claims_cls=None,
+                       claims_options=None, claims_params=None):
+        """Create a reusable :class:`JWTDecoder` with the given key and
+        claims settings, see :class:`JWTDecoder`.
+        """
+        return JWTDecoder(
+            self, key,
+            claims_cls=claims_cls,
+            claims_options=claims_options,
+            claims_params=claims_params,
+        )
+
+
+class JWTDecoder:
+    """A reusable JWT decoder. The key is resolved with a
+    :class:`~authlib.jose.KeyResolver` and the claims options are
+    compiled into :class:`ClaimsOptions` only once, when the decoder is
+    created::
+
+        decoder = jwt.create_decoder(jwks, claims_options={
+            "iss": {"essential": True, "value": "https://example.com"},
+        })
+
+        # reuse it for every token
+        claims = decoder.decode(token)
+        claims.validate()
+
+    :param jwt: JsonWebToken instance
+    :param key: key used to verify the signature
+    :param claims_cls: class to be used for JWT claims
+    :param claims_options: `options` parameters for claims_cls
+    :param claims_params: `params` parameters for claims_cls
+    """
+    def __init__(self, jwt, key, claims_cls=None,
+                 claims_options=None, claims_params=None):
+        if not callable(key):
+            key = KeyResolver(prepare_raw_key(key))
+        if claims_cls is None:
+            claims_cls = JWTClaims
+
+        self.jwt = jwt
+        self.load_key = key
+        self.claims_cls = claims_cls
+        self.claims_options = ClaimsOptions.create(claims_options)
+        self.claims_params = claims_params
+
+    def decode(self, s, claims_params=None):
+        """Decode the JWT, the same as :meth:`JsonWebToken.decode`.
+
+        :param s: text of JWT
+        :param claims_params: overwrite the default ``claims_params``
+        :return: claims_cls instance
+        :raise: BadSignatureError
+        """
+        if claims_params is None:
+            claims_params = self.claims_params
+        return self.jwt.decode(
+            s, self.load_key,
+            claims_cls=self.claims_cls,
+            claims_options=self.claims_options,
+            claims_params=claims_params,
+        )
+
 
 def decode_payload(bytes_payload):
     try:
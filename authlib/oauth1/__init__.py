@@ -13,6 +13,9 @@ from .rfc5849 import (
     TemporaryCredential,
     AuthorizationServer,
     ResourceProtector,
+    NonceStore,
+    MemoryNonceStore,
+    CacheNonceStore,
 )
 
 __all__ = [
@@ -31,4 +34,7 @@ __all__ = [
     'TemporaryCredential',
     'AuthorizationServer',
     'ResourceProtector',
+    'NonceStore',
+    'MemoryNonceStore',
+    'CacheNonceStore',
 ]
@@ -1,5 +1,5 @@
 from authlib.common.urls import (
-    url_decode,
+    url_decode_dict,
     add_params_to_uri,
     urlparse,
 )
@@ -132,7 +132,7 @@ class OAuth1Client:
                     back from the OAuth provider to you, the client.
         :returns: A dict of parameters extracted from the URL.
         """
-        token = dict(url_decode(urlparse.urlparse(url).query))
+        token = url_decode_dict(urlparse.urlparse(url).query)
         self.token = token
         return token
 
@@ -156,7 +156,7 @@ class OAuth1Client:
             if text.startswith('{'):
                 token = json_loads(text)
             else:
-                token = dict(url_decode(text))
+                token = url_decode_dict(text)
         except (TypeError, ValueError) as e:
             error = (
                 "Unable to decode token from token response. "
@@ -25,6 +25,7 @@ from .models import (
 )
 from .authorization_server import AuthorizationServer
 from .resource_protector import ResourceProtector
+from .nonce import NonceStore, MemoryNonceStore, CacheNonceStore
 
 __all__ = [
     'OAuth1Request',
@@ -42,4 +43,7 @@ __all__ = [
     'TemporaryCredential',
     'AuthorizationServer',
     'ResourceProtector',
+    'NonceStore',
+    'MemoryNonceStore',
+    'CacheNonceStore',
 ]
@@ -0,0 +1,129 @@
+import time
+import threading
+
+
+class NonceStore:
+    """A nonce store records the used ``oauth_nonce`` values, and tells
+    if a nonce has been used, in one atomic operation. Its
+    :meth:`exists_nonce` method can be registered as the ``exists_nonce``
+    hook of Flask servers directly::
+
+        store = MemoryNonceStore(expires_in=server.EXPIRY_TIME)
+        server.register_hook('exists_nonce', store.exists_nonce)
+
+    A nonce only needs to be remembered while its timestamp is accepted by
+    the server, ``expires_in`` should be the ``EXPIRY_TIME`` of the server.
+    A timestamp more than ``expires_in`` seconds in the future is treated
+    as a used nonce, so that it can not be remembered for too long.
+
+    :param expires_in: seconds to remember a nonce after its timestamp
+    """
+    def __init__(self, expires_in=300):
+        self.expires_in = expires_in
+
+    @staticmethod
+    def create_key(nonce, timestamp, client_id, oauth_token):
+        key = f'{nonce}-{timestamp}-{client_id}'
+        if oauth_token:
+            key = f'{key}-{oauth_token}'
+        return key
+
+    def exists_nonce(self, nonce, timestamp, client_id, oauth_token):
+        """Check if the nonce has been used with the same timestamp, client
+        and token. The nonce is saved if it is not used.
+
+        :return: Boolean
+        """
+        key = self.create_key(nonce, timestamp, client_id, oauth_token)
+        try:
+            timestamp = int(timestamp)
+        except (TypeError, ValueError):
+            timestamp = int(time.time())
+        return not self.add(key, timestamp)
+
+    def add(self, key, timestamp):
+        """Save the key if it does not exist.
+
+        :param key: a string of nonce, timestamp, client and token
+        :param timestamp: an integer of ``oauth_timestamp``
+        :return: ``True`` if the key is saved, ``False`` if it exists
+        """
+        raise NotImplementedError()
+
+
+class MemoryNonceStore(NonceStore):
+    """A nonce store in memory. Nonces are grouped into buckets by their
+    timestamps, a bucket is dropped as a whole when all of its timestamps
+    are older than ``expires_in``, so the memory is bounded by the nonces
+    in the accepted timestamp window.
+
+    :param expires_in: seconds to remember a nonce after its timestamp
+    :param bucket_size: seconds of timestamps in each bucket
+    """
+    def __init__(self, expires_in=300, bucket_size=10):
+        super().__init__(expires_in)
+        self.bucket_size = bucket_size
+        self._buckets = {}
+        self._oldest = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return sum(len(keys) for keys in self._buckets.values())
+
+    def add(self, key, timestamp):
+        now = time.time()
+        if timestamp > now + self.expires_in:
+            return False
+
+        oldest = int(now - self.expires_in) // self.bucket_size
+        bucket_id = timestamp // self.bucket_size
+        with self._lock:
+            if oldest != self._oldest:
+                self._oldest = oldest
+                for i in [i for i in self._buckets if i < oldest]:
+                    del self._buckets[i]
+
+            if bucket_id < oldest:
+                # it is too old to tell if it was used
+                return False
+
+            keys = self._buckets.get(bucket_id)
+            if keys is None:
+                keys = self._buckets[bucket_id] = set()
+            elif key in keys:
+                return False
+            keys.add(key)
+            return True
+
+
+class CacheNonceStore(NonceStore):
+    """A nonce store on a cache system, which is shared among processes.
+    The atomic ``add`` method of the cache, e.g. cachelib and Django cache,
+    is used to check and save a nonce in one call. Caches without ``add``
+    fall back to ``get`` and ``set``.
+
+    :param cache: a cache instance
+    :param key_prefix: prefix of cache keys
+    :param expires_in: seconds to remember a nonce after its timestamp
+    """
+    def __init__(self, cache, key_prefix='nonce:', expires_in=300):
+        super().__init__(expires_in)
+        self.cache = cache
+        self.key_prefix = key_prefix
+
+    def add(self, key, timestamp):
+        now = time.time()
+        if timestamp > now + self.expires_in:
+            return False
+
+        # remember it until the timestamp is out of the accepted window,
+        # which is at most 2 * expires_in for a timestamp in the future
+        key = self.key_prefix + key
+        timeout = max(int(timestamp + self.expires_in - now), 1)
+        if hasattr(self.cache, 'add'):
+            return bool(self.cache.add(key, 1, timeout))
+
+        if self.cache.get(key):
+            return False
+        self.cache.set(key, 1, timeout)
+        return True
@@ -11,6 +11,7 @@ import hashlib
 import hmac
 from authlib.common.urls import urlparse
 from authlib.common.encoding import to_unicode, to_bytes
+from authlib.common.cache import LRUCache
 from .util import escape, unescape
 
 SIGNATURE_HMAC_SHA1 = "HMAC-SHA1"
@@ -21,6 +22,9 @@ SIGNATURE_TYPE_HEADER = 'HEADER'
 SIGNATURE_TYPE_QUERY = 'QUERY'
 SIGNATURE_TYPE_BODY = 'BODY'
 
+# base string URIs of endpoints
+_base_string_uri_cache = LRUCache(maxsize=256)
+
 
 def construct_base_string(method, uri, params, host=None):
     """Generate signature base string from request, per `Section 3.4.1`_.
@@ -63,18 +67,19 @@ def construct_base_string(method, uri, params, host=None):
             continue
 
         # ensure oauth params are unescaped
-        if k.startswith('oauth_'):
+        if k.startswith('oauth_') and '%' in v:
             v = unescape(v)
         unescaped_params.append((k, v))
 
     # Normalize parameters per Section 3.4.1.3.2
     normalized_params = normalize_parameters(unescaped_params)
 
-    # construct base string
+    # construct base string, the normalized parameters contain only
+    # unreserved characters, "%", "=" and "&", which are escaped directly
     return '&'.join([
         escape(method.upper()),
         escape(base_string_uri),
-        escape(normalized_params),
+        normalized_params.replace('%', '%25').replace('=', '%3D').replace('&', '%26'),
     ])
 
 
@@ -99,7 +104,18 @@ def normalize_base_string_uri(uri, host=None):
 
     The host argument overrides the netloc part of the uri argument.
     """
-    uri = to_unicode(uri)
+    # query and fragment are not a part of base string URI, the result of
+    # the other parts is cached for each endpoint
+    uri = to_unicode(uri).split('#', 1)[0].split('?', 1)[0]
+    key = (uri, host)
+    rv = _base_string_uri_cache.get(key)
+    if rv is None:
+        rv = _normalize_base_string_uri(uri, host)
+        _base_string_uri_cache.set(key, rv)
+    return rv
+
+
+def _normalize_base_string_uri(uri, host):
     scheme, netloc, path, params, query, fragment = urlparse.urlparse(uri)
 
     # The scheme, authority, and path of the request resource URI `RFC3986`
@@ -1,7 +1,10 @@
+from urllib.parse import quote as _quote
 from authlib.common.urls import quote, unquote
 
 
 def escape(s):
+    if isinstance(s, str):
+        return _quote(s, safe='~')
     return quote(s, safe=b'~')
 
 
@@ -1,6 +1,12 @@
 from .base import OAuth2Error
 from .auth import ClientAuth, TokenAuth
 from .client import OAuth2Client
+from .token_store import (
+    TokenStore,
+    MemoryTokenStore,
+    FileTokenStore,
+    CacheTokenStore,
+)
 from .rfc6749 import (
     OAuth2Request,
     JsonRequest,
@@ -11,6 +17,7 @@ from .rfc6749 import (
 
 __all__ = [
     'OAuth2Error', 'ClientAuth', 'TokenAuth', 'OAuth2Client',
+    'TokenStore', 'MemoryTokenStore', 'FileTokenStore', 'CacheTokenStore',
     'OAuth2Request', 'JsonRequest', 'AuthorizationServer',
     'ClientAuthentication', 'ResourceProtector',
 ]
@@ -1,5 +1,9 @@
+import time
+import hashlib
+import logging
+import threading
 from authlib.common.security import generate_token
-from authlib.common.urls import url_decode
+from authlib.common.urls import url_decode_dict
 from .rfc6749.parameters import (
     prepare_grant_uri,
     prepare_token_request,
@@ -7,10 +11,13 @@ from .rfc6749.parameters import (
     parse_implicit_response,
 )
 from .rfc7009 import prepare_revoke_token_request
+from .rfc6749.wrappers import OAuth2Token
 from .rfc7636 import create_s256_code_challenge
 from .auth import TokenAuth, ClientAuth
 from .base import OAuth2Error
 
+log = logging.getLogger(__name__)
+
 DEFAULT_HEADERS = {
     'Accept': 'application/json',
     'Content-Type': 'application/x-www-form-urlencoded;charset=UTF-8'
@@ -41,6 +48,12 @@ class OAuth2Client:
     :param leeway: Time window in seconds before the actual expiration of the
         authentication token, that the token is considered expired and will
         be refreshed.
+    :param refresh_ahead: Time window in seconds before ``leeway``, that the
+        token will be refreshed in a background thread, while requests keep
+        using the current token. A failed background refresh is retried
+        after ``refresh_retry_interval`` seconds.
+    :param token_store: A :class:`~authlib.oauth2.token_store.TokenStore` to
+        share tokens of ``client_credentials`` grant among processes.
     """
     client_auth_class = ClientAuth
     token_auth_class = TokenAuth
@@ -51,12 +64,15 @@ class OAuth2Client:
     )
     SESSION_REQUEST_PARAMS = []
 
+    #: seconds to wait before retrying a failed background refresh
+    refresh_retry_interval = 30
+
     def __init__(self, session, client_id=None, client_secret=None,
                  token_endpoint_auth_method=None,
                  revocation_endpoint_auth_method=None,
                  scope=None, state=None, redirect_uri=None, code_challenge_method=None,
                  token=None, token_placement='header', update_token=None, leeway=60,
-                 **metadata):
+                 refresh_ahead=None, token_store=None, **metadata):
 
         self.session = session
         self.client_id = client_id
@@ -102,6 +118,12 @@ class OAuth2Client:
         self._auth_methods = {}
 
         self.leeway = leeway
+        self.refresh_ahead = refresh_ahead
+        self.token_store = token_store
+
+        # only one thread refreshes the token, others wait for it
+        self._refresh_lock = threading.Lock()
+        self._refresh_failed_at = None
 
     def register_client_auth_method(self, auth):
         """Extend client authenticate for token endpoint.
@@ -214,6 +236,12 @@ class OAuth2Client:
         if url is None:
             url = self.metadata.get('token_endpoint')
 
+        if self.token_store is not None and grant_type == 'client_credentials':
+            return self._fetch_shared_token(
+                url, body=body, auth=auth, method=method,
+                headers=headers, **session_kwargs
+            )
+
         return self._fetch_token(
             url, body=body, auth=auth, method=method,
             headers=headers, **session_kwargs
@@ -270,7 +298,19 @@ class OAuth2Client:
         if token is None:
             token = self.token
         if not token.is_expired(leeway=self.leeway):
+            if self.refresh_ahead and token.is_expired(leeway=self.leeway + self.refresh_ahead):
+                self._start_background_refresh(token)
             return True
+
+        with self._refresh_lock:
+            # the token may have been refreshed while waiting for the lock
+            current = self.token
+            if current is not token and current and \
+                    not current.is_expired(leeway=self.leeway):
+                return True
+            return self._refresh_expired_token(token)
+
+    def _refresh_expired_token(self, token):
         refresh_token = token.get('refresh_token')
         url = self.metadata.get('token_endpoint')
         if refresh_token and url:
@@ -283,6 +323,39 @@ class OAuth2Client:
                 self.update_token(new_token, access_token=access_token)
             return True
 
+    def _can_refresh(self, token):
+        if token.get('refresh_token') and self.metadata.get('token_endpoint'):
+            return True
+        return self.metadata.get('grant_type') == 'client_credentials'
+
+    def _start_background_refresh(self, token):
+        if not self._can_refresh(token):
+            return
+
+        failed_at = self._refresh_failed_at
+        if failed_at is not None and time.time() - failed_at < self.refresh_retry_interval:
+            return
+
+        if not self._refresh_lock.acquire(blocking=False):
+            # a refresh is in progress
+            return
+
+        def refresh():
+            try:
+                if self.token is token:
+                    if self._refresh_expired_token(token):
+                        self._refresh_failed_at = None
+                    else:
+                        self._refresh_failed_at = time.time()
+            except Exception:
+                self._refresh_failed_at = time.time()
+                log.warning('Failed to refresh token in background', exc_info=True)
+            finally:
+                self._refresh_lock.release()
+
+        thread = threading.Thread(target=refresh, daemon=True)
+        thread.start()
+
     def revoke_token(self, url, token=None, token_type_hint=None,
                      body=None, auth=None, headers=None, **kwargs):
         """Revoke token method defined via `RFC7009`_.
@@ -364,7 +437,7 @@ class OAuth2Client:
 
         if method.upper() == 'POST':
             resp = self.session.post(
-                url, data=dict(url_decode(body)),
+                url, data=url_decode_dict(body),
                 headers=headers, auth=auth, **kwargs)
         else:
             if '?' in url:
@@ -378,6 +451,44 @@ class OAuth2Client:
 
         return self.parse_response_token(resp)
 
+    def _fetch_shared_token(self, url, body='', **kwargs):
+        store = self.token_store
+        key = self._get_token_store_key(url, body)
+        token = self._load_shared_token(key)
+        if token is not None:
+            return token
+
+        lock = store.acquire_lock(key)
+        try:
+            # another process may have fetched the token while waiting
+            token = self._load_shared_token(key)
+            if token is not None:
+                return token
+            token = self._fetch_token(url, body=body, **kwargs)
+            if token.get('expires_at'):
+                store.save_token(key, token)
+            return token
+        finally:
+            if lock is not None:
+                store.release_lock(lock)
+
+    def _load_shared_token(self, key):
+        return self._use_shared_token(self.token_store.get_token(key))
+
+    def _use_shared_token(self, token):
+        # a token without expires_at would be shared forever
+        if not token or not token.get('expires_at'):
+            return None
+        token = OAuth2Token.from_dict(dict(token))
+        if token.is_expired(leeway=self.leeway):
+            return None
+        self.token = token
+        return self.token
+
+    def _get_token_store_key(self, url, body):
+        value = '\n'.join([url or '', self.client_id or '', body or ''])
+        return hashlib.sha256(value.encode('utf-8')).hexdigest()
+
     def _refresh_token(self, url, refresh_token=None, body='', headers=None,
                        auth=None, **kwargs):
         resp = self._http_post(url, body=body, auth=auth, headers=headers, **kwargs)
@@ -435,7 +546,7 @@ class OAuth2Client:
 
     def _http_post(self, url, body=None, auth=None, headers=None, **kwargs):
         return self.session.post(
-            url, data=dict(url_decode(body)),
+            url, data=url_decode_dict(body),
             headers=headers, auth=auth, **kwargs)
 
 
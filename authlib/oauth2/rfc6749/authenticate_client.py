@@ -37,9 +37,10 @@ class ClientAuthentication:
         self._methods[method] = func
 
     def authenticate(self, request, methods, endpoint):
+        query_client = _memoize_query_client(self.query_client, request)
         for method in methods:
             func = self._methods[method]
-            client = func(self.query_client, request)
+            client = func(query_client, request)
             if client and client.check_endpoint_auth_method(method, endpoint):
                 request.auth_method = method
                 return client
@@ -92,6 +93,22 @@ def authenticate_none(query_client, request):
     log.debug(f'Authenticate {client_id} via "none" failed')
 
 
+def _memoize_query_client(query_client, request):
+    # each client is queried only once in one request, no matter how
+    # many authentication methods are tried
+    clients = getattr(request, '_queried_clients', None)
+    if clients is None:
+        return query_client
+
+    def query_request_client(client_id):
+        if client_id in clients:
+            return clients[client_id]
+        client = query_client(client_id)
+        clients[client_id] = client
+        return client
+    return query_request_client
+
+
 def _validate_client(query_client, client_id, state=None, status_code=400):
     if client_id is None:
         raise InvalidClientError(state=state, status_code=status_code)
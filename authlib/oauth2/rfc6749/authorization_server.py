@@ -1,6 +1,8 @@
+from authlib.common.cache import LRUCache
 from authlib.common.errors import ContinueIteration
 from .authenticate_client import ClientAuthentication
 from .requests import OAuth2Request, JsonRequest
+from .grants.base import AuthorizationEndpointMixin, TokenEndpointMixin
 from .errors import (
     OAuth2Error,
     InvalidScopeError,
@@ -16,12 +18,23 @@ class AuthorizationServer:
 
     :param scopes_supported: A list of supported scopes by this authorization server.
     """
+    #: process-wide cache of clients, see :meth:`enable_client_cache`
+    client_cache = None
+
     def __init__(self, scopes_supported=None):
         self.scopes_supported = scopes_supported
         self._token_generators = {}
         self._client_auth = None
-        self._authorization_grants = []
-        self._token_grants = []
+        self._authorization_registry = _GrantRegistry(
+            'check_authorization_endpoint',
+            AuthorizationEndpointMixin.check_authorization_endpoint,
+        )
+        self._token_registry = _GrantRegistry(
+            'check_token_endpoint',
+            TokenEndpointMixin.check_token_endpoint,
+        )
+        self._authorization_grants = self._authorization_registry.grants
+        self._token_grants = self._token_registry.grants
         self._endpoints = {}
 
     def query_client(self, client_id):
@@ -35,6 +48,44 @@ class AuthorizationServer:
         """Define function to save the generated token into database."""
         raise NotImplementedError()
 
+    def enable_client_cache(self, maxsize=1024, ttl=60):
+        """Cache clients returned by :meth:`query_client` in memory, so
+        that client authentication will not query the database for every
+        request::
+
+            authorization_server.enable_client_cache(maxsize=1024, ttl=60)
+
+        Cached clients are shared among requests and threads, they MUST NOT
+        be bound to a database session. When a client is updated or
+        deleted, call :meth:`discard_cached_client`.
+
+        :param maxsize: maximum number of cached clients
+        :param ttl: seconds to keep a client in the cache
+        """
+        self.client_cache = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    def discard_cached_client(self, client_id):
+        """Remove a client from the cache, e.g. when its secret is
+        changed or when it is deleted.
+        """
+        if self.client_cache is not None:
+            self.client_cache.delete(client_id)
+
+    def query_cached_client(self, client_id):
+        """Query client by client_id via :meth:`query_client`, with the
+        client cache if it is enabled.
+        """
+        cache = self.client_cache
+        if cache is None:
+            return self.query_client(client_id)
+
+        client = cache.get(client_id)
+        if client is None:
+            client = self.query_client(client_id)
+            if client:
+                cache.set(client_id, client)
+        return client
+
     def generate_token(self, grant_type, client, user=None, scope=None,
                        expires_in=None, include_refresh_token=True):
         """Generate the token dict.
@@ -89,7 +140,7 @@ class AuthorizationServer:
         methods, such as ``client_secret_basic``, ``client_secret_post``.
         """
         if self._client_auth is None and self.query_client:
-            self._client_auth = ClientAuthentication(self.query_client)
+            self._client_auth = ClientAuthentication(self.query_cached_client)
         return self._client_auth(request, methods, endpoint)
 
     def register_client_auth_method(self, method, func):
@@ -115,7 +166,7 @@ class AuthorizationServer:
                 'custom', authenticate_client_via_custom)
         """
         if self._client_auth is None and self.query_client:
-            self._client_auth = ClientAuthentication(self.query_client)
+            self._client_auth = ClientAuthentication(self.query_cached_client)
 
         self._client_auth.register(method, func)
 
@@ -171,13 +222,19 @@ class AuthorizationServer:
 
             authorization_server.register_grant(AuthorizationCodeGrant)
 
+        Grants are indexed by ``RESPONSE_TYPES`` and ``GRANT_TYPE`` when
+        they are registered, unless they re-implement the
+        ``check_authorization_endpoint`` or ``check_token_endpoint`` methods.
+
         :param grant_cls: a grant class.
         :param extensions: extensions for the grant class.
         """
         if hasattr(grant_cls, 'check_authorization_endpoint'):
-            self._authorization_grants.append((grant_cls, extensions))
+            keys = getattr(grant_cls, 'RESPONSE_TYPES', ())
+            self._authorization_registry.register(grant_cls, extensions, keys)
         if hasattr(grant_cls, 'check_token_endpoint'):
-            self._token_grants.append((grant_cls, extensions))
+            keys = [getattr(grant_cls, 'GRANT_TYPE', None)]
+            self._token_registry.register(grant_cls, extensions, keys)
 
     def register_endpoint(self, endpoint):
         """Add extra endpoint to authorization server. e.g.
@@ -201,10 +258,11 @@ class AuthorizationServer:
         :param request: OAuth2Request instance.
         :return: grant instance
         """
-        for (grant_cls, extensions) in self._authorization_grants:
-            if grant_cls.check_authorization_endpoint(request):
-                return _create_grant(grant_cls, extensions, request, self)
-        raise UnsupportedResponseTypeError(request.response_type)
+        response_type = request.response_type
+        rv = self._authorization_registry.find(response_type, request)
+        if rv is None:
+            raise UnsupportedResponseTypeError(response_type)
+        return _create_grant(rv[0], rv[1], request, self)
 
     def get_consent_grant(self, request=None, end_user=None):
         """Validate current HTTP request for authorization page. This page
@@ -224,10 +282,11 @@ class AuthorizationServer:
         :param request: OAuth2Request instance.
         :return: grant instance
         """
-        for (grant_cls, extensions) in self._token_grants:
-            if grant_cls.check_token_endpoint(request):
-                return _create_grant(grant_cls, extensions, request, self)
-        raise UnsupportedGrantTypeError(request.grant_type)
+        grant_type = request.grant_type
+        rv = self._token_registry.find(grant_type, request)
+        if rv is None:
+            raise UnsupportedGrantTypeError(grant_type)
+        return _create_grant(rv[0], rv[1], request, self)
 
     def create_endpoint_response(self, name, request=None):
         """Validate endpoint request and create endpoint response.
@@ -294,6 +353,49 @@ class AuthorizationServer:
         return self.handle_response(*error(self.get_error_uri(request, error)))
 
 
+class _GrantRegistry:
+    """Registered grants of an endpoint. Grants using the default check
+    method are indexed by their response types or grant type, the others
+    are checked one by one, in the order of registration.
+    """
+    def __init__(self, check_name, default_check):
+        self.check_name = check_name
+        self.default_check = getattr(default_check, '__func__', default_check)
+        self.grants = []
+        self._index = {}
+        self._custom_grants = []
+
+    def register(self, grant_cls, extensions, keys):
+        item = (len(self.grants), grant_cls, extensions)
+        self.grants.append((grant_cls, extensions))
+
+        check = getattr(grant_cls, self.check_name)
+        if getattr(check, '__func__', check) is self.default_check:
+            for key in keys:
+                self._index.setdefault(key, []).append(item)
+        else:
+            self._custom_grants.append(item)
+
+    def find(self, key, request):
+        found = None
+        for item in self._index.get(key, ()):
+            # the default check method also validates HTTP method
+            if getattr(item[1], self.check_name)(request):
+                found = item
+                break
+
+        # custom grants registered before the indexed one take precedence
+        for item in self._custom_grants:
+            if found is not None and item[0] > found[0]:
+                break
+            if getattr(item[1], self.check_name)(request):
+                return item[1], item[2]
+
+        if found is not None:
+            return found[1], found[2]
+        return None
+
+
 def _create_grant(grant_cls, extensions, request, server):
     grant = grant_cls(request, server)
     if extensions:
@@ -1,4 +1,5 @@
 from collections import defaultdict
+from types import MappingProxyType
 from typing import DefaultDict
 
 from authlib.common.encoding import json_loads
@@ -23,24 +24,62 @@ class OAuth2Request:
         self.refresh_token = None
         self.credential = None
 
+        # clients queried during this request, keyed by client_id
+        self._queried_clients = {}
+
+    @property
+    def uri(self):
+        return self._uri
+
+    @uri.setter
+    def uri(self, uri):
+        self._uri = uri
         self._parsed_query = None
+        self._args = None
+        self._data = None
+
+    @property
+    def body(self):
+        return self._body
+
+    @body.setter
+    def body(self, body):
+        self._body = body
+        self._form = None
+        self._data = None
 
     @property
     def args(self):
-        if self._parsed_query is None:
-            self._parsed_query = url_decode(urlparse.urlparse(self.uri).query)
-        return dict(self._parsed_query)
+        """A read-only mapping of the query parameters, which is parsed
+        only once.
+        """
+        if self._args is None:
+            if self._parsed_query is None:
+                self._parsed_query = url_decode(urlparse.urlparse(self.uri).query)
+            self._args = MappingProxyType(dict(self._parsed_query))
+        return self._args
 
     @property
     def form(self):
-        return self.body or {}
+        if self._form is None:
+            body = self.body
+            if isinstance(body, dict):
+                self._form = MappingProxyType(body)
+            else:
+                self._form = body or _empty_form
+        return self._form
 
     @property
     def data(self):
-        data = {}
-        data.update(self.args)
-        data.update(self.form)
-        return data
+        """A read-only mapping of query parameters and form data, which
+        is merged only once, unless ``uri`` or ``body`` is reassigned.
+        """
+        if self._data is None:
+            data = {}
+            data.update(self.args)
+            data.update(self.form)
+            self._data = MappingProxyType(data)
+        return self._data
 
     @property
     def datalist(self) -> DefaultDict[str, list]:
@@ -91,6 +130,9 @@ class OAuth2Request:
         return self.data.get('state')
 
 
+_empty_form = MappingProxyType({})
+
+
 class JsonRequest:
     def __init__(self, method, uri, body=None, headers=None):
         self.method = method
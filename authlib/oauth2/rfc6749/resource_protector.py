@@ -6,6 +6,10 @@
 
     .. _`Section 7`: https://tools.ietf.org/html/rfc6749#section-7
 """
+import time
+import hashlib
+from authlib.common.cache import LRUCache, SingleFlight
+from authlib.common.encoding import to_bytes
 from .util import scope_to_list
 from .errors import MissingAuthorizationError, UnsupportedTokenTypeError
 
@@ -16,10 +20,120 @@ class TokenValidator:
     """
     TOKEN_TYPE = 'bearer'
 
+    #: cache of authenticated tokens, it is disabled by default,
+    #: call :meth:`enable_token_cache` to enable it
+    token_cache = None
+
     def __init__(self, realm=None, **extra_attributes):
         self.realm = realm
         self.extra_attributes = extra_attributes
 
+    def enable_token_cache(self, maxsize=1024, ttl=60):
+        """Cache the authenticated tokens, so that the same token string
+        will not be authenticated again on every request. Tokens are kept
+        for at most ``ttl`` seconds, and never after the ``exp`` value of
+        the token. Concurrent requests with the same uncached token string
+        are authenticated only once. The cache hit and miss counters are
+        available via ``validator.token_cache.hits`` and
+        ``validator.token_cache.misses``.
+
+        A revoked token is still accepted until it expires in the cache,
+        call :meth:`discard_cached_token` when a token is revoked.
+
+        The same token object is returned to every request until it is
+        evicted. If :meth:`authenticate_token` returns an ORM model
+        instance, it stays detached from the session of the request which
+        loaded it: only attributes loaded at that time can be used, and it
+        must not be modified. Override :meth:`cache_token` to cache a
+        plain copy instead.
+
+        :param maxsize: maximum number of cached tokens
+        :param ttl: maximum seconds to cache a token, it must be finite,
+            so that a token without expiry is not cached forever
+        """
+        if not ttl or ttl <= 0:
+            raise ValueError('"ttl" of token cache must be a positive number')
+        self.token_cache = LRUCache(maxsize=maxsize, ttl=ttl)
+        self._token_flight = SingleFlight()
+
+    def discard_cached_token(self, token_string):
+        """Remove the given token string from the token cache."""
+        if self.token_cache is not None:
+            self.token_cache.delete(_token_cache_key(token_string))
+
+    def get_token_cache_ttl(self, token):
+        """Get the seconds to cache the given authenticated token, a value
+        less than or equal to 0 means the token will not be cached. By
+        default, it is limited by ``get_expires_at()`` of the token or
+        its ``exp`` value, an expired token by ``is_expired()`` is not
+        cached::
+
+            def get_token_cache_ttl(self, token):
+                return token.expires_at - time.time()
+
+        :param token: the token returned by :meth:`authenticate_token`
+        :return: seconds, or None to use the default ttl
+        """
+        expires_at = _call_token_method(token, 'get_expires_at')
+        if not expires_at:
+            try:
+                expires_at = token.get('exp')
+            except AttributeError:
+                pass
+        if expires_at and isinstance(expires_at, (int, float)):
+            return expires_at - time.time()
+
+        if _call_token_method(token, 'is_expired'):
+            return 0
+        return None
+
+    def get_cached_token(self, token_string):
+        """Get the authenticated token of the given token string from the
+        token cache, return ``None`` if it is not cached.
+        """
+        if self.token_cache is None:
+            return None
+        return self.token_cache.get(_token_cache_key(token_string))
+
+    def cache_token(self, token_string, token):
+        """Save the authenticated token into the token cache, it respects
+        the value of :meth:`get_token_cache_ttl`.
+        """
+        cache = self.token_cache
+        if cache is None:
+            return
+
+        ttl = self.get_token_cache_ttl(token)
+        if ttl is not None:
+            if ttl <= 0:
+                return
+            if cache.ttl is not None:
+                ttl = min(ttl, cache.ttl)
+        cache.set(_token_cache_key(token_string), token, ttl)
+
+    def authenticate_cached_token(self, token_string):
+        """Authenticate the token string via :meth:`authenticate_token`,
+        the result will be cached if the token cache is enabled.
+
+        :param token_string: A string to represent the access_token.
+        :return: token
+        """
+        if self.token_cache is None:
+            return self.authenticate_token(token_string)
+
+        token = self.get_cached_token(token_string)
+        if token is not None:
+            return token
+        return self._token_flight.do(
+            _token_cache_key(token_string),
+            self._authenticate_and_cache, token_string)
+
+    def _authenticate_and_cache(self, token_string):
+        token = self.authenticate_token(token_string)
+        if token:
+            self.cache_token(token_string, token)
+        return token
+
     @staticmethod
     def scope_insufficient(token_scopes, required_scopes):
         if not required_scopes:
@@ -135,6 +249,20 @@ class ResourceProtector:
         """Validate the request and return a token."""
         validator, token_string = self.parse_request_authorization(request)
         validator.validate_request(request)
-        token = validator.authenticate_token(token_string)
+        token = validator.authenticate_cached_token(token_string)
         validator.validate_token(token, scopes, request, **kwargs)
         return token
+
+
+def _call_token_method(token, name):
+    method = getattr(token, name, None)
+    if not callable(method):
+        return None
+    try:
+        return method()
+    except NotImplementedError:
+        return None
+
+
+def _token_cache_key(token_string):
+    return hashlib.sha256(to_bytes(token_string)).digest()
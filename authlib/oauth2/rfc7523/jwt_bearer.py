@@ -52,9 +52,19 @@ class JWTBearerGrant(BaseGrant, TokenEndpointMixin):
         return claims
 
     def resolve_public_key(self, headers, payload):
-        client = self.resolve_issuer_client(payload['iss'])
+        client = self._get_issuer_client(payload['iss'])
         return self.resolve_client_key(client, headers, payload)
 
+    def _get_issuer_client(self, issuer):
+        # the issuer client is resolved when decoding the assertion and
+        # again when validating the request, query it only once
+        resolved = getattr(self, '_resolved_issuer', None)
+        if resolved is not None and resolved[0] == issuer:
+            return resolved[1]
+        client = self.resolve_issuer_client(issuer)
+        self._resolved_issuer = (issuer, client)
+        return client
+
     def validate_token_request(self):
         """The client makes a request to the token endpoint by sending the
         following parameters using the "application/x-www-form-urlencoded"
@@ -91,7 +101,7 @@ class JWTBearerGrant(BaseGrant, TokenEndpointMixin):
             raise InvalidRequestError('Missing "assertion" in request')
 
         claims = self.process_assertion_claims(assertion)
-        client = self.resolve_issuer_client(claims['iss'])
+        client = self._get_issuer_client(claims['iss'])
         log.debug('Validate token request of %s', client)
 
         if not client.check_grant_type(self.GRANT_TYPE):
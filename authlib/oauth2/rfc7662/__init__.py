@@ -10,6 +10,9 @@
 
 from .introspection import IntrospectionEndpoint
 from .models import IntrospectionToken
-from .token_validator import IntrospectTokenValidator
+from .token_validator import IntrospectTokenValidator, RemoteIntrospectTokenValidator
 
-__all__ = ['IntrospectionEndpoint', 'IntrospectionToken', 'IntrospectTokenValidator']
+__all__ = [
+    'IntrospectionEndpoint', 'IntrospectionToken',
+    'IntrospectTokenValidator', 'RemoteIntrospectTokenValidator',
+]
@@ -8,6 +8,10 @@ from ..rfc6750 import (
 class IntrospectTokenValidator(TokenValidator):
     TOKEN_TYPE = 'bearer'
 
+    #: seconds to cache the response of an inactive token, when the
+    #: token cache is enabled
+    INACTIVE_TOKEN_CACHE_TTL = 5
+
     def introspect_token(self, token_string):
         """Request introspection token endpoint with the given token string,
         authorization server will return token information in JSON format.
@@ -27,8 +31,50 @@ class IntrospectTokenValidator(TokenValidator):
     def authenticate_token(self, token_string):
         return self.introspect_token(token_string)
 
+    def get_token_cache_ttl(self, token):
+        if not token.get('active'):
+            return self.INACTIVE_TOKEN_CACHE_TTL
+        return super().get_token_cache_ttl(token)
+
     def validate_token(self, token, scopes, request):
         if not token or not token['active']:
             raise InvalidTokenError(realm=self.realm, extra_attributes=self.extra_attributes)
         if self.scope_insufficient(token.get('scope'), scopes):
             raise InsufficientScopeError()
+
+
+class RemoteIntrospectTokenValidator(IntrospectTokenValidator):
+    """Introspect tokens with an OAuth 2.0 client, e.g. a requests
+    ``OAuth2Session`` or a httpx ``OAuth2Client``. The client session is
+    reused for every introspection request, so that connections to the
+    authorization server are kept alive. Introspection responses are
+    cached until the ``exp`` of active tokens::
+
+        from authlib.integrations.requests_client import OAuth2Session
+
+        client = OAuth2Session(client_id, client_secret)
+        validator = RemoteIntrospectTokenValidator(
+            client, 'https://example.com/oauth/introspect')
+        require_oauth.register_token_validator(validator)
+
+    :param client: an OAuth 2.0 client session
+    :param introspection_endpoint: URL of the introspection endpoint
+    :param cache_size: maximum number of cached responses, 0 to disable
+    :param cache_ttl: maximum seconds to cache an active token response
+    """
+    def __init__(self, client, introspection_endpoint, realm=None,
+                 cache_size=1024, cache_ttl=300, **extra_attributes):
+        super().__init__(realm, **extra_attributes)
+        self.client = client
+        self.introspection_endpoint = introspection_endpoint
+        if cache_size:
+            self.enable_token_cache(cache_size, cache_ttl)
+
+    def introspect_token(self, token_string):
+        resp = self.client.introspect_token(
+            self.introspection_endpoint,
+            token=token_string,
+            token_type_hint='access_token',
+        )
+        resp.raise_for_status()
+        return resp.json()
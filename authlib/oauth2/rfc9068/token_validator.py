@@ -7,6 +7,7 @@
     .. _`Section 7`: https://www.rfc-editor.org/rfc/rfc9068.html#name-validating-jwt-access-token
 '''
 from authlib.jose import jwt
+from authlib.jose import ClaimsOptions
 from authlib.jose.errors import DecodeError
 from authlib.jose.errors import JoseError
 from authlib.oauth2.rfc6750.errors import InsufficientScopeError
@@ -52,6 +53,7 @@ class JWTBearerTokenValidator(BearerTokenValidator):
     def __init__(self, issuer, resource_server, *args, **kwargs):
         self.issuer = issuer
         self.resource_server = resource_server
+        self._claims_options = None
         super().__init__(*args, **kwargs)
 
     def get_jwks(self):
@@ -77,11 +79,11 @@ class JWTBearerTokenValidator(BearerTokenValidator):
         # claim.
         return iss == self.issuer
 
-    def authenticate_token(self, token_string):
-        ''''''
-        # empty docstring avoids to display the irrelevant parent docstring
-
-        claims_options = {
+    def create_claims_options(self):
+        '''Create the claims options used to validate the JWT access tokens.
+        They are compiled only once, and reused for every token.
+        '''
+        return ClaimsOptions({
             'iss': {'essential': True, 'validate': self.validate_iss},
             'exp': {'essential': True},
             'aud': {'essential': True, 'value': self.resource_server},
@@ -96,7 +98,14 @@ class JWTBearerTokenValidator(BearerTokenValidator):
             'groups': {'essential': False},
             'roles': {'essential': False},
             'entitlements': {'essential': False},
-        }
+        })
+
+    def authenticate_token(self, token_string):
+        ''''''
+        # empty docstring avoids to display the irrelevant parent docstring
+
+        if self._claims_options is None:
+            self._claims_options = self.create_claims_options()
         jwks = self.get_jwks()
 
         # If the JWT access token is encrypted, decrypt it using the keys and algorithms
@@ -114,7 +123,7 @@ class JWTBearerTokenValidator(BearerTokenValidator):
                 token_string,
                 key=jwks,
                 claims_cls=JWTAccessTokenClaims,
-                claims_options=claims_options,
+                claims_options=self._claims_options,
             )
         except DecodeError:
             raise InvalidTokenError(
@@ -0,0 +1,203 @@
+import os
+import json
+import time
+import hashlib
+import secrets
+import tempfile
+import threading
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+__all__ = ['TokenStore', 'MemoryTokenStore', 'FileTokenStore', 'CacheTokenStore']
+
+
+class TokenStore:
+    """A token store shares the tokens of ``client_credentials`` grant
+    among OAuth 2.0 clients, threads and processes. When a client needs a
+    new token, it will lock the store, check if another client has already
+    saved a new one, otherwise it will fetch a token and save it::
+
+        store = FileTokenStore('/var/run/myapp/tokens')
+        client = OAuth2Session(
+            client_id, client_secret,
+            token_endpoint='https://example.com/token',
+            grant_type='client_credentials',
+            token_store=store,
+        )
+        client.fetch_token()
+
+    Only tokens with ``expires_at`` are shared, a token without it is
+    used by the client which fetched it. Developers can implement their
+    own token store with this interface.
+    """
+
+    #: seconds to wait for the lock, a client will fetch the token
+    #: by itself if it can not acquire the lock in time
+    lock_timeout = 10
+
+    #: seconds to sleep between attempts of acquiring the lock
+    lock_interval = 0.05
+
+    def get_token(self, key):
+        """Get the saved token dict of the given key."""
+        raise NotImplementedError()
+
+    def save_token(self, key, token):
+        """Save the token dict of the given key."""
+        raise NotImplementedError()
+
+    def acquire_lock(self, key):
+        """Acquire the lock of the given key, it returns a lock object
+        which will be passed to :meth:`release_lock`, or ``None`` if the
+        lock can not be acquired.
+        """
+        return None
+
+    def release_lock(self, lock):
+        """Release a lock object returned by :meth:`acquire_lock`."""
+        pass
+
+
+class MemoryTokenStore(TokenStore):
+    """A token store in memory, which shares tokens among clients and
+    threads in the same process.
+    """
+    def __init__(self):
+        self._tokens = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def get_token(self, key):
+        return self._tokens.get(key)
+
+    def save_token(self, key, token):
+        self._tokens[key] = dict(token)
+
+    def acquire_lock(self, key):
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        if lock.acquire(timeout=self.lock_timeout):
+            return lock
+        return None
+
+    def release_lock(self, lock):
+        lock.release()
+
+
+class FileTokenStore(TokenStore):
+    """A token store in the given directory, which shares tokens among
+    processes on the same host. Tokens are saved as JSON files, and
+    processes are synchronized with ``flock`` on a lock file. There is no
+    cross-process lock on platforms without ``fcntl``.
+
+    :param directory: a directory which is only accessible to the
+        processes of this application
+    """
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _get_path(self, key, ext):
+        name = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, name + ext)
+
+    def get_token(self, key):
+        try:
+            with open(self._get_path(key, '.json')) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save_token(self, key, token):
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(token, f)
+            # readers never see a partial file
+            os.replace(tmp_path, self._get_path(key, '.json'))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def acquire_lock(self, key):
+        if fcntl is None:
+            return None
+
+        os.makedirs(self.directory, exist_ok=True)
+        f = open(self._get_path(key, '.lock'), 'a')
+        deadline = time.time() + self.lock_timeout
+        while True:
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return f
+            except OSError:
+                if time.time() >= deadline:
+                    f.close()
+                    return None
+                time.sleep(self.lock_interval)
+
+    def release_lock(self, lock):
+        try:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+        finally:
+            lock.close()
+
+
+class CacheTokenStore(TokenStore):
+    """A token store on a cache system, which shares tokens among
+    processes on different hosts. The cache instance is the same as the
+    one accepted by OAuth clients of web frameworks, it has ``get``,
+    ``set`` and ``delete`` methods. The lock is implemented with the
+    atomic ``add`` method of the cache if it is available, e.g.
+    cachelib and Django cache. The lock expires after ``lock_timeout``
+    seconds, and it is only deleted by its owner::
+
+        from cachelib import RedisCache
+        store = CacheTokenStore(RedisCache())
+
+    :param cache: a cache instance
+    :param key_prefix: prefix of cache keys
+    """
+    def __init__(self, cache, key_prefix='authlib_token:'):
+        self.cache = cache
+        self.key_prefix = key_prefix
+
+    def get_token(self, key):
+        value = self.cache.get(self.key_prefix + key)
+        if not value:
+            return None
+        try:
+            return json.loads(value)
+        except (TypeError, ValueError):
+            return None
+
+    def save_token(self, key, token):
+        expires_at = token.get('expires_at')
+        if expires_at:
+            timeout = max(int(expires_at - time.time()), 1)
+        else:
+            timeout = None
+        self.cache.set(self.key_prefix + key, json.dumps(token), timeout)
+
+    def acquire_lock(self, key):
+        if not hasattr(self.cache, 'add'):
+            return None
+
+        lock_key = self.key_prefix + key + ':lock'
+        # a unique value tells the owner of the lock
+        value = secrets.token_hex(16)
+        deadline = time.time() + self.lock_timeout
+        while not self.cache.add(lock_key, value, self.lock_timeout):
+            if time.time() >= deadline:
+                return None
+            time.sleep(self.lock_interval)
+        return lock_key, value
+
+    def release_lock(self, lock):
+        lock_key, value = lock
+        # the lock may have timed out and been acquired by another client
+        if self.cache.get(lock_key) == value:
+            self.cache.delete(lock_key)
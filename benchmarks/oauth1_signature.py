@@ -0,0 +1,45 @@
+"""
+Benchmark of OAuth 1.0 signature base string and HMAC-SHA1 signature,
+with the example request of RFC5849 Section 3.4.1.1::
+
+    $ python benchmarks/oauth1_signature.py
+"""
+import timeit
+from authlib.oauth1.rfc5849.signature import (
+    construct_base_string,
+    hmac_sha1_signature,
+)
+
+METHOD = 'POST'
+URI = 'http://example.com/request?b5=%3D%253D&a3=a&c%40=&a2=r%20b'
+PARAMS = [
+    ('b5', '=%3D'),
+    ('a3', 'a'),
+    ('c@', ''),
+    ('a2', 'r b'),
+    ('oauth_consumer_key', '9djdj82h48djs9d2'),
+    ('oauth_token', 'kkk9d7dh3k39sjv7'),
+    ('oauth_signature_method', 'HMAC-SHA1'),
+    ('oauth_timestamp', '137131201'),
+    ('oauth_nonce', '7d8f3e4a'),
+    ('c2', ''),
+    ('a3', '2 q'),
+]
+
+
+def sign():
+    base_string = construct_base_string(METHOD, URI, PARAMS)
+    return hmac_sha1_signature(base_string, 'j49sk3j29djd', 'dh893hdasih9')
+
+
+def main(number=50000):
+    for name, func in [
+        ('construct_base_string', lambda: construct_base_string(METHOD, URI, PARAMS)),
+        ('construct_base_string + hmac_sha1_signature', sign),
+    ]:
+        seconds = min(timeit.repeat(func, number=number, repeat=5))
+        print(f'{name}: {seconds / number * 1e6:.2f} us/op')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+"""
+Benchmark of x-www-form-urlencoded decoding and encoding, with the body
+of an ``authorization_code`` token request using PKCE::
+
+    $ python benchmarks/urls.py
+"""
+import timeit
+from authlib.common.urls import url_decode, url_decode_dict, url_encode
+
+PARAMS = [
+    ('grant_type', 'authorization_code'),
+    ('code', 'SplxlOBeZQQYbYS6WxSbIA'),
+    ('redirect_uri', 'https://client.example.com/cb?a=1&b=2'),
+    ('client_id', 's6BhdRkqt3'),
+    ('code_verifier', 'dBjftJeZ4CVP-mB92K27uhbUJU1p1r_wW1gFWFOEjXk'),
+    ('scope', 'openid profile email'),
+]
+BODY = url_encode(PARAMS)
+
+
+def main(number=50000):
+    for name, func in [
+        ('url_decode', lambda: url_decode(BODY)),
+        ('url_decode_dict', lambda: url_decode_dict(BODY)),
+        ('url_encode', lambda: url_encode(PARAMS)),
+    ]:
+        seconds = min(timeit.repeat(func, number=number, repeat=5))
+        print(f'{name}: {seconds / number * 1e6:.2f} us/op')
+
+
+if __name__ == '__main__':
+    main()
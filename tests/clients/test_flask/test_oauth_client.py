@@ -1,4 +1,5 @@
 from unittest import TestCase, mock
+import requests
 from flask import Flask, session
 from authlib.jose import jwk
 from authlib.oidc.core.grants.util import generate_id_token
@@ -427,6 +428,43 @@ class FlaskOAuthTest(TestCase):
                 resp = client.get('/api/user')
                 self.assertEqual(resp.text, 'hi')
 
+    def test_request_with_pooled_connections(self):
+        app = Flask(__name__)
+        app.secret_key = '!'
+        oauth = OAuth(app)
+        client = oauth.register(
+            'dev',
+            client_id='dev',
+            client_secret='dev',
+            api_base_url='https://i.b/api',
+            access_token_url='https://i.b/token',
+            authorize_url='https://i.b/authorize'
+        )
+
+        tokens = [get_bearer_token(), {'token_type': 'Bearer', 'access_token': 'c'}]
+        adapters = []
+
+        def fake_send(adapter, req, **kwargs):
+            adapters.append(adapter)
+            self.assertEqual(req.headers['Authorization'], 'Bearer ' + req.url[-1])
+            resp = requests.Response()
+            resp.status_code = 200
+            resp._content = b'hi'
+            resp.request = req
+            return resp
+
+        with app.test_request_context():
+            with mock.patch('requests.adapters.HTTPAdapter.send', fake_send):
+                # sessions of each call are closed, the pool is not
+                self.assertEqual(client.get('/api/a', token=tokens[0]).text, 'hi')
+                self.assertEqual(client.get('/api/c', token=tokens[1]).text, 'hi')
+
+        self.assertIs(adapters[0], adapters[1])
+        self.assertIs(adapters[0], client._connection_pool.adapter)
+
+        client.close()
+        self.assertIsNone(client._connection_pool)
+
     def test_request_with_refresh_token(self):
         app = Flask(__name__)
         app.secret_key = '!'
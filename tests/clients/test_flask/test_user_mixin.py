@@ -156,3 +156,73 @@ class FlaskUserMixinTest(TestCase):
                 token['id_token'] = id_token
                 user = client.parse_id_token(token, nonce='n')
                 self.assertEqual(user.sub, '123')
+
+    def test_cache_jwks_uri(self):
+        secret_keys = read_key_file('jwks_private.json')
+        token = get_bearer_token()
+        token['id_token'] = generate_id_token(
+            token, {'sub': '123'}, secret_keys,
+            alg='RS256', iss='https://i.b',
+            aud='dev', exp=3600, nonce='n',
+        )
+
+        app = Flask(__name__)
+        app.secret_key = '!'
+        oauth = OAuth(app)
+        client = oauth.register(
+            'dev',
+            client_id='dev',
+            client_secret='dev',
+            fetch_token=get_bearer_token,
+            jwks_uri='https://i.b/jwks',
+            issuer='https://i.b',
+        )
+
+        requests = []
+
+        def fake_send(sess, req, **kwargs):
+            requests.append(req.url)
+            resp = mock.MagicMock()
+            resp.json = lambda: read_key_file('jwks_public.json')
+            resp.headers = {'Cache-Control': 'public, max-age=600'}
+            resp.status_code = 200
+            return resp
+
+        with app.test_request_context():
+            with mock.patch('requests.sessions.Session.send', fake_send):
+                user = client.parse_id_token(token, nonce='n')
+                self.assertEqual(user.sub, '123')
+                user = client.parse_id_token(token, nonce='n')
+                self.assertEqual(user.sub, '123')
+                self.assertEqual(len(requests), 1)
+
+                cache = client.jwks_cache
+                self.assertAlmostEqual(cache.expires_at - cache.fetched_at, 600)
+
+                # unknown kid will not refresh again within the interval
+                bad_token = get_bearer_token()
+                bad_token['id_token'] = generate_id_token(
+                    bad_token, {'sub': '123'}, secret_key,
+                    alg='HS256', iss='https://i.b',
+                    aud='dev', exp=3600, nonce='n',
+                )
+                for _ in range(3):
+                    self.assertRaises(
+                        ValueError,
+                        client.parse_id_token, bad_token, 'n'
+                    )
+                self.assertEqual(len(requests), 1)
+
+                cache.fetched_at -= cache.refresh_interval
+                self.assertRaises(ValueError, client.parse_id_token, bad_token, 'n')
+                self.assertEqual(len(requests), 2)
+
+                # a forced refresh which was waiting for the previous one
+                # uses its result
+                client._refresh_key_set(True)
+                self.assertEqual(len(requests), 2)
+
+                cache.expires_at = cache.fetched_at
+                user = client.parse_id_token(token, nonce='n')
+                self.assertEqual(user.sub, '123')
+                self.assertEqual(len(requests), 3)
@@ -1,5 +1,6 @@
 import asyncio
 import time
+import threading
 import pytest
 from unittest import mock
 from copy import deepcopy
@@ -11,7 +12,9 @@ from authlib.common.urls import url_encode
 from authlib.integrations.httpx_client import (
     OAuthError,
     AsyncOAuth2Client,
+    AsyncRemoteIntrospectTokenValidator,
 )
+from authlib.oauth2 import MemoryTokenStore
 from ..asgi_helper import AsyncMockDispatch
 
 
@@ -281,6 +284,57 @@ async def test_client_credentials_type():
         assert token == default_token
 
 
+@pytest.mark.asyncio
+async def test_client_credentials_token_store():
+    url = 'https://example.com/token'
+    requests = []
+
+    async def assert_func(request):
+        requests.append(request)
+
+    app = AsyncMockDispatch(default_token, assert_func=assert_func)
+    store = MemoryTokenStore()
+
+    async def fetch_token():
+        async with AsyncOAuth2Client(
+                'foo', token_endpoint=url,
+                grant_type='client_credentials',
+                token_store=store, app=app) as client:
+            return await client.fetch_token()
+
+    tokens = await asyncio.gather(*[fetch_token() for _ in range(3)])
+    assert tokens == [default_token] * 3
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_token_store_runs_in_thread():
+    url = 'https://example.com/token'
+    threads = []
+
+    class ThreadStore(MemoryTokenStore):
+        def get_token(self, key):
+            threads.append(threading.get_ident())
+            return super().get_token(key)
+
+        def save_token(self, key, token):
+            threads.append(threading.get_ident())
+            super().save_token(key, token)
+
+        def release_lock(self, lock):
+            threads.append(threading.get_ident())
+            super().release_lock(lock)
+
+    app = AsyncMockDispatch(default_token)
+    async with AsyncOAuth2Client(
+            'foo', token_endpoint=url,
+            grant_type='client_credentials',
+            token_store=ThreadStore(), app=app) as client:
+        await client.fetch_token()
+    assert len(threads) == 4
+    assert threading.get_ident() not in threads
+
+
 @pytest.mark.asyncio
 async def test_cleans_previous_token_before_fetching_new_one():
     now = int(time.time())
@@ -444,3 +498,27 @@ async def test_request_without_token():
     async with AsyncOAuth2Client('a', app=AsyncMockDispatch()) as client:
         with pytest.raises(OAuthError):
             await client.get('https://i.b/token')
+
+
+@pytest.mark.asyncio
+async def test_remote_introspect_token_validator():
+    calls = []
+
+    async def assert_func(request):
+        calls.append(request)
+        await asyncio.sleep(0.05)
+
+    answer = {'active': True, 'scope': 'profile', 'exp': int(time.time()) + 60}
+    app = AsyncMockDispatch(answer, assert_func=assert_func)
+    async with AsyncOAuth2Client('a', 'secret', app=app) as client:
+        validator = AsyncRemoteIntrospectTokenValidator(
+            client, 'https://i.b/introspect')
+        coroutines = [validator.authenticate_cached_token('hi') for x in range(5)]
+        tokens = await asyncio.gather(*coroutines)
+        assert len(calls) == 1
+        for token in tokens:
+            validator.validate_token(token, ['profile'], None)
+
+        token = await validator.authenticate_cached_token('hi')
+        assert token == answer
+        assert len(calls) == 1
@@ -1,11 +1,15 @@
 import time
+import tempfile
+import threading
 from copy import deepcopy
 from unittest import TestCase, mock
 from authlib.common.security import generate_token
 from authlib.common.urls import url_encode, add_params_to_uri
 from authlib.integrations.requests_client import OAuth2Session, OAuthError
+from authlib.oauth2 import MemoryTokenStore, FileTokenStore, CacheTokenStore
 from authlib.oauth2.rfc6749 import MismatchingStateException
 from authlib.oauth2.rfc7523 import ClientSecretJWT, PrivateKeyJWT
+from cachelib import SimpleCache
 from ..util import read_key_file
 
 
@@ -261,6 +265,106 @@ class OAuth2SessionTest(TestCase):
         token = sess.fetch_token(url)
         self.assertEqual(token, self.token)
 
+    def test_client_credentials_token_store(self):
+        url = 'https://example.com/token'
+        tokens = []
+
+        def fake_send(r, **kwargs):
+            resp = mock.MagicMock()
+            resp.status_code = 200
+            if r.url == url:
+                token = dict(self.token, access_token=str(len(tokens)))
+                token.pop('refresh_token')
+                tokens.append(token)
+                resp.json = lambda: token
+            return resp
+
+        with tempfile.TemporaryDirectory() as directory:
+            stores = [
+                MemoryTokenStore(),
+                FileTokenStore(directory),
+                CacheTokenStore(SimpleCache()),
+            ]
+            for store in stores:
+                del tokens[:]
+                sessions = []
+                for _ in range(3):
+                    sess = OAuth2Session(
+                        self.client_id, 'v',
+                        token_endpoint=url,
+                        grant_type='client_credentials',
+                        token_store=store,
+                    )
+                    sess.send = fake_send
+                    sessions.append(sess)
+
+                for sess in sessions:
+                    token = sess.fetch_token()
+                    self.assertEqual(token['access_token'], '0')
+                self.assertEqual(len(tokens), 1)
+
+                # the token in store is expired
+                sessions[0].token['expires_at'] = 100
+                store.save_token(
+                    sessions[0]._get_token_store_key(url, 'grant_type=client_credentials'),
+                    sessions[0].token,
+                )
+                sessions[1].token['expires_at'] = 100
+                sessions[1].get('https://i.b/user')
+                self.assertEqual(len(tokens), 2)
+                self.assertEqual(sessions[1].token['access_token'], '1')
+
+                sessions[2].token['expires_at'] = 100
+                sessions[2].get('https://i.b/user')
+                self.assertEqual(len(tokens), 2)
+                self.assertEqual(sessions[2].token['access_token'], '1')
+
+    def test_token_store_without_expires_at(self):
+        url = 'https://example.com/token'
+        tokens = []
+
+        def fake_send(r, **kwargs):
+            resp = mock.MagicMock()
+            resp.status_code = 200
+            token = {'token_type': 'Bearer', 'access_token': str(len(tokens))}
+            tokens.append(token)
+            resp.json = lambda: token
+            return resp
+
+        store = MemoryTokenStore()
+        for _ in range(2):
+            sess = OAuth2Session(
+                self.client_id, 'v',
+                token_endpoint=url,
+                grant_type='client_credentials',
+                token_store=store,
+            )
+            sess.send = fake_send
+            sess.fetch_token()
+        # a token which never expires is not shared
+        self.assertEqual(len(tokens), 2)
+        key = sess._get_token_store_key(url, 'grant_type=client_credentials')
+        self.assertIsNone(store.get_token(key))
+
+    def test_cache_token_store_lock_owner(self):
+        cache = SimpleCache()
+        store = CacheTokenStore(cache)
+        lock_key = 'authlib_token:k:lock'
+        lock1 = store.acquire_lock('k')
+        self.assertIsNotNone(lock1)
+
+        # the lock of the first client is expired
+        cache.delete(lock_key)
+        lock2 = store.acquire_lock('k')
+        self.assertIsNotNone(lock2)
+        self.assertNotEqual(lock1, lock2)
+
+        # the first client must not release the lock of the second one
+        store.release_lock(lock1)
+        self.assertIsNotNone(cache.get(lock_key))
+        store.release_lock(lock2)
+        self.assertIsNone(cache.get(lock_key))
+
     def test_cleans_previous_token_before_fetching_new_one(self):
         """Makes sure the previous token is cleaned before fetching a new one.
         The reason behind it is that, if the previous token is expired, this
@@ -397,6 +501,122 @@ class OAuth2SessionTest(TestCase):
         sess.get('https://i.b/user')
         self.assertTrue(update_token.called)
 
+    def test_auto_refresh_token_in_threads(self):
+        update_token = mock.Mock()
+        old_token = dict(
+            access_token='a', refresh_token='b',
+            token_type='bearer', expires_at=100
+        )
+        sess = OAuth2Session(
+            'foo', token=old_token,
+            token_endpoint='https://i.b/token',
+            update_token=update_token,
+        )
+
+        refreshed = []
+
+        def fake_send(r, **kwargs):
+            resp = mock.MagicMock()
+            resp.status_code = 200
+            if r.url == 'https://i.b/token':
+                refreshed.append(r)
+                time.sleep(0.05)
+                resp.json = lambda: self.token
+            else:
+                self.assertEqual(r.headers['Authorization'], 'Bearer a')
+                resp.json = lambda: {}
+            return resp
+
+        sess.send = fake_send
+        threads = [
+            threading.Thread(target=sess.get, args=('https://i.b/user',))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(refreshed), 1)
+        self.assertEqual(update_token.call_count, 1)
+
+    def test_refresh_token_ahead(self):
+        update_token = mock.Mock()
+        old_token = dict(
+            access_token='c', refresh_token='b',
+            token_type='bearer', expires_at=int(time.time()) + 90,
+        )
+        sess = OAuth2Session(
+            'foo', token=old_token,
+            token_endpoint='https://i.b/token',
+            update_token=update_token,
+            refresh_ahead=60,
+        )
+
+        headers = []
+
+        def fake_send(r, **kwargs):
+            resp = mock.MagicMock()
+            resp.status_code = 200
+            if r.url == 'https://i.b/token':
+                resp.json = lambda: self.token
+            else:
+                headers.append(r.headers['Authorization'])
+                resp.json = lambda: {}
+            return resp
+
+        sess.send = fake_send
+        sess.get('https://i.b/user')
+        self.assertEqual(len(headers), 1)
+
+        # wait for the background refresh
+        with sess._refresh_lock:
+            self.assertTrue(update_token.called)
+        sess.get('https://i.b/user')
+        self.assertEqual(headers[-1], 'Bearer a')
+
+    def test_refresh_token_ahead_backoff(self):
+        token = dict(
+            access_token='c', refresh_token='b',
+            token_type='bearer', expires_at=int(time.time()) + 90,
+        )
+        sess = OAuth2Session(
+            'foo', token=token,
+            token_endpoint='https://i.b/token',
+            refresh_ahead=60,
+        )
+        calls = []
+
+        def fake_send(r, **kwargs):
+            resp = mock.MagicMock()
+            if r.url == 'https://i.b/token':
+                calls.append(r.url)
+                resp.status_code = 500
+                resp.json = lambda: {'error': 'server_error'}
+            else:
+                resp.status_code = 200
+                resp.json = lambda: {}
+            return resp
+
+        sess.send = fake_send
+        for _ in range(5):
+            sess.get('https://i.b/user')
+            with sess._refresh_lock:
+                pass
+        # a failed refresh is not retried on every request
+        self.assertEqual(len(calls), 1)
+
+        sess._refresh_failed_at -= sess.refresh_retry_interval
+        sess.get('https://i.b/user')
+        with sess._refresh_lock:
+            self.assertEqual(len(calls), 2)
+
+        # nothing to refresh without refresh_token
+        sess.token = dict(access_token='d', token_type='bearer', expires_at=int(time.time()) + 90)
+        sess._refresh_failed_at = None
+        sess.get('https://i.b/user')
+        with sess._refresh_lock:
+            self.assertEqual(len(calls), 2)
+
     def test_revoke_token(self):
         sess = OAuth2Session('a')
         answer = {'status': 'ok'}
@@ -1,4 +1,6 @@
+import httpx
 import pytest
+from unittest import mock
 from starlette.config import Config
 from starlette.requests import Request
 from authlib.common.urls import urlparse, url_decode
@@ -37,6 +39,36 @@ def test_register_with_overwrite():
     assert oauth.dev.client_id == 'dev'
 
 
+@pytest.mark.asyncio
+async def test_request_with_pooled_connections():
+    oauth = OAuth()
+    client = oauth.register(
+        'dev',
+        client_id='dev',
+        client_secret='dev',
+        api_base_url='https://i.b/api',
+    )
+    transports = []
+
+    async def handle_async_request(transport, request):
+        transports.append(transport)
+        assert request.headers['Authorization'] == 'Bearer ' + request.url.path[-1]
+        return httpx.Response(200, text='hi')
+
+    with mock.patch('httpx.AsyncHTTPTransport.handle_async_request', handle_async_request):
+        # clients of each call are closed, the pool is not
+        resp = await client.get('/api/a', token=get_bearer_token())
+        assert resp.text == 'hi'
+        resp = await client.get('/api/c', token={'token_type': 'Bearer', 'access_token': 'c'})
+        assert resp.text == 'hi'
+
+    assert transports[0] is transports[1]
+    assert transports[0] is client._connection_pool.transport
+
+    await client.aclose()
+    assert client._connection_pool is None
+
+
 @pytest.mark.asyncio
 async def test_oauth1_authorize():
     oauth = OAuth()
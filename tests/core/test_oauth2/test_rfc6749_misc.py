@@ -1,8 +1,13 @@
+import time
 import unittest
 import base64
+from authlib.common.urls import url_encode, url_decode, url_decode_dict
 from authlib.oauth2.rfc6749 import parameters
 from authlib.oauth2.rfc6749 import util
 from authlib.oauth2.rfc6749 import errors
+from authlib.oauth2.rfc6749 import grants
+from authlib.oauth2.rfc6749 import OAuth2Request, AuthorizationServer, ClientMixin
+from authlib.oauth2.rfc6749 import TokenMixin, TokenValidator
 
 
 class OAuth2ParametersTest(unittest.TestCase):
@@ -94,3 +99,179 @@ class OAuth2UtilTest(unittest.TestCase):
             util.extract_basic_authorization({'Authorization': text}),
             ('a', 'b')
         )
+
+    def test_url_decode(self):
+        self.assertEqual(url_decode(''), [])
+        self.assertEqual(
+            url_decode('a=1&b=%E5%95%A6+c&c&&a=2'),
+            [('a', '1'), ('b', '\u5566 c'), ('c', ''), ('a', '2')]
+        )
+        self.assertEqual(url_decode_dict('a=1&b=x%2By&a=2'), {'a': '2', 'b': 'x+y'})
+        self.assertRaises(ValueError, url_decode, 'a=<b>')
+        self.assertRaises(ValueError, url_decode, 'a=%G0')
+        self.assertRaises(ValueError, url_decode, 'a=%0G&b=1')
+
+    def test_url_encode(self):
+        self.assertEqual(
+            url_encode([('a b', 'c&d'), ('\u5566', 1), (b'k', b'/')]),
+            'a+b=c%26d&%E5%95%A6=1&k=%2F'
+        )
+
+
+class OAuth2RequestTest(unittest.TestCase):
+    def test_cached_data(self):
+        request = OAuth2Request(
+            'POST', 'https://i.b/?client_id=a&state=s',
+            body={'client_id': 'b', 'grant_type': 'client_credentials'},
+        )
+        self.assertEqual(request.args, {'client_id': 'a', 'state': 's'})
+        self.assertEqual(request.data['client_id'], 'b')
+        self.assertIs(request.data, request.data)
+        self.assertIs(request.args, request.args)
+        self.assertEqual(request.state, 's')
+        self.assertEqual(request.grant_type, 'client_credentials')
+
+        with self.assertRaises(TypeError):
+            request.data['client_id'] = 'c'
+
+        request.body = {'client_id': 'c'}
+        self.assertEqual(request.client_id, 'c')
+        self.assertIsNone(request.grant_type)
+
+        request.uri = 'https://i.b/?state=t'
+        self.assertEqual(request.state, 't')
+        self.assertEqual(dict(request.data), {'client_id': 'c', 'state': 't'})
+
+
+class AuthorizationServerTest(unittest.TestCase):
+    def test_grant_registry(self):
+        class CustomGrant(grants.BaseGrant, grants.TokenEndpointMixin):
+            @classmethod
+            def check_token_endpoint(cls, request):
+                return request.data.get('custom') == '1'
+
+        server = AuthorizationServer()
+        server.register_grant(grants.AuthorizationCodeGrant)
+        server.register_grant(grants.ImplicitGrant)
+        server.register_grant(CustomGrant)
+        server.register_grant(grants.ClientCredentialsGrant)
+
+        def token_request(**body):
+            return OAuth2Request('POST', 'https://i.b/token', body=body)
+
+        request = token_request(grant_type='client_credentials')
+        grant = server.get_token_grant(request)
+        self.assertIsInstance(grant, grants.ClientCredentialsGrant)
+
+        request = token_request(grant_type='client_credentials', custom='1')
+        grant = server.get_token_grant(request)
+        self.assertIsInstance(grant, CustomGrant)
+
+        request = token_request(grant_type='authorization_code', custom='1')
+        grant = server.get_token_grant(request)
+        self.assertIsInstance(grant, grants.AuthorizationCodeGrant)
+
+        request = OAuth2Request('GET', 'https://i.b/token?grant_type=client_credentials')
+        self.assertRaises(
+            errors.UnsupportedGrantTypeError,
+            server.get_token_grant, request,
+        )
+
+        request = OAuth2Request('GET', 'https://i.b/authorize?response_type=token')
+        grant = server.get_authorization_grant(request)
+        self.assertIsInstance(grant, grants.ImplicitGrant)
+
+        request = OAuth2Request('GET', 'https://i.b/authorize?response_type=id_token')
+        self.assertRaises(
+            errors.UnsupportedResponseTypeError,
+            server.get_authorization_grant, request,
+        )
+
+    def test_client_cache(self):
+        class Client(ClientMixin):
+            def __init__(self, client_id):
+                self.client_id = client_id
+
+            def check_client_secret(self, client_secret):
+                return client_secret == 'secret'
+
+            def check_endpoint_auth_method(self, method, endpoint):
+                return method == 'client_secret_post'
+
+        queried = []
+
+        class Server(AuthorizationServer):
+            def query_client(self, client_id):
+                queried.append(client_id)
+                return Client(client_id)
+
+        def token_request():
+            # both methods are tried, the client is queried only once
+            auth = base64.b64encode(b'a:secret').decode()
+            return OAuth2Request(
+                'POST', 'https://i.b/token',
+                body={'client_id': 'a', 'client_secret': 'secret'},
+                headers={'Authorization': 'Basic ' + auth},
+            )
+
+        server = Server()
+        methods = ['client_secret_basic', 'client_secret_post']
+        request = token_request()
+        client = server.authenticate_client(request, methods)
+        self.assertEqual(client.client_id, 'a')
+        self.assertEqual(request.auth_method, 'client_secret_post')
+        self.assertEqual(queried, ['a'])
+
+        server.authenticate_client(token_request(), methods)
+        self.assertEqual(queried, ['a', 'a'])
+
+        server.enable_client_cache()
+        server.authenticate_client(token_request(), methods)
+        server.authenticate_client(token_request(), methods)
+        self.assertEqual(queried, ['a', 'a', 'a'])
+
+        server.discard_cached_client('a')
+        server.authenticate_client(token_request(), methods)
+        self.assertEqual(queried, ['a', 'a', 'a', 'a'])
+
+
+class _ModelToken(TokenMixin):
+    def __init__(self, expires_at=None, expired=None):
+        self.expires_at = expires_at
+        self.expired = expired
+
+    def get_expires_at(self):
+        if self.expires_at is None:
+            raise NotImplementedError()
+        return self.expires_at
+
+    def is_expired(self):
+        if self.expired is None:
+            raise NotImplementedError()
+        return self.expired
+
+
+class TokenValidatorTest(unittest.TestCase):
+    def test_get_token_cache_ttl(self):
+        validator = TokenValidator()
+        now = time.time()
+        self.assertAlmostEqual(validator.get_token_cache_ttl({'exp': now + 30}), 30, delta=1)
+        self.assertIsNone(validator.get_token_cache_ttl({}))
+
+        # model tokens without ``exp``
+        self.assertAlmostEqual(validator.get_token_cache_ttl(_ModelToken(now + 30)), 30, delta=1)
+        self.assertLess(validator.get_token_cache_ttl(_ModelToken(now - 30)), 0)
+        self.assertEqual(validator.get_token_cache_ttl(_ModelToken(expired=True)), 0)
+        self.assertIsNone(validator.get_token_cache_ttl(_ModelToken(expired=False)))
+        self.assertIsNone(validator.get_token_cache_ttl(_ModelToken()))
+
+    def test_token_cache_requires_ttl(self):
+        validator = TokenValidator()
+        self.assertRaises(ValueError, validator.enable_token_cache, ttl=None)
+        self.assertRaises(ValueError, validator.enable_token_cache, ttl=0)
+        validator.enable_token_cache(ttl=60)
+
+        # a token without expiry is cached no longer than ttl
+        validator.cache_token('a', _ModelToken())
+        self.assertIsNotNone(validator.get_cached_token('a'))
+        self.assertEqual(validator.token_cache.ttl, 60)
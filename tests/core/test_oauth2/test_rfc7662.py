@@ -1,5 +1,9 @@
+import time
+import threading
 import unittest
+from unittest import mock
 from authlib.oauth2.rfc7662 import IntrospectionToken
+from authlib.oauth2.rfc7662 import RemoteIntrospectTokenValidator
 
 
 class IntrospectionTokenTest(unittest.TestCase):
@@ -53,3 +57,65 @@ class IntrospectionTokenTest(unittest.TestCase):
     def test_invalid_attr(self):
         token = IntrospectionToken()
         self.assertRaises(AttributeError, lambda: token.invalid)
+
+
+class RemoteIntrospectTokenValidatorTest(unittest.TestCase):
+    def create_validator(self, data, delay=0):
+        def introspect_token(url, token=None, token_type_hint=None):
+            time.sleep(delay)
+            resp = mock.Mock()
+            resp.json.return_value = dict(data)
+            return resp
+
+        client = mock.Mock()
+        client.introspect_token = mock.Mock(side_effect=introspect_token)
+        validator = RemoteIntrospectTokenValidator(
+            client, 'https://provider.test/introspect')
+        return validator, client
+
+    def test_cache_active_token(self):
+        data = {'active': True, 'scope': 'profile', 'exp': int(time.time()) + 60}
+        validator, client = self.create_validator(data)
+        for _ in range(3):
+            token = validator.authenticate_cached_token('a')
+            validator.validate_token(token, ['profile'], None)
+        client.introspect_token.assert_called_once_with(
+            'https://provider.test/introspect',
+            token='a', token_type_hint='access_token',
+        )
+        self.assertEqual(validator.token_cache.hits, 2)
+
+    def test_cache_inactive_token(self):
+        validator, client = self.create_validator({'active': False})
+        validator.authenticate_cached_token('a')
+        validator.authenticate_cached_token('a')
+        self.assertEqual(client.introspect_token.call_count, 1)
+
+        validator.INACTIVE_TOKEN_CACHE_TTL = 0
+        validator.authenticate_cached_token('b')
+        validator.authenticate_cached_token('b')
+        self.assertEqual(client.introspect_token.call_count, 3)
+
+    def test_expired_token_not_cached(self):
+        data = {'active': True, 'exp': int(time.time()) - 1}
+        validator, client = self.create_validator(data)
+        validator.authenticate_cached_token('a')
+        validator.authenticate_cached_token('a')
+        self.assertEqual(client.introspect_token.call_count, 2)
+
+    def test_coalesce_concurrent_requests(self):
+        data = {'active': True, 'exp': int(time.time()) + 60}
+        validator, client = self.create_validator(data, delay=0.1)
+        results = []
+
+        def authenticate():
+            results.append(validator.authenticate_cached_token('a'))
+
+        threads = [threading.Thread(target=authenticate) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(client.introspect_token.call_count, 1)
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(r['active'] for r in results))
@@ -1,8 +1,12 @@
 import time
+import unittest
+from unittest import mock
 from flask import json
+from authlib.oauth1 import MemoryNonceStore, CacheNonceStore
 from authlib.oauth1.rfc5849 import signature
 from authlib.common.urls import add_params_to_uri
 from tests.util import read_file_path
+from ..cache import SimpleCache
 from .oauth1_server import db, User, Client, TokenCredential
 from .oauth1_server import (
     TestCase,
@@ -170,3 +174,102 @@ class ResourceCacheTest(TestCase):
 
 class ResourceDBTest(ResourceCacheTest):
     USE_CACHE = False
+
+
+class NonceStoreTest(unittest.TestCase):
+    def test_memory_nonce_store(self):
+        store = MemoryNonceStore(expires_in=300, bucket_size=10)
+        now = int(time.time())
+        self.assertFalse(store.exists_nonce('n', str(now), 'client', 'token'))
+        self.assertTrue(store.exists_nonce('n', str(now), 'client', 'token'))
+        self.assertFalse(store.exists_nonce('n', str(now), 'client', None))
+        self.assertFalse(store.exists_nonce('n', str(now - 100), 'client', None))
+        self.assertEqual(len(store), 3)
+
+        # nonces out of the timestamp window are dropped
+        self.assertTrue(store.exists_nonce('n', str(now - 400), 'client', None))
+        with mock.patch('time.time', return_value=now + 350):
+            self.assertFalse(store.exists_nonce('m', str(now + 350), 'client', None))
+        self.assertEqual(len(store), 1)
+
+    def test_future_timestamp(self):
+        now = int(time.time())
+        store = MemoryNonceStore(expires_in=300)
+        for i in range(100):
+            ts = str(now + 1000000000 + i * 10)
+            self.assertTrue(store.exists_nonce('n', ts, 'client', None))
+        self.assertEqual(len(store._buckets), 0)
+        self.assertFalse(store.exists_nonce('n', str(now + 200), 'client', None))
+
+        cache = SimpleCache()
+        cache.add = mock.Mock(return_value=True)
+        store = CacheNonceStore(cache, expires_in=300)
+        self.assertTrue(store.exists_nonce('n', str(now + 1000000000), 'client', None))
+        cache.add.assert_not_called()
+        self.assertFalse(store.exists_nonce('n', str(now + 200), 'client', None))
+        self.assertLessEqual(cache.add.call_args[0][2], 600)
+
+    def test_cache_nonce_store(self):
+        cache = SimpleCache()
+        store = CacheNonceStore(cache, expires_in=300)
+        now = str(int(time.time()))
+        self.assertFalse(store.exists_nonce('n', now, 'client', 'token'))
+        self.assertTrue(store.exists_nonce('n', now, 'client', 'token'))
+        self.assertTrue(cache.has('nonce:n-' + now + '-client-token'))
+        self.assertFalse(store.exists_nonce('n', now, 'client', None))
+
+        # check and set in one call
+        cache.add = mock.Mock(return_value=False)
+        self.assertTrue(store.exists_nonce('m', now, 'client', None))
+        cache.add.assert_called_once()
+
+
+class SignatureTest(unittest.TestCase):
+    def test_construct_base_string(self):
+        params = [
+            ('b5', '=%3D'), ('a3', 'a'), ('c@', ''), ('a2', 'r b'),
+            ('oauth_consumer_key', '9djdj82h48djs9d2'),
+            ('oauth_token', 'kkk9d7dh3k39sjv7'),
+            ('oauth_signature_method', 'HMAC-SHA1'),
+            ('oauth_timestamp', '137131201'),
+            ('oauth_nonce', '7d8f3e4a'),
+            ('oauth_signature', 'bYT5CMsGcbgUdFHObYMEfcx6bsw%3D'),
+            ('c2', ''), ('a3', '2 q'),
+        ]
+        base_string = signature.construct_base_string(
+            'POST', 'http://example.com/request?b5=%3D%253D', params)
+        self.assertEqual(
+            base_string,
+            'POST&http%3A%2F%2Fexample.com%2Frequest&a2%3Dr%2520b%26a3%3D2%2520q'
+            '%26a3%3Da%26b5%3D%253D%25253D%26c%2540%3D%26c2%3D%26oauth_consumer_'
+            'key%3D9djdj82h48djs9d2%26oauth_nonce%3D7d8f3e4a%26oauth_signature_m'
+            'ethod%3DHMAC-SHA1%26oauth_timestamp%3D137131201%26oauth_token%3Dkkk'
+            '9d7dh3k39sjv7'
+        )
+
+    def test_normalize_base_string_uri(self):
+        uri = 'http://EXAMPLE.COM:80/r%20v/X?id=123'
+        self.assertEqual(
+            signature.normalize_base_string_uri(uri),
+            'http://example.com/r%20v/X')
+        # cached per endpoint, query and host are respected
+        self.assertEqual(
+            signature.normalize_base_string_uri('http://EXAMPLE.COM:80/r%20v/X?id=4#a'),
+            'http://example.com/r%20v/X')
+        self.assertEqual(
+            signature.normalize_base_string_uri(uri, 'www.example.net:8080'),
+            'http://www.example.net:8080/r%20v/X')
+        self.assertRaises(ValueError, signature.normalize_base_string_uri, '/r?id=1')
+
+    def test_hmac_sha1_signature(self):
+        sig = signature.hmac_sha1_signature('text', 'secret', 'token-secret')
+        self.assertEqual(
+            sig, signature.hmac_sha1_signature('text', 'secret', 'token-secret'))
+        self.assertNotEqual(
+            sig, signature.hmac_sha1_signature('other', 'secret', 'token-secret'))
+        self.assertNotEqual(
+            sig, signature.hmac_sha1_signature('text', 'secret', None))
+        self.assertEqual(
+            signature.hmac_sha1_signature('text', 'secret', None),
+            'CSfpxuIKEtIixxfWGODbxZ53jtA=',
+        )
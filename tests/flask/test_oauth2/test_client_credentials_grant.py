@@ -1,6 +1,12 @@
+import time
 from flask import json
+from sqlalchemy.orm import sessionmaker
 from authlib.oauth2.rfc6749.grants import ClientCredentialsGrant
-from .models import db, User, Client
+from authlib.integrations.sqla_oauth2 import (
+    create_save_token_func,
+    TokenBatchWriter,
+)
+from .models import db, User, Client, Token
 from .oauth2_server import TestCase
 from .oauth2_server import create_authorization_server
 
@@ -93,3 +99,128 @@ class ClientCredentialsTest(TestCase):
         resp = json.loads(rv.data)
         self.assertIn('access_token', resp)
         self.assertIn('c-client_credentials.', resp['access_token'])
+
+    def test_write_token_behind(self):
+        self.prepare_data()
+        writer = TokenBatchWriter(
+            sessionmaker(db.engine), Token, max_size=3, interval=60)
+        self.server.save_token = create_save_token_func(db.session, Token, writer)
+        headers = self.create_basic_header(
+            'credential-client', 'credential-secret'
+        )
+        rv = self.client.post('/oauth/token', data={
+            'grant_type': 'client_credentials',
+        }, headers=headers)
+        resp = json.loads(rv.data)
+        self.assertIn('access_token', resp)
+        self.assertEqual(writer.queue_depth, 1)
+        self.assertIsNone(Token.query.filter_by(access_token=resp['access_token']).first())
+
+        writer.flush()
+        self.assertEqual(writer.queue_depth, 0)
+        self.assertEqual(writer.flushes, 1)
+        self.assertIsNotNone(writer.last_flush_time)
+        self.assertIsNotNone(Token.query.filter_by(access_token=resp['access_token']).first())
+
+        # a full batch is written by the background thread
+        for _ in range(3):
+            self.client.post('/oauth/token', data={
+                'grant_type': 'client_credentials',
+            }, headers=headers)
+        deadline = time.time() + 5
+        while writer.written < 4 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(writer.written, 4)
+        self.assertEqual(writer.flushes, 2)
+        writer.close()
+        self.assertEqual(Token.query.count(), 4)
+
+    def test_write_token_behind_failure(self):
+        self.prepare_data()
+        factory = sessionmaker(db.engine)
+        failures = []
+
+        def session_factory():
+            session = factory()
+            if failures:
+                failures.pop()
+
+                def commit():
+                    raise RuntimeError('database is unavailable')
+                session.commit = commit
+            return session
+
+        writer = TokenBatchWriter(
+            session_factory, Token, max_size=2, interval=0.01, retry_interval=0.01)
+        self.server.save_token = create_save_token_func(db.session, Token, writer)
+        headers = self.create_basic_header(
+            'credential-client', 'credential-secret'
+        )
+        self.client.post('/oauth/token', data={
+            'grant_type': 'client_credentials',
+        }, headers=headers)
+        failures.append(True)
+        self.assertRaises(RuntimeError, writer.flush)
+        self.assertEqual(writer.queue_depth, 1)
+        self.assertEqual(Token.query.count(), 0)
+        writer.flush()
+        self.assertEqual(writer.queue_depth, 0)
+        self.assertEqual(Token.query.count(), 1)
+
+        # a failed batch of the background thread is written later
+        failures.append(True)
+        for _ in range(2):
+            self.client.post('/oauth/token', data={
+                'grant_type': 'client_credentials',
+            }, headers=headers)
+        deadline = time.time() + 5
+        while writer.written < 3 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(writer.written, 3)
+        self.assertEqual(writer.queue_depth, 0)
+        writer.close()
+        self.assertEqual(Token.query.count(), 3)
+
+    def test_write_token_behind_bad_token(self):
+        self.prepare_data()
+        errors = []
+        writer = TokenBatchWriter(
+            sessionmaker(db.engine), Token, max_size=10, interval=60,
+            max_retries=2, on_error=lambda values, e: errors.append(values),
+        )
+        token = {'token_type': 'bearer', 'access_token': 'a1', 'expires_in': 3600}
+        issued_at = int(time.time()) - 60
+        writer.add(dict(token, client_id='credential-client', issued_at=issued_at))
+        writer.add(dict(token, client_id='credential-client'))
+        writer.add(dict(token, client_id='credential-client', access_token='a2'))
+
+        # the batch fails, because of the duplicated access token
+        self.assertRaises(Exception, writer.flush)
+        self.assertEqual(writer.queue_depth, 3)
+        self.assertEqual(Token.query.count(), 0)
+
+        # then each token is written on its own
+        writer.flush()
+        self.assertEqual(writer.queue_depth, 0)
+        self.assertEqual(writer.written, 2)
+        self.assertEqual(writer.failed, 1)
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0]['access_token'], 'a1')
+        self.assertEqual(Token.query.filter_by(access_token='a1').first().issued_at, issued_at)
+        self.assertGreater(Token.query.filter_by(access_token='a2').first().issued_at, issued_at)
+        writer.close()
+
+    def test_write_token_behind_full_queue(self):
+        self.prepare_data()
+        writer = TokenBatchWriter(
+            sessionmaker(db.engine), Token, max_size=10, interval=60,
+            max_queue_size=1,
+        )
+        token = {'client_id': 'credential-client', 'token_type': 'bearer', 'expires_in': 3600}
+        writer.add(dict(token, access_token='a1'))
+        writer.add(dict(token, access_token='a2'))
+        self.assertEqual(writer.queue_depth, 1)
+        self.assertIsNone(Token.query.filter_by(access_token='a1').first())
+        self.assertIsNotNone(Token.query.filter_by(access_token='a2').first())
+        writer.close()
+        self.assertEqual(Token.query.count(), 2)
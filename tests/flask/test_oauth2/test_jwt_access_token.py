@@ -421,6 +421,32 @@ class JWTAccessTokenResourceServerTest(TestCase):
         resp = json.loads(rv.data)
         self.assertEqual(resp['username'], 'foo')
 
+    def test_token_cache(self):
+        self.token_validator.enable_token_cache(maxsize=10, ttl=300)
+        cache = self.token_validator.token_cache
+        headers = {'Authorization': f'Bearer {self.access_token}'}
+
+        for _ in range(3):
+            rv = self.client.get('/protected', headers=headers)
+            resp = json.loads(rv.data)
+            self.assertEqual(resp['username'], 'foo')
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(len(cache), 1)
+
+        self.token_validator.discard_cached_token(self.access_token)
+        self.assertEqual(len(cache), 0)
+
+        # invalid and expired tokens are not cached
+        self.claims['exp'] = time.time() - 1
+        access_token = create_access_token(self.claims, self.jwks)
+        headers = {'Authorization': f'Bearer {access_token}'}
+        rv = self.client.get('/protected', headers=headers)
+        resp = json.loads(rv.data)
+        self.assertEqual(resp['error'], 'invalid_token')
+        self.client.get('/protected', headers={'Authorization': 'Bearer invalid'})
+        self.assertEqual(len(cache), 0)
+
     def test_missing_authorization(self):
         rv = self.client.get('/protected')
         self.assertEqual(rv.status_code, 401)
@@ -1,5 +1,10 @@
 import time
 from flask import json
+from authlib.common.cache import LRUCache
+from authlib.integrations.sqla_oauth2 import (
+    create_query_token_func,
+    discard_cached_token,
+)
 from authlib.oauth2.rfc6749.grants import (
     RefreshTokenGrant as _RefreshTokenGrant,
 )
@@ -23,6 +28,11 @@ class RefreshTokenGrant(_RefreshTokenGrant):
         credential.refresh_token_revoked_at = now
         db.session.add(credential)
         db.session.commit()
+        discard_cached_token(token_cache, credential)
+
+
+token_cache = LRUCache(ttl=60)
+query_token = create_query_token_func(db.session, Token, token_cache)
 
 
 class RefreshTokenTest(TestCase):
@@ -213,6 +223,23 @@ class RefreshTokenTest(TestCase):
         resp = json.loads(rv.data)
         self.assertEqual(resp['error'], 'invalid_grant')
 
+    def test_revoke_cached_old_credential(self):
+        token_cache.clear()
+        self.prepare_data()
+        self.create_token()
+        self.assertFalse(query_token('a1', None).is_revoked())
+        self.assertFalse(query_token('r1', 'refresh_token').is_revoked())
+        headers = self.create_basic_header(
+            'refresh-client', 'refresh-secret'
+        )
+        rv = self.client.post('/oauth/token', data={
+            'grant_type': 'refresh_token',
+            'refresh_token': 'r1',
+        }, headers=headers)
+        self.assertEqual(rv.status_code, 200)
+        self.assertTrue(query_token('a1', None).is_revoked())
+        self.assertTrue(query_token('r1', 'refresh_token').is_revoked())
+
     def test_token_generator(self):
         m = 'tests.flask.test_oauth2.oauth2_server:token_generator'
         self.app.config.update({'OAUTH2_ACCESS_TOKEN_GENERATOR': m})
@@ -1,5 +1,9 @@
 from flask import json
-from authlib.integrations.sqla_oauth2 import create_revocation_endpoint
+from authlib.common.cache import LRUCache
+from authlib.integrations.sqla_oauth2 import (
+    create_revocation_endpoint,
+    create_query_token_func,
+)
 from .models import db, User, Client, Token
 from .oauth2_server import TestCase
 from .oauth2_server import create_authorization_server
@@ -9,10 +13,10 @@ RevocationEndpoint = create_revocation_endpoint(db.session, Token)
 
 
 class RevokeTokenTest(TestCase):
-    def prepare_data(self):
+    def prepare_data(self, endpoint_cls=RevocationEndpoint):
         app = self.app
         server = create_authorization_server(app)
-        server.register_endpoint(RevocationEndpoint)
+        server.register_endpoint(endpoint_cls)
 
         @app.route('/oauth/revoke', methods=['POST'])
         def revoke_token():
@@ -146,3 +150,56 @@ class RevokeTokenTest(TestCase):
         self.assertEqual(rv.status_code, 400)
         resp = json.loads(rv.data)
         self.assertEqual(resp['error'], 'invalid_grant')
+
+    def test_revoke_cached_token(self):
+        cache = LRUCache(ttl=60)
+        query_token = create_query_token_func(db.session, Token, cache)
+        self.prepare_data(create_revocation_endpoint(db.session, Token, cache))
+        self.create_token()
+
+        token = query_token('a1', None)
+        self.assertFalse(token.is_revoked())
+        self.assertIn(('token', 'a1'), cache)
+        query_token('r1', 'refresh_token')
+        self.assertIn(('refresh_token', 'r1'), cache)
+
+        # cached tokens are used without querying database
+        db.session.expunge_all()
+        hits = cache.hits
+        token = query_token('a1', None)
+        self.assertEqual(token.access_token, 'a1')
+        self.assertEqual(token.refresh_token, 'r1')
+        self.assertEqual(cache.hits, hits + 1)
+
+        headers = self.create_basic_header(
+            'revoke-client', 'revoke-secret'
+        )
+        rv = self.client.post('/oauth/revoke', data={
+            'token': 'a1',
+        }, headers=headers)
+        self.assertEqual(rv.status_code, 200)
+        self.assertNotIn(('token', 'a1'), cache)
+        self.assertNotIn(('refresh_token', 'r1'), cache)
+        self.assertTrue(query_token('a1', None).is_revoked())
+        self.assertTrue(query_token('r1', 'refresh_token').is_revoked())
+
+    def test_query_token_prefers_access_token(self):
+        self.prepare_data()
+        self.create_token()
+        token = Token(
+            user_id=1,
+            client_id='revoke-client',
+            token_type='bearer',
+            access_token='r1',
+            refresh_token='r2',
+            scope='profile',
+            expires_in=3600,
+        )
+        db.session.add(token)
+        db.session.commit()
+
+        query_token = create_query_token_func(db.session, Token)
+        self.assertEqual(query_token('r1', None).refresh_token, 'r2')
+        self.assertEqual(query_token('a1', None).refresh_token, 'r1')
+        self.assertEqual(query_token('r1', 'refresh_token').access_token, 'a1')
+        self.assertEqual(query_token('r2', None).access_token, 'r1')
@@ -1,3 +1,4 @@
+import os
 import unittest
 from collections import OrderedDict
 
@@ -7,7 +8,7 @@ from authlib.common.encoding import urlsafe_b64encode, json_b64encode, to_bytes,
 from authlib.jose import JsonWebEncryption
 from authlib.jose import OKPKey
 from authlib.jose import ECKey
-from authlib.jose.drafts import register_jwe_draft
+from authlib.jose.drafts import register_jwe_draft, ECDH1PUAlgorithm
 from authlib.jose.errors import InvalidEncryptionAlgorithmForECDH1PUWithKeyWrappingError, \
     InvalidAlgorithmForMultipleRecipientsMode
 from authlib.jose.rfc7516.models import JWEHeader
@@ -630,6 +631,27 @@ class ECDH1PUTest(unittest.TestCase):
         self.assertEqual(payload_at_charlie, payload)
 
 
+    def test_ecdh_1pu_derived_key_cache(self):
+        alg = ECDH1PUAlgorithm(128)
+        alg.enable_derived_key_cache(maxsize=10)
+        enc = JsonWebEncryption.ENC_REGISTRY['A128CBC-HS256']
+        alice_key = OKPKey.generate_key('X25519', is_private=True)
+        bob_key = OKPKey.generate_key('X25519', is_private=True)
+        charlie_key = OKPKey.generate_key('X25519', is_private=True)
+        rv = alg.generate_keys_and_prepare_headers(enc, bob_key, alice_key)
+        headers = {'alg': alg.name, 'enc': enc.name}
+        headers.update(rv['header'])
+
+        # the tag differs in every message, the shared key is reused
+        for key in [bob_key, bob_key, charlie_key]:
+            cek = enc.generate_cek()
+            tag = os.urandom(16)
+            wrapped = alg.agree_upon_key_and_wrap_cek(enc, headers, key, alice_key, rv['epk'], cek, tag)
+            self.assertEqual(alg.unwrap(enc, wrapped['ek'], headers, key, alice_key, tag), cek)
+
+        self.assertEqual(alg.derived_key_cache.hits, 1)
+        self.assertEqual(alg.derived_key_cache.misses, 2)
+
     def test_ecdh_1pu_decryption_with_json_serialization(self):
         jwe = JsonWebEncryption()
 
@@ -1,12 +1,18 @@
+import io
 import json
 import os
+import copy
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives.keywrap import InvalidUnwrap
 from authlib.common.encoding import urlsafe_b64encode, json_b64encode, to_bytes, to_unicode
 from authlib.jose import JsonWebEncryption
 from authlib.jose import OctKey, OKPKey
 from authlib.jose import errors
+from authlib.jose.rfc7516.jwe import STREAM_MAX_SEGMENT_SIZE
 from authlib.jose.drafts import register_jwe_draft
+from authlib.jose.rfc7518 import DeflateZipAlgorithm, ECDHESAlgorithm
 from authlib.jose.errors import InvalidAlgorithmForMultipleRecipientsMode, DecodeError, InvalidHeaderParameterNameError
 from authlib.jose.util import extract_header
 from tests.util import read_file_path
@@ -187,6 +193,41 @@ class JWETest(unittest.TestCase):
         self.assertEqual(payload, b'hello')
         self.assertEqual(header['alg'], 'RSA-OAEP')
 
+    def test_zip_max_size(self):
+        jwe = JsonWebEncryption()
+        key = os.urandom(16)
+        payload = b'a' * (DeflateZipAlgorithm.DEFAULT_MAX_SIZE + 1)
+        protected = {'alg': 'A128KW', 'enc': 'A128GCM', 'zip': 'DEF'}
+        data = jwe.serialize_compact(protected, payload, key)
+        self.assertLess(len(data), 100000)
+        self.assertRaises(DecodeError, jwe.deserialize_compact, data, key)
+        self.assertRaises(
+            DecodeError,
+            jwe.deserialize_compact_stream,
+            data, key, io.BytesIO()
+        )
+
+        jwe = JsonWebEncryption(max_decompressed_size=len(payload))
+        self.assertEqual(jwe.deserialize_compact(data, key)['payload'], payload)
+        sink = io.BytesIO()
+        jwe.deserialize_compact_stream(data, key, sink)
+        self.assertEqual(sink.getvalue(), payload)
+
+        jwe = JsonWebEncryption(max_decompressed_size=10)
+        data = jwe.serialize_compact(protected, b'01234567890', key)
+        self.assertRaises(DecodeError, jwe.deserialize_compact, data, key)
+        self.assertRaises(
+            DecodeError,
+            jwe.deserialize_compact_stream,
+            data, key, io.BytesIO()
+        )
+        self.assertEqual(JsonWebEncryption().deserialize_compact(data, key)['payload'], b'01234567890')
+
+        zip_alg = DeflateZipAlgorithm(level=9, max_size=10)
+        self.assertEqual(zip_alg.decompress(zip_alg.compress(b'0123456789')), b'0123456789')
+        self.assertRaises(DecodeError, zip_alg.decompress, zip_alg.compress(b'01234567890'))
+        self.assertRaises(DecodeError, zip_alg.decompress, zip_alg.compress(b'0123')[:-1])
+
     def test_aes_jwe(self):
         jwe = JsonWebEncryption()
         sizes = [128, 192, 256]
@@ -237,6 +278,122 @@ class JWETest(unittest.TestCase):
             protected, b'hello', b'invalid-key'
         )
 
+    def test_compact_stream(self):
+        jwe = JsonWebEncryption()
+        key = os.urandom(32)
+        payload = os.urandom(100000)
+        _enc_choices = ['A128CBC-HS256', 'A256CBC-HS512', 'A128GCM', 'A256GCM']
+        for enc in _enc_choices:
+            for zip_alg in (None, 'DEF'):
+                protected = {'alg': 'A256KW', 'enc': enc}
+                if zip_alg:
+                    protected['zip'] = zip_alg
+                fp = io.BytesIO()
+                jwe.serialize_compact_stream(
+                    protected, io.BytesIO(payload), key, fp, chunk_size=1000)
+                data = fp.getvalue()
+                rv = jwe.deserialize_compact(data, key)
+                self.assertEqual(rv['payload'], payload)
+
+                sink = io.BytesIO()
+                header = jwe.deserialize_compact_stream(
+                    io.BytesIO(data), key, sink, chunk_size=777)
+                self.assertEqual(header['enc'], enc)
+                self.assertEqual(sink.getvalue(), payload)
+
+        # payload can be an iterable of chunks
+        fp = io.BytesIO()
+        jwe.serialize_compact_stream(
+            {'alg': 'A256KW', 'enc': 'A128GCM'}, [b'hello', b' ', b'world'], key, fp)
+        data = fp.getvalue()
+        self.assertEqual(jwe.deserialize_compact(data, key)['payload'], b'hello world')
+
+        sink = io.BytesIO()
+        jwe.deserialize_compact_stream(data, key, sink)
+        self.assertEqual(sink.getvalue(), b'hello world')
+
+    def test_enc_invalid_tag(self):
+        for name in ('A128CBC-HS256', 'A256GCM', 'C20P'):
+            enc = JsonWebEncryption.ENC_REGISTRY[name]
+            key = enc.generate_cek()
+            iv = enc.generate_iv()
+            ciphertext, tag = enc.encrypt(b'hello world, hello world', b'aad', iv, key)
+            self.assertEqual(enc.decrypt(ciphertext, b'aad', iv, tag, key), b'hello world, hello world')
+            self.assertRaises(InvalidTag, enc.decrypt, ciphertext, b'add', iv, tag, key)
+            # the tag can not borrow bytes from the ciphertext
+            self.assertRaises(InvalidTag, enc.decrypt, ciphertext[:-4], b'aad', iv, ciphertext[-4:] + tag, key)
+            self.assertRaises(InvalidTag, enc.decrypt, ciphertext + tag[:4], b'aad', iv, tag[4:], key)
+
+        # authenticated data with invalid padding
+        enc = JsonWebEncryption.ENC_REGISTRY['A128CBC-HS256']
+        key = enc.generate_cek()
+        iv = enc.generate_iv()
+        ciphertext, _ = enc.encrypt(b'\x00' * 16, b'aad', iv, key)
+        for data in (b'', ciphertext[:16]):
+            tag = enc._hmac(data, b'aad', iv, key[:16])
+            self.assertRaises(ValueError, enc.decrypt, data, b'aad', iv, tag, key)
+
+    def test_compact_stream_invalid(self):
+        jwe = JsonWebEncryption()
+        key = os.urandom(32)
+        for enc in ('A128CBC-HS256', 'A128GCM'):
+            data = jwe.serialize_compact({'alg': 'A256KW', 'enc': enc}, b'hello' * 10, key)
+            # invalid tag
+            segments = data.split(b'.')
+            segments[4] = urlsafe_b64encode(os.urandom(16))
+            sink = io.BytesIO()
+            self.assertRaises(
+                InvalidTag,
+                jwe.deserialize_compact_stream,
+                b'.'.join(segments), key, sink
+            )
+            # nothing is written before the tag is verified
+            self.assertEqual(sink.getvalue(), b'')
+
+            sink = io.BytesIO()
+            self.assertRaises(
+                InvalidTag,
+                jwe.deserialize_compact_stream,
+                b'.'.join(segments), key, sink, write_unverified=True,
+            )
+            self.assertTrue(sink.getvalue())
+            self.assertTrue((b'hello' * 10).startswith(sink.getvalue()))
+
+        self.assertRaises(
+            DecodeError,
+            jwe.deserialize_compact_stream,
+            b'.'.join(data.split(b'.')[:4]), key, io.BytesIO()
+        )
+        self.assertRaises(
+            DecodeError,
+            jwe.deserialize_compact_stream,
+            data + b'.a', key, io.BytesIO()
+        )
+
+        # header, key, IV and tag segments are limited
+        for i in (0, 1, 2, 4):
+            segments = data.split(b'.')
+            segments[i] = b'a' * (STREAM_MAX_SEGMENT_SIZE + 1)
+            self.assertRaises(
+                DecodeError,
+                jwe.deserialize_compact_stream,
+                b'.'.join(segments), key, io.BytesIO()
+            )
+        self.assertRaises(
+            DecodeError,
+            jwe.deserialize_compact_stream,
+            b'a' * (STREAM_MAX_SEGMENT_SIZE * 2), key, io.BytesIO()
+        )
+
+        alice_key = OKPKey.generate_key('X25519', is_private=True)
+        bob_key = OKPKey.generate_key('X25519', is_private=True)
+        self.assertRaises(
+            errors.UnsupportedAlgorithmError,
+            jwe.serialize_compact_stream,
+            {'alg': 'ECDH-1PU+A128KW', 'enc': 'A128CBC-HS256'},
+            b'hello', bob_key, io.BytesIO(), sender_key=alice_key,
+        )
+
     def test_serialize_compact_fails_if_header_contains_unknown_field_while_private_fields_restricted(self):
         jwe = JsonWebEncryption(private_headers=set())
         key = OKPKey.generate_key('X25519', is_private=True)
@@ -602,6 +759,30 @@ class JWETest(unittest.TestCase):
         dk_at_bob = alg.deliver(bob_static_key, alice_ephemeral_pubkey, headers, enc.key_size)
         self.assertEqual(dk_at_bob, dk_at_alice)
 
+    def test_ecdh_es_derived_key_cache(self):
+        alg = ECDHESAlgorithm(128)
+        alg.enable_derived_key_cache(maxsize=10)
+        enc = JsonWebEncryption.ENC_REGISTRY['A128GCM']
+        key = alg.prepare_key({
+            "kty": "EC",
+            "crv": "P-256",
+            "x": "weNJy2HscCSM6AEDTDg04biOvhFhyyWvOHQfeF_PxMQ",
+            "y": "e8lnCO-AlStT-NJVX-crhB7QRYhiix03illJOVAOyck",
+            "d": "VEmDZpDXXK8p8N0Cndsxs924q6nS1RXFASRl6BfUqdw"
+        })
+        preset = alg.generate_preset(enc, key)
+
+        # the sender reuses its ephemeral key
+        for apv in ['Qm9i', 'Qm9i', 'Q2hhcmxpZQ']:
+            headers = {'alg': alg.name, 'enc': enc.name, 'apv': apv}
+            headers.update(preset['header'])
+            cek = enc.generate_cek()
+            rv = alg.wrap(enc, headers, key, {'epk': preset['epk'], 'cek': cek})
+            self.assertEqual(alg.unwrap(enc, rv['ek'], copy.deepcopy(headers), key), cek)
+
+        self.assertEqual(alg.derived_key_cache.hits, 1)
+        self.assertEqual(alg.derived_key_cache.misses, 2)
+
     def test_ecdh_es_jwe_in_direct_key_agreement_mode(self):
         jwe = JsonWebEncryption()
         key = {
@@ -1294,6 +1475,32 @@ class JWETest(unittest.TestCase):
 
         self.assertEqual(rv['payload'], b'Three is a magic number.')
 
+    def test_json_serialization_with_executor(self):
+        jwe = JsonWebEncryption()
+        keys = [OctKey.generate_key(128, is_private=True) for _ in range(5)]
+        header_obj = {
+            'protected': {'alg': 'A128KW', 'enc': 'A128GCM'},
+            'unprotected': {'cty': 'text/plain'},
+            'recipients': [{'header': {'kid': f'key-{i}'}} for i in range(5)],
+            'aad': b'Authenticate me too.',
+        }
+        origin = copy.deepcopy(header_obj)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            data = jwe.serialize_json(header_obj, b'hello', keys, executor=executor)
+
+        # the given header and keys are not changed
+        self.assertEqual(header_obj, origin)
+        self.assertTrue(all(isinstance(k, OctKey) for k in keys))
+        self.assertEqual(len(data['recipients']), 5)
+
+        origin = copy.deepcopy(data)
+        for i, key in enumerate(keys):
+            rv = jwe.deserialize_json(data, (f'key-{i}', key))
+            self.assertEqual(rv['payload'], b'hello')
+            self.assertEqual(rv['header']['recipients'][i], {'header': {'kid': f'key-{i}'}})
+            self.assertEqual(rv['header']['unprotected'], {'cty': 'text/plain'})
+        self.assertEqual(data, origin)
+
     def test_decryption_of_json_string(self):
         jwe = JsonWebEncryption()
 
@@ -261,3 +261,80 @@ class JWKTest(BaseTest):
         obj = key_set.as_dict()['keys'][0]
         self.assertIn('kid', obj)
         self.assertEqual(key_set.as_json()[0], '{')
+
+    def test_cached_tokens(self):
+        key = RSAKey.import_key(read_file_path('jwk_public.json'))
+        tokens = key.tokens
+        self.assertIs(key.tokens, tokens)
+        self.assertEqual(key.kid, 'bilbo.baggins@hobbiton.example')
+        with self.assertRaises(TypeError):
+            tokens['use'] = 'sig'
+
+        # as_dict must not leak into the cached tokens
+        obj = key.as_dict(foo='bar')
+        self.assertEqual(obj['foo'], 'bar')
+        self.assertNotIn('foo', key.tokens)
+
+    def test_tokens_invalidated_by_options(self):
+        key = OctKey.generate_key()
+        tokens = key.tokens
+        self.assertNotIn('use', tokens)
+
+        key.options['use'] = 'sig'
+        self.assertIsNot(key.tokens, tokens)
+        self.assertEqual(key['use'], 'sig')
+
+        OctKey.import_key(key, {'kid': 'abc'})
+        self.assertEqual(key.kid, 'abc')
+
+    def test_key_set_index(self):
+        key1 = OctKey.generate_key(options={'kid': 'a', 'alg': 'HS256'})
+        key2 = OctKey.generate_key(options={'kid': 'a', 'alg': 'HS384', 'use': 'sig'})
+        key3 = RSAKey.generate_key(options={'kid': 'b', 'key_ops': ['verify']})
+        key_set = KeySet([key1, key2, key3])
+
+        self.assertIs(key_set.find_by_kid('a'), key1)
+        self.assertIs(key_set.find(kid='a', alg='HS384'), key2)
+        self.assertIs(key_set.find(alg='HS384', use='sig'), key2)
+        self.assertIs(key_set.find(kid='b', key_ops='verify'), key3)
+        self.assertRaises(ValueError, key_set.find, kid='b', key_ops='sign')
+        self.assertRaises(ValueError, key_set.find, kid='a', use='enc', alg='HS384')
+        self.assertIs(key_set.find_by_thumbprint(key3.thumbprint()), key3)
+        self.assertRaises(ValueError, key_set.find_by_thumbprint, 'invalid')
+
+        key4 = OctKey.generate_key(options={'kid': 'c'})
+        key_set.add_key(key4)
+        self.assertIs(key_set.find_by_kid('c'), key4)
+        self.assertIs(key_set.find_by_thumbprint(key4.thumbprint()), key4)
+
+        key_set.remove_key(key1)
+        self.assertIs(key_set.find_by_kid('a'), key2)
+        self.assertIs(key_set.find(kid='a'), key2)
+
+        # modified in place
+        key_set.keys.remove(key4)
+        self.assertRaises(ValueError, key_set.find_by_kid, 'c')
+
+        # replaced in place with the same length
+        key5 = OctKey.generate_key(options={'kid': 'e'})
+        key_set.keys[-1] = key5
+        self.assertIs(key_set.find_by_kid('e'), key5)
+        self.assertIs(key_set.find(kid='e'), key5)
+        self.assertIs(key_set.find_by_thumbprint(key5.thumbprint()), key5)
+        self.assertRaises(ValueError, key_set.find_by_kid, 'b')
+
+        # unhashable kid in a crafted header
+        self.assertRaises(ValueError, key_set.find_by_kid, ['a'])
+        self.assertRaises(ValueError, key_set.find, kid={'a': 1})
+
+        # kid changed through key options
+        key5.options['kid'] = 'f'
+        self.assertIs(key_set.find_by_kid('f'), key5)
+        self.assertIs(key_set.find(kid='f'), key5)
+        self.assertRaises(ValueError, key_set.find_by_kid, 'e')
+
+        # key without kid is found among other keys
+        key6 = OctKey.generate_key()
+        key_set.keys.append(key6)
+        self.assertIs(key_set.find_by_kid(None), key6)
+        self.assertIs(key_set.find(), key_set.keys[0])
@@ -1,6 +1,7 @@
 import unittest
 import json
 from authlib.jose import JsonWebSignature
+from authlib.common.encoding import json_b64encode
 from authlib.jose import errors
 from tests.util import read_file_path
 
@@ -212,3 +213,81 @@ class JWSTest(unittest.TestCase):
         header, payload = data['header'], data['payload']
         self.assertEqual(payload, b'hello')
         self.assertEqual(header['alg'], 'ES256K')
+
+    def test_prepared_key_cache(self):
+        jws = JsonWebSignature()
+        self.assertIsNone(jws.prepared_key_cache)
+        private_key = read_file_path('rsa_private.pem')
+        public_key = read_file_path('rsa_public.pem')
+        data = jws.deserialize(jws.serialize({'alg': 'RS256'}, 'hello', private_key), public_key)
+        self.assertEqual(data['payload'], b'hello')
+
+        jws.enable_prepared_key_cache()
+        cache = jws.prepared_key_cache
+        s = jws.serialize({'alg': 'RS256'}, 'hello', private_key)
+        jws.deserialize(s, public_key)
+        self.assertEqual(len(cache), 2)
+        hits = cache.hits
+        jws.deserialize(s, public_key)
+        self.assertEqual(cache.hits, hits + 1)
+        self.assertEqual(len(cache), 2)
+
+        # raw key material is not kept as cache key
+        self.assertNotIn(('RS256', public_key), cache)
+
+        # keys are cached per algorithm
+        s = jws.serialize({'alg': 'HS256'}, 'hello', 'secret')
+        self.assertRaises(errors.BadSignatureError, jws.deserialize, s, 'invalid')
+        self.assertNotIn(('HS256', 'invalid'), cache)
+        self.assertEqual(len(cache), 4)
+        self.assertRaises(errors.BadSignatureError, jws.deserialize, s, b'invalid')
+        self.assertEqual(len(cache), 5)
+
+        # the cache is kept per instance
+        self.assertIsNone(JsonWebSignature().prepared_key_cache)
+
+    def test_verify_batch(self):
+        from concurrent.futures import ThreadPoolExecutor
+        from authlib.jose import JsonWebKey, KeyResolver
+
+        jws = JsonWebSignature()
+        private_key = read_file_path('jwks_private.json')
+        public_key = JsonWebKey.import_key_set(read_file_path('jwks_public.json'))
+        tokens = [
+            jws.serialize_compact({'alg': 'RS256', 'kid': 'abc'}, 'a', private_key['keys'][0]),
+            'invalid',
+            jws.serialize_compact({'alg': 'RS256', 'kid': 'abc'}, 'b', private_key['keys'][0]),
+            jws.serialize_compact({'alg': 'RS256', 'kid': 'xyz'}, 'c', read_file_path('rsa_private.pem')),
+        ]
+        tokens.append(tokens[0][:-4] + b'AAAA')
+        calls = []
+
+        def load_key(header, payload):
+            calls.append(header['kid'])
+            return public_key.find_by_kid(header['kid'])
+
+        pool = ThreadPoolExecutor(2)
+        self.addCleanup(pool.shutdown)
+        for executor in [None, pool]:
+            results = jws.verify_batch(tokens, KeyResolver(public_key), executor=executor)
+            self.assertEqual(len(results), 5)
+            self.assertEqual(results[0][0]['payload'], b'a')
+            self.assertIsNone(results[0][1])
+            self.assertIsInstance(results[1][1], errors.DecodeError)
+            self.assertEqual(results[2][0]['payload'], b'b')
+            self.assertIsInstance(results[3][1], ValueError)
+            self.assertIsNone(results[4][0])
+            self.assertIsInstance(results[4][1], errors.BadSignatureError)
+
+        results = jws.verify_batch([tokens[0], tokens[2]], load_key)
+        self.assertEqual(calls, ['abc', 'abc'])
+        self.assertEqual([r[0]['payload'] for r in results], [b'a', b'b'])
+
+        # a malformed header does not abort the batch
+        bad_kid = json_b64encode({'alg': 'RS256', 'kid': ['abc']}) + b'.YQ.' + tokens[0].split(b'.')[2]
+        bad_alg = json_b64encode({'alg': ['RS256'], 'kid': 'abc'}) + b'.YQ.' + tokens[0].split(b'.')[2]
+        for k in [KeyResolver(public_key), load_key]:
+            results = jws.verify_batch([bad_kid, tokens[0], bad_alg], k)
+            self.assertIsInstance(results[0][1], errors.DecodeError)
+            self.assertEqual(results[1][0]['payload'], b'a')
+            self.assertIsInstance(results[2][1], errors.DecodeError)
@@ -1,7 +1,10 @@
 import datetime
 import unittest
 
-from authlib.jose import JsonWebKey, JsonWebToken, JWTClaims, errors, jwt
+from authlib.common.encoding import json_b64encode
+from authlib.jose import (
+    ClaimsOptions, JsonWebKey, JsonWebToken, JWTClaims, KeyResolver, KeySet, errors, jwt,
+)
 from authlib.jose.errors import UnsupportedAlgorithmError
 from tests.util import read_file_path
 
@@ -113,6 +116,78 @@ class JWTTest(unittest.TestCase):
         claims.options = {'aud': {'values': []}}
         claims.validate()
 
+    def test_claims_options(self):
+        claims_options = ClaimsOptions({
+            'iss': {'essential': True, 'values': ['foo', 'bar']},
+            'aud': {'value': 'foo'},
+            'groups': {'values': [['a'], ['b']]},
+            'jti': {'validate': lambda claims, value: value == 'a'},
+        })
+        self.assertEqual(claims_options.essential_claims, ('iss',))
+        self.assertRaises(TypeError, claims_options.update, {})
+
+        payload = {'iss': 'foo', 'aud': ['foo'], 'groups': ['a'], 'jti': 'a'}
+        claims = JWTClaims(payload, {'alg': 'HS256'}, options=claims_options)
+        claims.validate()
+
+        for name, value in [('iss', 'baz'), ('aud', 'baz'), ('groups', ['c']), ('jti', 'b')]:
+            claims = JWTClaims(dict(payload, **{name: value}), {}, options=claims_options)
+            self.assertRaises(errors.InvalidClaimError, claims.validate)
+
+        claims = JWTClaims({'aud': 'foo'}, {}, options=claims_options)
+        self.assertRaises(errors.MissingClaimError, claims.validate)
+
+    def test_claims_options_str_values(self):
+        # a str of values is matched by substring, as it always was
+        options = {'iss': {'values': 'https://a.example.com'}}
+        for claims_options in (options, ClaimsOptions(options)):
+            claims = JWTClaims({'iss': 'a.example'}, {}, options=claims_options)
+            claims.validate()
+            claims = JWTClaims({'iss': 'b.example'}, {}, options=claims_options)
+            self.assertRaises(errors.InvalidClaimError, claims.validate)
+
+    def test_decoder(self):
+        decoder = jwt.create_decoder('k', claims_options={'iss': {'essential': True, 'value': 'foo'}})
+        self.assertIsInstance(decoder.claims_options, ClaimsOptions)
+
+        claims = decoder.decode(jwt.encode({'alg': 'HS256'}, {'iss': 'foo'}, 'k'))
+        claims.validate()
+        claims = decoder.decode(jwt.encode({'alg': 'HS256'}, {'iss': 'bar'}, 'k'))
+        self.assertRaises(errors.InvalidClaimError, claims.validate)
+        self.assertRaises(
+            errors.BadSignatureError,
+            decoder.decode, jwt.encode({'alg': 'HS256'}, {'iss': 'foo'}, 'invalid')
+        )
+
+        header = {'alg': 'RS256', 'kid': 'abc'}
+        data = jwt.encode(header, {'name': 'hi'}, read_file_path('jwks_private.json'))
+        decoder = jwt.create_decoder(read_file_path('jwks_public.json'))
+        self.assertIsInstance(decoder.load_key, KeyResolver)
+        self.assertEqual(decoder.decode(data)['name'], 'hi')
+
+    def test_decode_many(self):
+        header = {'alg': 'RS256', 'kid': 'abc'}
+        private_key = read_file_path('jwks_private.json')
+        pub_key = read_file_path('jwks_public.json')
+        tokens = [
+            jwt.encode(header, {'iss': 'foo'}, private_key),
+            jwt.encode(header, {'iss': 'bar'}, private_key),
+            'a.b',
+            jwt.encode({'alg': 'RS256', 'kid': 'xyz'}, {'iss': 'foo'}, read_file_path('rsa_private.pem')),
+        ]
+        # kid is a list in a crafted header
+        tokens.append(json_b64encode({'alg': 'RS256', 'kid': ['abc']}) + b'.' + tokens[0].split(b'.', 1)[1])
+        results = jwt.decode_many(tokens, pub_key, claims_options={'iss': {'value': 'foo'}})
+        self.assertEqual(len(results), 5)
+        claims, error = results[0]
+        self.assertIsNone(error)
+        claims.validate()
+        claims, error = results[1]
+        self.assertRaises(errors.InvalidClaimError, claims.validate)
+        self.assertIsInstance(results[2][1], errors.DecodeError)
+        self.assertIsInstance(results[3][1], ValueError)
+        self.assertIsInstance(results[4][1], errors.DecodeError)
+
     def test_validate_exp(self):
         id_token = jwt.encode({'alg': 'HS256'}, {'exp': 'invalid'}, 'k')
         claims = jwt.decode(id_token, 'k')
@@ -275,6 +350,40 @@ class JWTTest(unittest.TestCase):
         claims = jwt.decode(data, JsonWebKey.import_key_set(pub_key))
         self.assertEqual(claims['name'], 'hi')
 
+    def test_use_jwks_without_kid_keyset(self):
+        header = {'alg': 'HS256'}
+        payload = {'name': 'hi'}
+        key = JsonWebKey.import_key('secret', {'kty': 'oct'})
+        key_set = KeySet([
+            JsonWebKey.generate_key('oct', 256, {'kid': 'abc'}, True),
+            key,
+        ])
+        data = jwt.encode(header, payload, key)
+        claims = jwt.decode(data, key_set)
+        self.assertEqual(claims['name'], 'hi')
+
+    def test_use_key_resolver(self):
+        header = {'alg': 'RS256', 'kid': 'abc'}
+        payload = {'name': 'hi'}
+        private_key = read_file_path('jwks_private.json')
+        pub_key = read_file_path('jwks_public.json')
+        resolver = KeyResolver(pub_key)
+        key = resolver.resolve(header)
+        self.assertEqual(key.kid, 'abc')
+
+        data = jwt.encode(header, payload, private_key)
+        claims = jwt.decode(data, resolver)
+        self.assertEqual(claims['name'], 'hi')
+        self.assertIs(resolver.resolve(header), key)
+
+        data = jwt.encode({'alg': 'RS256', 'kid': 'xyz'}, payload, read_file_path('rsa_private.pem'))
+        self.assertRaises(ValueError, jwt.decode, data, resolver)
+
+        # not a JWK set
+        resolver = KeyResolver(read_file_path('rsa_public.pem'))
+        claims = jwt.decode(data, resolver)
+        self.assertEqual(claims['name'], 'hi')
+
     def test_with_ec(self):
         payload = {'name': 'hi'}
         private_key = read_file_path('secp521r1-private.json')